@@ -154,6 +154,16 @@ def main():
             st.markdown(create_algo_button("⚡", "SRT", "Shortest Remaining Time"), unsafe_allow_html=True)
             if st.button("Ir a SRT", key="srt", use_container_width=True):
                 st.switch_page("pages/6_⚡_SRT.py")
+
+            # Prioridad Preemptiva
+            st.markdown(create_algo_button("🎚️", "Prioridad Preemptiva", "Prioridad con Envejecimiento"), unsafe_allow_html=True)
+            if st.button("Ir a Prioridad Preemptiva", key="prp", use_container_width=True):
+                st.switch_page("pages/8_🎚️_Prioridad_Preemptiva.py")
+
+            # Multinúcleo
+            st.markdown(create_algo_button("🖥️", "Multinúcleo", "Cualquier política en k CPUs"), unsafe_allow_html=True)
+            if st.button("Ir a Multinúcleo", key="smp", use_container_width=True):
+                st.switch_page("pages/10_🖥️_Multinucleo.py")
         
         with col_b:
             # Round Robin
@@ -165,6 +175,16 @@ def main():
             st.markdown(create_algo_button("🎯", "Prioridad", "Planificación por Niveles"), unsafe_allow_html=True)
             if st.button("Ir a Prioridad", key="pri", use_container_width=True):
                 st.switch_page("pages/5_🎯_Prioridad.py")
+
+            # MLFQ
+            st.markdown(create_algo_button("🪜", "MLFQ", "Colas Multinivel con Retroalimentación"), unsafe_allow_html=True)
+            if st.button("Ir a MLFQ", key="mlfq", use_container_width=True):
+                st.switch_page("pages/9_🪜_MLFQ.py")
+
+            # Comparativa
+            st.markdown(create_algo_button("📈", "Comparativa", "Todos los algoritmos a la vez"), unsafe_allow_html=True)
+            if st.button("Ir a Comparativa", key="cmp", use_container_width=True):
+                st.switch_page("pages/7_📈_Comparativa.py")
     
     with col2:
         st.markdown("### 📋 Características del Simulador")
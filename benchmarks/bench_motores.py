@@ -0,0 +1,168 @@
+"""
+Benchmark de escalamiento de los motores calcular_*
+
+Ejecuta cada algoritmo sobre cargas sintéticas con semilla fija, desde 10
+hasta 10^6 procesos, con distintos patrones de llegada y dispersiones de
+duración. Registra tiempo de pared, memoria pico y costo por proceso, y
+compara contra una línea base JSON con umbrales de regresión configurables.
+
+Uso:
+    python benchmarks/bench_motores.py                      # compara con linea_base.json
+    python benchmarks/bench_motores.py --max-procesos 10000 --algoritmos rr,srt
+    python benchmarks/bench_motores.py --guardar-base benchmarks/linea_base.json
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.algoritmos import ALGORITMOS
+from utils.tabla import TablaProcesos
+
+LINEA_BASE = os.path.join(os.path.dirname(__file__), 'linea_base.json')
+TAMANOS = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+PATRONES_LLEGADA = ('simultanea', 'poisson', 'rafagas')
+DISPERSIONES = ('estrecha', 'amplia')
+PARAMETROS = {'rr': {'quantum': 4, 'cambio_contexto': 0}, 'prioridad_preemptiva': {'envejecimiento': 10}}
+
+
+def generar_carga(n, patron, dispersion, semilla=0):
+    """Carga sintética reproducible como TablaProcesos"""
+    rng = np.random.default_rng(semilla)
+
+    if dispersion == 'estrecha':
+        duracion = rng.integers(1, 11, n)
+    else:
+        duracion = np.clip(np.rint(rng.lognormal(np.log(5), 1.2, n)), 1, 1000).astype(np.int64)
+
+    # Carga cercana al 90% de utilización para que la cola no se vacíe ni explote
+    media_entre_llegadas = duracion.mean() / 0.9
+    if patron == 'simultanea':
+        llegada = np.zeros(n, dtype=np.int64)
+    elif patron == 'poisson':
+        llegada = np.cumsum(rng.exponential(media_entre_llegadas, n)).astype(np.int64)
+    else:
+        # Ráfagas de ~50 procesos que llegan juntos, separadas por silencios
+        rafaga = np.arange(n) // 50
+        inicio_rafaga = np.cumsum(rng.exponential(50 * media_entre_llegadas, rafaga[-1] + 1)).astype(np.int64)
+        llegada = inicio_rafaga[rafaga]
+
+    prioridad = rng.integers(0, 11, n)
+    return TablaProcesos(np.arange(n), llegada, duracion, prioridad)
+
+
+def medir(algoritmo, n, patron, dispersion, repeticiones=1, memoria=True):
+    """Mide un caso; devuelve tiempo (mínimo de las repeticiones), memoria pico y costo por proceso"""
+    motor = ALGORITMOS[algoritmo]
+    parametros = PARAMETROS.get(algoritmo, {})
+
+    tiempos = []
+    for _ in range(repeticiones):
+        tabla = generar_carga(n, patron, dispersion)
+        gc.collect()
+        inicio = time.perf_counter()
+        motor(tabla, **parametros)
+        tiempos.append(time.perf_counter() - inicio)
+    tiempo = min(tiempos)
+
+    memoria_pico = None
+    if memoria:
+        tabla = generar_carga(n, patron, dispersion)
+        gc.collect()
+        tracemalloc.start()
+        motor(tabla, **parametros)
+        memoria_pico = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+
+    return {
+        'tiempo_s': tiempo,
+        'memoria_pico_mb': memoria_pico,
+        'us_por_proceso': tiempo / n * 1e6,
+    }
+
+
+def comparar(resultados, base, umbral_tiempo, umbral_memoria, tiempo_minimo=0.0):
+    """
+    Lista de regresiones (caso, métrica, base, actual) que superan los umbrales
+
+    Los casos cuyo tiempo base es menor que tiempo_minimo no se comparan en
+    tiempo: a esa escala domina el ruido de medición. Los casos sin línea
+    base no se comparan; casos_sin_base los enumera.
+    """
+    regresiones = []
+    for caso, actual in resultados.items():
+        anterior = base.get(caso)
+        if anterior is None:
+            continue
+        if anterior['tiempo_s'] >= tiempo_minimo and actual['tiempo_s'] > anterior['tiempo_s'] * (1 + umbral_tiempo):
+            regresiones.append((caso, 'tiempo_s', anterior['tiempo_s'], actual['tiempo_s']))
+        if (actual['memoria_pico_mb'] is not None and anterior.get('memoria_pico_mb') is not None
+                and actual['memoria_pico_mb'] > anterior['memoria_pico_mb'] * (1 + umbral_memoria)):
+            regresiones.append((caso, 'memoria_pico_mb', anterior['memoria_pico_mb'], actual['memoria_pico_mb']))
+    return regresiones
+
+
+def casos_sin_base(resultados, base):
+    """Casos medidos que no tienen línea base contra la que compararse"""
+    return [caso for caso in resultados if caso not in base]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de escalamiento de los motores de planificación")
+    parser.add_argument('--algoritmos', default=','.join(ALGORITMOS))
+    parser.add_argument('--patrones', default=','.join(PATRONES_LLEGADA))
+    parser.add_argument('--dispersiones', default=','.join(DISPERSIONES))
+    parser.add_argument('--max-procesos', type=int, default=TAMANOS[-1])
+    parser.add_argument('--repeticiones', type=int, default=3, help="Se reporta el mínimo de las repeticiones")
+    parser.add_argument('--sin-memoria', action='store_true', help="No medir memoria pico (tracemalloc)")
+    parser.add_argument('--base', default=LINEA_BASE, help="Línea base JSON contra la que comparar")
+    parser.add_argument('--guardar-base', default=None, help="Escribir los resultados como nueva línea base")
+    parser.add_argument('--umbral-tiempo', type=float, default=0.25, help="Regresión si el tiempo crece más de esta fracción")
+    parser.add_argument('--umbral-memoria', type=float, default=0.10, help="Regresión si la memoria crece más de esta fracción")
+    parser.add_argument('--tiempo-minimo', type=float, default=0.005, help="Casos base más rápidos que esto (s) no se comparan en tiempo")
+    args = parser.parse_args(argv)
+
+    tamanos = [n for n in TAMANOS if n <= args.max_procesos]
+    resultados = {}
+    for algoritmo in args.algoritmos.split(','):
+        for patron in args.patrones.split(','):
+            for dispersion in args.dispersiones.split(','):
+                for n in tamanos:
+                    caso = f"{algoritmo}/{patron}/{dispersion}/{n}"
+                    repeticiones = args.repeticiones if n <= 100_000 else 1
+                    resultados[caso] = medir(algoritmo, n, patron, dispersion, repeticiones, not args.sin_memoria)
+                    r = resultados[caso]
+                    memoria = f"{r['memoria_pico_mb']:9.2f} MB" if r['memoria_pico_mb'] is not None else "        -"
+                    print(f"{caso:36s} {r['tiempo_s']:9.4f} s {memoria} {r['us_por_proceso']:9.2f} us/proc", flush=True)
+
+    if args.guardar_base:
+        with open(args.guardar_base, 'w') as archivo:
+            json.dump(resultados, archivo, indent=1, sort_keys=True)
+        print(f"Línea base guardada en {args.guardar_base}")
+        return 0
+
+    if not os.path.exists(args.base):
+        print(f"Sin línea base en {args.base}; usa --guardar-base para crearla")
+        return 0
+
+    with open(args.base) as archivo:
+        base = json.load(archivo)
+    regresiones = comparar(resultados, base, args.umbral_tiempo, args.umbral_memoria, args.tiempo_minimo)
+    sin_base = casos_sin_base(resultados, base)
+    for caso in sin_base:
+        print(f"SIN LÍNEA BASE {caso}: no se compara; regenera la base con --guardar-base")
+    for caso, metrica, anterior, actual in regresiones:
+        print(f"REGRESIÓN {caso} {metrica}: {anterior:.4f} -> {actual:.4f} ({actual / anterior - 1:+.0%})")
+    print(f"{len(regresiones)} regresiones en {len(resultados) - len(sin_base)} casos comparados ({len(sin_base)} sin línea base)")
+    return 1 if regresiones else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
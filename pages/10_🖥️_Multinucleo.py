@@ -0,0 +1,406 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.algoritmos import NOMBRES
+from utils.cache import ejecutar_simulacion
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.mlfq import DEGRADACIONES
+from utils.smp import COLAS, POLITICAS, resumir_nucleos
+from utils.visualizacion import GraficoGantt, tema_gantt, mostrar_metricas
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.helpers import calcular_tiempo_total
+from utils.generador import generar_lista, PATRONES_LLEGADA, DISTRIBUCIONES_DURACION
+
+st.set_page_config(
+    page_title="Multinúcleo - Simulador Planificación",
+    page_icon="🖥️",
+    layout="wide"
+)
+
+NOMBRES_COLA = {
+    'global': "Cola global",
+    'por_nucleo': "Cola por núcleo + robo de trabajo",
+}
+
+if 'procesos_smp' not in st.session_state:
+    st.session_state.procesos_smp = []
+if 'procesos_calculados_smp' not in st.session_state:
+    st.session_state.procesos_calculados_smp = []
+if 'configuracion_smp' not in st.session_state:
+    st.session_state.configuracion_smp = {}
+if 'tiempo_actual_smp' not in st.session_state:
+    st.session_state.tiempo_actual_smp = 0
+if 'simulacion_iniciada_smp' not in st.session_state:
+    st.session_state.simulacion_iniciada_smp = False
+if 'gantt_smp' not in st.session_state:
+    st.session_state.gantt_smp = None
+if 'linea_smp' not in st.session_state:
+    st.session_state.linea_smp = None
+if 'rendimiento_smp' not in st.session_state:
+    st.session_state.rendimiento_smp = None
+
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_smp = min(max(st.session_state.tiempo_actual_smp + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion(configuracion, titulo):
+    tiempo_actual = st.session_state.tiempo_actual_smp
+    tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_smp)
+
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_smp",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_smp is None or st.session_state.linea_smp[0] != tema:
+            st.session_state.linea_smp = (tema, *html_linea_tiempo([datos_linea_tiempo(
+                st.session_state.procesos_calculados_smp,
+                titulo,
+                nucleos=configuracion['nucleos']
+            )], tema=tema))
+        _, html, alto = st.session_state.linea_smp
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.button("⏮️ Reiniciar", key="reiniciar_smp", use_container_width=True, on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        with col2:
+            st.button("◀️ Retroceder", key="retroceder_smp", use_container_width=True, on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        with col3:
+            st.button("Avanzar ▶️", key="avanzar_smp", use_container_width=True, on_click=mover_tiempo, args=(1, tiempo_total))
+
+        with col4:
+            st.button("▶️▶️ Ver Todo", key="vertodo_smp", use_container_width=True, on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_smp / tiempo_total)
+        else:
+            st.progress(0)
+
+        if st.session_state.gantt_smp is None:
+            st.session_state.gantt_smp = GraficoGantt(
+                st.session_state.procesos_calculados_smp,
+                titulo,
+                nucleos=configuracion['nucleos']
+            )
+        st.image(fotograma(st.session_state.gantt_smp, st.session_state.tiempo_actual_smp, tema=tema_gantt(st.context)), use_container_width=True)
+
+    if en_navegador or st.session_state.tiempo_actual_smp == tiempo_total:
+        st.markdown("---")
+        st.subheader("📈 Métricas Finales")
+
+        metricas = mostrar_metricas(st.session_state.procesos_calculados_smp)
+        filas_nucleos = resumir_nucleos(st.session_state.procesos_calculados_smp, configuracion['nucleos'])
+        migraciones = sum(f['migraciones'] for f in filas_nucleos)
+        utilizacion = sum(f['utilizacion'] for f in filas_nucleos) / len(filas_nucleos)
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
+        with col2:
+            st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
+        with col3:
+            st.metric("🔀 Migraciones", migraciones)
+        with col4:
+            st.metric("🖥️ Utilización Media", f"{utilizacion:.1f}%")
+
+        st.subheader("🖥️ Uso por Núcleo")
+
+        df_nucleos = pd.DataFrame(filas_nucleos).rename(columns={
+            'nucleo': 'Núcleo',
+            'ticks_ocupado': 'Ticks ocupado',
+            'utilizacion': 'Utilización (%)',
+            'tramos': 'Tramos',
+            'procesos': 'Procesos distintos',
+            'migraciones': 'Migraciones recibidas'
+        })
+        st.dataframe(df_nucleos.round(2), use_container_width=True, hide_index=True)
+
+        with st.expander("🔍 Ver recorrido de cada proceso por los núcleos"):
+            for proceso in st.session_state.procesos_calculados_smp:
+                recorrido = " → ".join(
+                    f"CPU{nucleo}:{dur}t@T{ini}"
+                    for (ini, dur), nucleo in zip(proceso['ejecuciones'], proceso['nucleos'])
+                )
+                st.write(f"**P{proceso['pid']}:** {recorrido}")
+
+def main():
+    st.title("🖥️ Planificación Multinúcleo (SMP)")
+
+    st.markdown("""
+    En un sistema **multiprocesador simétrico (SMP)** varios núcleos ejecutan procesos a la vez.
+    Aquí cualquier política del simulador corre sobre **k CPUs**: elige si los núcleos comparten
+    **una cola global** o si cada uno tiene **su propia cola** y roba trabajo cuando se queda sin
+    procesos. Se cuentan las **migraciones** (un proceso que continúa en otro núcleo) y la
+    **utilización** de cada núcleo.
+    """)
+
+    with st.sidebar:
+        st.header("ℹ️ Acerca del modo SMP")
+        st.info("""
+        **Características:**
+        - ✅ Todas las políticas del simulador
+        - ✅ Cola global o por núcleo
+        - ✅ Robo de trabajo entre núcleos
+        - ✅ Carriles por núcleo en el Gantt
+        - ❌ Sin envejecimiento ni refuerzo de MLFQ
+        """)
+
+        st.header("📊 Métricas Clave")
+        st.metric("Simulación", "Por eventos")
+        st.metric("Costo", "O((n + tramos) log k)")
+        st.metric("Núcleos", "Miles")
+
+        if st.button("🏠 Volver al Inicio"):
+            st.switch_page("app.py")
+
+    st.header("⚙️ Configuración del Sistema")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        politica = st.selectbox(
+            "Política de planificación",
+            POLITICAS,
+            format_func=lambda p: NOMBRES[p],
+            key="smp_politica"
+        )
+
+    with col2:
+        nucleos = st.number_input(
+            "Número de núcleos",
+            min_value=1,
+            max_value=16,
+            value=2,
+            key="smp_nucleos"
+        )
+
+    with col3:
+        cola = st.selectbox(
+            "Cola de listos",
+            COLAS,
+            format_func=lambda c: NOMBRES_COLA[c],
+            help="Global: un solo orden para todos los núcleos. Por núcleo: cada núcleo atiende "
+                 "su cola y, si se vacía, roba el mejor proceso de la cola más larga",
+            key="smp_cola"
+        )
+
+    parametros = {}
+    if politica == 'rr':
+        col1, col2 = st.columns(2)
+        with col1:
+            parametros['quantum'] = st.number_input("Quantum", min_value=1, max_value=20, value=2, key="smp_quantum")
+        with col2:
+            parametros['cambio_contexto'] = st.number_input(
+                "Cambio de contexto (ticks)", min_value=0, max_value=5, value=0, key="smp_cambio_contexto"
+            )
+    elif politica == 'mlfq':
+        col1, col2 = st.columns(2)
+        with col1:
+            num_niveles = st.number_input("Número de niveles", min_value=1, max_value=5, value=3, key="smp_niveles")
+        with col2:
+            parametros['degradacion'] = st.selectbox("Regla de degradación", DEGRADACIONES, key="smp_degradacion")
+        columnas_quantum = st.columns(num_niveles)
+        quantums = []
+        for nivel, columna in enumerate(columnas_quantum):
+            with columna:
+                quantums.append(st.number_input(
+                    f"Quantum nivel {nivel}",
+                    min_value=1,
+                    max_value=50,
+                    value=2 ** (nivel + 1),
+                    key=f"smp_quantum_{nivel}"
+                ))
+        parametros['quantums'] = tuple(quantums)
+
+    st.header("📥 Configuración de Procesos")
+
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        num_procesos = st.number_input(
+            "Número de procesos",
+            min_value=1,
+            max_value=12,
+            value=6,
+            key="smp_procesos"
+        )
+
+    with col2:
+        st.write("")
+        st.write("")
+        if st.button("🔄 Reiniciar Procesos", use_container_width=True):
+            st.session_state.procesos_smp = []
+            st.session_state.simulacion_iniciada_smp = False
+            st.rerun()
+
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            llegadas = st.selectbox("Llegadas", PATRONES_LLEGADA, key="gen_llegadas_smp")
+        with col2:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_smp")
+        with col3:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_smp")
+        if st.button("🎲 Generar Procesos", key="generar_smp", use_container_width=True):
+            st.session_state.procesos_smp = generar_lista(num_procesos, llegadas=llegadas, duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20, tamano_rafaga=3)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"llegada_smp_{i}", None)
+                st.session_state.pop(f"duracion_smp_{i}", None)
+                st.session_state.pop(f"prioridad_smp_{i}", None)
+            st.session_state.simulacion_iniciada_smp = False
+            st.rerun()
+
+    st.subheader("✏️ Definir Procesos")
+
+    if not st.session_state.procesos_smp:
+        st.session_state.procesos_smp = [
+            {'pid': i, 'llegada': i // 2, 'duracion': 2 + (i * 3) % 7, 'prioridad': i % 3}
+            for i in range(num_procesos)
+        ]
+
+    procesos_smp = []
+    for i in range(num_procesos):
+        col1, col2, col3, col4 = st.columns([1, 2, 2, 2])
+        with col1:
+            st.write(f"**Proceso {i}**")
+        with col2:
+            llegada = st.number_input(
+                f"Llegada P{i}",
+                min_value=0,
+                value=st.session_state.procesos_smp[i]['llegada'] if i < len(st.session_state.procesos_smp) else i // 2,
+                key=f"llegada_smp_{i}"
+            )
+        with col3:
+            duracion = st.number_input(
+                f"Duración P{i}",
+                min_value=1,
+                value=st.session_state.procesos_smp[i]['duracion'] if i < len(st.session_state.procesos_smp) else 2 + (i * 3) % 7,
+                key=f"duracion_smp_{i}"
+            )
+        with col4:
+            prioridad = st.number_input(
+                f"Prioridad P{i}",
+                min_value=0,
+                max_value=10,
+                value=st.session_state.procesos_smp[i].get('prioridad', 0) if i < len(st.session_state.procesos_smp) else 0,
+                help="Solo la usan Prioridad y Prioridad Preemptiva (0 = máxima)",
+                key=f"prioridad_smp_{i}"
+            )
+
+        procesos_smp.append({
+            'pid': i,
+            'llegada': llegada,
+            'duracion': duracion,
+            'prioridad': prioridad
+        })
+
+    st.session_state.procesos_smp = procesos_smp
+
+    st.header("🎯 Simulación Multinúcleo")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        if st.button("🚀 Ejecutar Simulación Multinúcleo", type="primary", use_container_width=True):
+            with st.spinner(f"Calculando {NOMBRES[politica]} en {nucleos} núcleos..."), medir() as medicion:
+                es_valido, mensaje, procesos_calculados = ejecutar_simulacion(
+                    'smp',
+                    st.session_state.procesos_smp,
+                    nucleos=nucleos,
+                    politica=politica,
+                    cola=cola,
+                    **parametros
+                )
+            if es_valido:
+                st.session_state.procesos_calculados_smp = procesos_calculados
+                st.session_state.configuracion_smp = {'politica': politica, 'nucleos': nucleos, 'cola': cola}
+                st.session_state.gantt_smp = None
+                st.session_state.linea_smp = None
+                st.session_state.tiempo_actual_smp = 0
+                st.session_state.rendimiento_smp = medicion.a_dict()
+                st.session_state.simulacion_iniciada_smp = True
+                st.rerun()
+            else:
+                st.error(f"❌ {mensaje}")
+
+    with col2:
+        if st.button("🔄 Reiniciar Simulación", use_container_width=True):
+            st.session_state.simulacion_iniciada_smp = False
+            st.session_state.tiempo_actual_smp = 0
+            st.rerun()
+
+    if st.session_state.get("simulacion_iniciada_smp", False):
+        configuracion = st.session_state.configuracion_smp
+        titulo = f"{NOMBRES[configuracion['politica']]} en {configuracion['nucleos']} núcleos"
+        st.header(f"📊 Resultados: {titulo}")
+        st.caption(NOMBRES_COLA[configuracion['cola']])
+
+        mostrar_reproduccion(configuracion, titulo)
+
+        with st.expander("📋 Ver detalles de procesos calculados"):
+            st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_smp))
+
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_smp
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                st.json(rendimiento, expanded=False)
+
+    with st.expander("📚 Explicación Detallada del Modo SMP"):
+        st.markdown("""
+        ## 🖥️ Planificación en Multiprocesadores Simétricos
+
+        **Cola global:**
+        - Todos los núcleos toman procesos de una sola cola ordenada por la política
+        - El núcleo libre de menor número toma el mejor proceso
+        - En políticas preemptivas, un proceso listo interrumpe al **peor** de los que están en CPU
+        - ✅ Reparte la carga perfectamente · ❌ Muchas migraciones (pierde la caché del núcleo)
+
+        **Cola por núcleo con robo de trabajo:**
+        - Un proceso nuevo despierta a un núcleo libre; si no hay, entra a la cola de un núcleo fijo
+        - El proceso expropiado o que agota su quantum vuelve a la cola del núcleo donde corrió (afinidad)
+        - La expropiación solo compara con el proceso del mismo núcleo
+        - Un núcleo que se queda sin trabajo **roba** el mejor proceso de la cola más larga
+        - ✅ Pocas migraciones · ❌ El orden de la política es solo local a cada núcleo
+
+        **Ejemplo práctico (FCFS, 2 núcleos, cola global):**
+        ```
+        Procesos: P0(llegada=0, duración=4), P1(llegada=0, duración=2), P2(llegada=1, duración=3)
+
+        CPU 0: P0 de 0 a 4
+        CPU 1: P1 de 0 a 2, P2 de 2 a 5
+        ```
+
+        **Migración:** un tramo de un proceso que corre en un núcleo distinto al de su tramo
+        anterior. **Utilización:** ticks ocupados del núcleo sobre el tiempo total de la simulación.
+
+        **Simulación por eventos:** un montículo guarda el fin del tramo de cada núcleo y otro los
+        núcleos libres; el simulador salta de evento en evento, por lo que escala a miles de núcleos
+        y millones de procesos.
+
+        **Aplicaciones en la vida real:**
+        - Linux (CFS/EEVDF) usa colas por núcleo con balanceo de carga
+        - Los runtimes de Go, Tokio y Cilk usan robo de trabajo entre hilos
+        """)
+
+if __name__ == "__main__":
+    main()
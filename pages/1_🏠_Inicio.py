@@ -179,6 +179,45 @@ def main():
             </ul>
         </div>
         """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="algo-card">
+            <h3>🎚️ Prioridad Preemptiva</h3>
+            <p><strong>Prioridad con Envejecimiento</strong></p>
+            <p>Interrumpe al proceso actual si llega uno más prioritario; el envejecimiento evita la inanición</p>
+            <ul>
+                <li>✅ Respuesta inmediata a procesos críticos</li>
+                <li>✅ Sin inanición con envejecimiento</li>
+                <li>⏱️ Preemptivo</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="algo-card">
+            <h3>🪜 MLFQ</h3>
+            <p><strong>Multilevel Feedback Queue</strong></p>
+            <p>Varias colas con quantum creciente: los procesos que agotan su quantum bajan de nivel</p>
+            <ul>
+                <li>✅ Favorece a los procesos cortos sin conocer su duración</li>
+                <li>❌ Muchos parámetros que ajustar</li>
+                <li>⏱️ Preemptivo</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="algo-card">
+            <h3>🖥️ Multinúcleo (SMP)</h3>
+            <p><strong>Cualquier política en k CPUs</strong></p>
+            <p>Cola global o por núcleo con robo de trabajo, con migraciones y utilización por núcleo</p>
+            <ul>
+                <li>✅ Carriles por núcleo en el diagrama de Gantt</li>
+                <li>✅ Escala a miles de núcleos</li>
+                <li>⏱️ Modo de simulación para todas las políticas</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
     
     st.markdown("---")
     st.markdown("### 📖 Cómo Usar el Simulador")
@@ -190,7 +229,7 @@ def main():
         <div class="step-card">
             <div style="font-size: 3rem; margin-bottom: 1rem;">1️⃣</div>
             <h4>Selecciona un Algoritmo</h4>
-            <p>Elige entre los 5 algoritmos disponibles según tus necesidades de estudio</p>
+            <p>Elige entre los 7 algoritmos disponibles, en uno o varios núcleos, según tus necesidades de estudio</p>
         </div>
         """, unsafe_allow_html=True)
     
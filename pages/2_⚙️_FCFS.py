@@ -1,13 +1,18 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.fcfs import calcular_fcfs
-from utils.visualizacion import crear_grafico_gantt, mostrar_metricas
-from utils.helpers import validar_procesos, calcular_tiempo_total
+from utils.cache import ejecutar_simulacion
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.visualizacion import GraficoGantt, tema_gantt, mostrar_metricas
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.helpers import calcular_tiempo_total
+from utils.generador import generar_lista, PATRONES_LLEGADA, DISTRIBUCIONES_DURACION
 
 st.set_page_config(
     page_title="FCFS - Simulador Planificación",
@@ -23,6 +28,80 @@ if 'tiempo_actual_fcfs' not in st.session_state:
     st.session_state.tiempo_actual_fcfs = 0
 if 'simulacion_iniciada_fcfs' not in st.session_state:
     st.session_state.simulacion_iniciada_fcfs = False
+if 'gantt_fcfs' not in st.session_state:
+    st.session_state.gantt_fcfs = None
+if 'linea_fcfs' not in st.session_state:
+    st.session_state.linea_fcfs = None
+if 'rendimiento_fcfs' not in st.session_state:
+    st.session_state.rendimiento_fcfs = None
+
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_fcfs = min(max(st.session_state.tiempo_actual_fcfs + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion():
+    tiempo_actual = st.session_state.tiempo_actual_fcfs
+    tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_fcfs)
+
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_fcfs",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_fcfs is None or st.session_state.linea_fcfs[0] != tema:
+            st.session_state.linea_fcfs = (tema, *html_linea_tiempo([datos_linea_tiempo(
+                st.session_state.procesos_calculados_fcfs,
+                "FCFS"
+            )], tema=tema))
+        _, html, alto = st.session_state.linea_fcfs
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.button("⏮️ Reiniciar", key="reiniciar_fcfs", use_container_width=True, on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        with col2:
+            st.button("◀️ Retroceder", key="retroceder_fcfs", use_container_width=True, on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        with col3:
+            st.button("Avanzar ▶️", key="avanzar_fcfs", use_container_width=True, on_click=mover_tiempo, args=(1, tiempo_total))
+
+        with col4:
+            st.button("▶️▶️ Ver Todo", key="vertodo_fcfs", use_container_width=True, on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_fcfs / tiempo_total)
+        else:
+            st.progress(0)
+
+        if st.session_state.gantt_fcfs is None:
+            st.session_state.gantt_fcfs = GraficoGantt(
+                st.session_state.procesos_calculados_fcfs,
+                "FCFS"
+            )
+        st.image(fotograma(st.session_state.gantt_fcfs, st.session_state.tiempo_actual_fcfs, tema=tema_gantt(st.context)), use_container_width=True)
+
+    if en_navegador or st.session_state.tiempo_actual_fcfs == tiempo_total:
+        st.markdown("---")
+        st.subheader("📈 Métricas Finales FCFS")
+
+        metricas = mostrar_metricas(st.session_state.procesos_calculados_fcfs)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
+        with col2:
+            st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
+        with col3:
+            st.metric("✅ Procesos Completados", metricas['procesos_completados'])
+
+        st.subheader("🔄 Secuencia de Ejecución")
+        secuencia = " → ".join([f"P{p['pid']}" for p in st.session_state.procesos_calculados_fcfs])
+        st.success(f"**Orden de ejecución:** {secuencia}")
 
 def main():
     st.title("⚙️ Algoritmo FCFS (First Come First Served)")
@@ -72,6 +151,24 @@ def main():
             st.session_state.simulacion_iniciada_fcfs = False
             st.rerun()
     
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            llegadas = st.selectbox("Llegadas", PATRONES_LLEGADA, key="gen_llegadas_fcfs")
+        with col2:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_fcfs")
+        with col3:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_fcfs")
+        if st.button("🎲 Generar Procesos", key="generar_fcfs", use_container_width=True):
+            st.session_state.procesos_fcfs = generar_lista(num_procesos, llegadas=llegadas, duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20, tamano_rafaga=3)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"llegada_fcfs_{i}", None)
+                st.session_state.pop(f"duracion_fcfs_{i}", None)
+            st.session_state.simulacion_iniciada_fcfs = False
+            st.rerun()
+    
     st.subheader("✏️ Definir Procesos FCFS")
     
     if not st.session_state.procesos_fcfs:
@@ -121,15 +218,16 @@ def main():
     
     with col1:
         if st.button("🚀 Ejecutar Simulación FCFS", type="primary", use_container_width=True):
-            es_valido, mensaje = validar_procesos(st.session_state.procesos_fcfs)
+            with st.spinner("Calculando planificación FCFS..."), medir() as medicion:
+                es_valido, mensaje, procesos_calculados = ejecutar_simulacion('fcfs', st.session_state.procesos_fcfs)
             if es_valido:
-                with st.spinner("Calculando planificación FCFS..."):
-                    procesos_calculados = calcular_fcfs(st.session_state.procesos_fcfs.copy())
-                    
-                    st.session_state.procesos_calculados_fcfs = procesos_calculados
-                    st.session_state.tiempo_actual_fcfs = 0
-                    st.session_state.simulacion_iniciada_fcfs = True
-                    st.rerun()
+                st.session_state.procesos_calculados_fcfs = procesos_calculados
+                st.session_state.gantt_fcfs = None
+                st.session_state.linea_fcfs = None
+                st.session_state.tiempo_actual_fcfs = 0
+                st.session_state.rendimiento_fcfs = medicion.a_dict()
+                st.session_state.simulacion_iniciada_fcfs = True
+                st.rerun()
             else:
                 st.error(f"❌ {mensaje}")
     
@@ -142,67 +240,20 @@ def main():
     if st.session_state.get("simulacion_iniciada_fcfs", False):
         st.header("📊 Resultados de la Simulación FCFS")
         
-        tiempo_actual = st.session_state.tiempo_actual_fcfs
-        tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_fcfs)
-        
-        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if st.button("⏮️ Reiniciar", key="reiniciar_fcfs", use_container_width=True):
-                st.session_state.tiempo_actual_fcfs = 0
-                st.rerun()
-        
-        with col2:
-            if st.button("◀️ Retroceder", key="retroceder_fcfs", use_container_width=True):
-                if st.session_state.tiempo_actual_fcfs > 0:
-                    st.session_state.tiempo_actual_fcfs -= 1
-                    st.rerun()
-        
-        with col3:
-            if st.button("Avanzar ▶️", key="avanzar_fcfs", use_container_width=True):
-                if st.session_state.tiempo_actual_fcfs < tiempo_total:
-                    st.session_state.tiempo_actual_fcfs += 1
-                    st.rerun()
-        
-        with col4:
-            if st.button("▶️▶️ Ver Todo", key="vertodo_fcfs", use_container_width=True):
-                st.session_state.tiempo_actual_fcfs = tiempo_total
-                st.rerun()
-        
-        if tiempo_total > 0:
-            st.progress(st.session_state.tiempo_actual_fcfs / tiempo_total)
-        else:
-            st.progress(0)
-        
-        fig = crear_grafico_gantt(
-            st.session_state.procesos_calculados_fcfs,
-            st.session_state.tiempo_actual_fcfs,
-            "FCFS"
-        )
-        st.pyplot(fig)
-        
-        if st.session_state.tiempo_actual_fcfs == tiempo_total:
-            st.markdown("---")
-            st.subheader("📈 Métricas Finales FCFS")
-            
-            metricas = mostrar_metricas(st.session_state.procesos_calculados_fcfs)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
-            with col2:
-                st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
-            with col3:
-                st.metric("✅ Procesos Completados", metricas['procesos_completados'])
-            
-            st.subheader("🔄 Secuencia de Ejecución")
-            secuencia = " → ".join([f"P{p['pid']}" for p in st.session_state.procesos_calculados_fcfs])
-            st.success(f"**Orden de ejecución:** {secuencia}")
-        
+        mostrar_reproduccion()
+
         with st.expander("📋 Ver detalles de procesos calculados"):
             st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_fcfs))
+
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_fcfs
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                st.json(rendimiento, expanded=False)
     
     with st.expander("📚 Explicación Detallada del Algoritmo FCFS"):
         st.markdown("""
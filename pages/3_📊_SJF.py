@@ -1,13 +1,18 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.sjf import calcular_sjf
-from utils.visualizacion import crear_grafico_gantt, mostrar_metricas
-from utils.helpers import validar_procesos, calcular_tiempo_total
+from utils.cache import ejecutar_simulacion
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.visualizacion import GraficoGantt, tema_gantt, mostrar_metricas
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.helpers import calcular_tiempo_total
+from utils.generador import generar_lista, DISTRIBUCIONES_DURACION
 
 st.set_page_config(
     page_title="SJF - Simulador Planificación", 
@@ -23,6 +28,76 @@ if 'tiempo_actual_sjf' not in st.session_state:
     st.session_state.tiempo_actual_sjf = 0
 if 'simulacion_iniciada_sjf' not in st.session_state:
     st.session_state.simulacion_iniciada_sjf = False
+if 'gantt_sjf' not in st.session_state:
+    st.session_state.gantt_sjf = None
+if 'linea_sjf' not in st.session_state:
+    st.session_state.linea_sjf = None
+if 'rendimiento_sjf' not in st.session_state:
+    st.session_state.rendimiento_sjf = None
+
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_sjf = min(max(st.session_state.tiempo_actual_sjf + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion():
+    tiempo_actual = st.session_state.tiempo_actual_sjf
+    tiempo_total = st.session_state.tiempo_total_sjf
+
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_sjf",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_sjf is None or st.session_state.linea_sjf[0] != tema:
+            st.session_state.linea_sjf = (tema, *html_linea_tiempo([datos_linea_tiempo(
+                st.session_state.procesos_calculados_sjf,
+                "SJF"
+            )], tema=tema))
+        _, html, alto = st.session_state.linea_sjf
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        col1.button("⏮️ Reiniciar", key="reiniciar_sjf", on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        col2.button("◀️ Retroceder", key="retroceder_sjf", on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        col3.button("Avanzar ▶️", key="avanzar_sjf", on_click=mover_tiempo, args=(1, tiempo_total))
+
+        col4.button("▶️▶️ Ver Todo", key="ver_todo_sjf", on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_sjf / tiempo_total)
+        else:
+            st.progress(0)
+
+        if st.session_state.gantt_sjf is None:
+            st.session_state.gantt_sjf = GraficoGantt(
+                st.session_state.procesos_calculados_sjf,
+                "SJF"
+            )
+        st.image(fotograma(st.session_state.gantt_sjf, st.session_state.tiempo_actual_sjf, tema=tema_gantt(st.context)), use_container_width=True)
+
+    if en_navegador or st.session_state.tiempo_actual_sjf == tiempo_total:
+        st.markdown("---")
+        st.subheader("📈 Métricas Finales SJF")
+
+        metricas = mostrar_metricas(st.session_state.procesos_calculados_sjf)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
+        with col2:
+            st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
+        with col3:
+            st.metric("✅ Procesos Completados", metricas['procesos_completados'])
+
+        st.subheader("🔄 Secuencia de Ejecución")
+        secuencia = " → ".join([f"P{p['pid']}" for p in st.session_state.procesos_calculados_sjf])
+        st.success(f"**Orden de ejecución:** {secuencia}")
 
 def main():
     st.title("📊 Algoritmo SJF (Shortest Job First)")
@@ -74,6 +149,21 @@ def main():
             st.session_state.simulacion_iniciada_sjf = False
             st.rerun()
     
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2 = st.columns(2)
+        with col1:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_sjf")
+        with col2:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_sjf")
+        if st.button("🎲 Generar Procesos", key="generar_sjf", use_container_width=True):
+            st.session_state.procesos_sjf = generar_lista(num_procesos, llegadas='simultanea', duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"sjf_duracion_{i}", None)
+            st.session_state.simulacion_iniciada_sjf = False
+            st.rerun()
+    
     st.subheader("✏️ Definir Duraciones de Procesos")
     
     if not st.session_state.procesos_sjf:
@@ -116,16 +206,17 @@ def main():
     
     with col1:
         if st.button("🚀 Ejecutar Simulación SJF", type="primary", use_container_width=True):
-            es_valido, mensaje = validar_procesos(st.session_state.procesos_sjf)
+            with st.spinner("Ejecutando algoritmo SJF..."), medir() as medicion:
+                es_valido, mensaje, resultado_sjf = ejecutar_simulacion('sjf', st.session_state.procesos_sjf)
             if es_valido:
-                with st.spinner("Ejecutando algoritmo SJF..."):
-                    resultado_sjf = calcular_sjf(st.session_state.procesos_sjf.copy())
-                    
-                    st.session_state.procesos_calculados_sjf = resultado_sjf
-                    st.session_state.tiempo_total_sjf = calcular_tiempo_total(resultado_sjf)
-                    st.session_state.tiempo_actual_sjf = 0
-                    st.session_state.simulacion_iniciada_sjf = True
-                    st.rerun()
+                st.session_state.procesos_calculados_sjf = resultado_sjf
+                st.session_state.gantt_sjf = None
+                st.session_state.linea_sjf = None
+                st.session_state.tiempo_total_sjf = calcular_tiempo_total(resultado_sjf)
+                st.session_state.tiempo_actual_sjf = 0
+                st.session_state.rendimiento_sjf = medicion.a_dict()
+                st.session_state.simulacion_iniciada_sjf = True
+                st.rerun()
             else:
                 st.error(f"❌ {mensaje}")
     
@@ -138,65 +229,21 @@ def main():
     if st.session_state.get("simulacion_iniciada_sjf", False):
         st.header("📊 Visualización de la Simulación SJF")
         
-        tiempo_actual = st.session_state.tiempo_actual_sjf
-        tiempo_total = st.session_state.tiempo_total_sjf
-        
-        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        if col1.button("⏮️ Reiniciar", key="reiniciar_sjf"):
-            st.session_state.tiempo_actual_sjf = 0
-            st.rerun()
-
-        if col2.button("◀️ Retroceder", key="retroceder_sjf"):
-            if st.session_state.tiempo_actual_sjf > 0:
-                st.session_state.tiempo_actual_sjf -= 1
-                st.rerun()
-
-        if col3.button("Avanzar ▶️", key="avanzar_sjf"):
-            if st.session_state.tiempo_actual_sjf < tiempo_total:
-                st.session_state.tiempo_actual_sjf += 1
-                st.rerun()
-
-        if col4.button("▶️▶️ Ver Todo", key="ver_todo_sjf"):
-            st.session_state.tiempo_actual_sjf = tiempo_total
-            st.rerun()
-
-        if tiempo_total > 0:
-            st.progress(st.session_state.tiempo_actual_sjf / tiempo_total)
-        else:
-            st.progress(0)
-
-        fig = crear_grafico_gantt(
-            st.session_state.procesos_calculados_sjf,
-            st.session_state.tiempo_actual_sjf,
-            "SJF"
-        )
-        
-        st.pyplot(fig)
-
-        if st.session_state.tiempo_actual_sjf == tiempo_total:
-            st.markdown("---")
-            st.subheader("📈 Métricas Finales SJF")
-            
-            metricas = mostrar_metricas(st.session_state.procesos_calculados_sjf)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
-            with col2:
-                st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
-            with col3:
-                st.metric("✅ Procesos Completados", metricas['procesos_completados'])
-            
-            st.subheader("🔄 Secuencia de Ejecución")
-            secuencia = " → ".join([f"P{p['pid']}" for p in st.session_state.procesos_calculados_sjf])
-            st.success(f"**Orden de ejecución:** {secuencia}")
+        mostrar_reproduccion()
 
         with st.expander("📋 Ver datos calculados de los procesos"):
             st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_sjf))
 
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_sjf
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                st.json(rendimiento, expanded=False)
+
     with st.expander("📚 Explicación del Algoritmo SJF"):
         st.markdown("""
         ## 📊 Shortest Job First (SJF)
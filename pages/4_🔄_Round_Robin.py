@@ -1,13 +1,19 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.rr import calcular_rr
-from utils.visualizacion import crear_grafico_gantt, mostrar_metricas
-from utils.helpers import validar_procesos, calcular_tiempo_total
+from utils.cache import ejecutar_simulacion
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.visualizacion import GraficoGantt, tema_gantt, mostrar_metricas, crear_grafico_barrido
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.barrido import barrer_rr, opciones_procesos_trabajo, nombre_procesos_trabajo
+from utils.helpers import calcular_tiempo_total
+from utils.generador import generar_lista, PATRONES_LLEGADA, DISTRIBUCIONES_DURACION
 
 st.set_page_config(
     page_title="Round Robin - Simulador Planificación",
@@ -23,9 +29,88 @@ if 'tiempo_actual_rr' not in st.session_state:
     st.session_state.tiempo_actual_rr = 0
 if 'simulacion_iniciada_rr' not in st.session_state:
     st.session_state.simulacion_iniciada_rr = False
+if 'gantt_rr' not in st.session_state:
+    st.session_state.gantt_rr = None
+if 'linea_rr' not in st.session_state:
+    st.session_state.linea_rr = None
+if 'rendimiento_rr' not in st.session_state:
+    st.session_state.rendimiento_rr = None
+if 'barrido_rr' not in st.session_state:
+    st.session_state.barrido_rr = None
 if 'config_rr' not in st.session_state:
     st.session_state.config_rr = {'quantum': 3, 'cambio_contexto': 1, 'usar_cambio_contexto': False}
 
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_rr = min(max(st.session_state.tiempo_actual_rr + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion():
+    tiempo_actual = st.session_state.tiempo_actual_rr
+    tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_rr)
+
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_rr",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_rr is None or st.session_state.linea_rr[0] != tema:
+            st.session_state.linea_rr = (tema, *html_linea_tiempo([datos_linea_tiempo(
+                st.session_state.procesos_calculados_rr,
+                "Round Robin"
+            )], tema=tema))
+        _, html, alto = st.session_state.linea_rr
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.button("⏮️ Reiniciar", key="reiniciar_rr", use_container_width=True, on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        with col2:
+            st.button("◀️ Retroceder", key="retroceder_rr", use_container_width=True, on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        with col3:
+            st.button("Avanzar ▶️", key="avanzar_rr", use_container_width=True, on_click=mover_tiempo, args=(1, tiempo_total))
+
+        with col4:
+            st.button("▶️▶️ Ver Todo", key="vertodo_rr", use_container_width=True, on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_rr / tiempo_total)
+        else:
+            st.progress(0)
+
+        if st.session_state.gantt_rr is None:
+            st.session_state.gantt_rr = GraficoGantt(
+                st.session_state.procesos_calculados_rr,
+                "Round Robin"
+            )
+        st.image(fotograma(st.session_state.gantt_rr, st.session_state.tiempo_actual_rr, tema=tema_gantt(st.context)), use_container_width=True)
+
+    if en_navegador or st.session_state.tiempo_actual_rr == tiempo_total:
+        st.markdown("---")
+        st.subheader("📈 Métricas Finales Round Robin")
+
+        metricas = mostrar_metricas(st.session_state.procesos_calculados_rr)
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
+        with col2:
+            st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
+        with col3:
+            st.metric("✅ Procesos Completados", metricas['procesos_completados'])
+        with col4:
+            st.metric("🔁 Quantum", st.session_state.config_rr['quantum'])
+
+        if st.session_state.config_rr['usar_cambio_contexto']:
+            total_cambios = sum(len(p.get('ejecuciones', [])) - 1 for p in st.session_state.procesos_calculados_rr if len(p.get('ejecuciones', [])) > 1)
+            tiempo_cambios = total_cambios * st.session_state.config_rr['cambio_contexto']
+            st.info(f"**Cambios de contexto:** {total_cambios} cambios, {tiempo_cambios} ticks de overhead")
+
 def main():
     st.title("🔄 Algoritmo Round Robin")
     
@@ -132,6 +217,24 @@ def main():
             st.session_state.simulacion_iniciada_rr = False
             st.rerun()
     
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            llegadas = st.selectbox("Llegadas", PATRONES_LLEGADA, key="gen_llegadas_rr")
+        with col2:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_rr")
+        with col3:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_rr")
+        if st.button("🎲 Generar Procesos", key="generar_rr", use_container_width=True):
+            st.session_state.procesos_rr = generar_lista(num_procesos, llegadas=llegadas, duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20, tamano_rafaga=3)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"llegada_rr_{i}", None)
+                st.session_state.pop(f"duracion_rr_{i}", None)
+            st.session_state.simulacion_iniciada_rr = False
+            st.rerun()
+    
     st.subheader("✏️ Definir Procesos Round Robin")
     
     if not st.session_state.procesos_rr:
@@ -180,21 +283,23 @@ def main():
     
     with col1:
         if st.button("🚀 Ejecutar Simulación RR", type="primary", use_container_width=True):
-            es_valido, mensaje = validar_procesos(st.session_state.procesos_rr)
+            with st.spinner("Ejecutando Round Robin..."), medir() as medicion:
+                cambio_contexto = st.session_state.config_rr['cambio_contexto'] if st.session_state.config_rr['usar_cambio_contexto'] else 0
+                
+                es_valido, mensaje, procesos_calculados = ejecutar_simulacion(
+                    'rr',
+                    st.session_state.procesos_rr,
+                    quantum=st.session_state.config_rr['quantum'],
+                    cambio_contexto=cambio_contexto
+                )
             if es_valido:
-                with st.spinner("Ejecutando Round Robin..."):
-                    cambio_contexto = st.session_state.config_rr['cambio_contexto'] if st.session_state.config_rr['usar_cambio_contexto'] else 0
-                    
-                    procesos_calculados = calcular_rr(
-                        st.session_state.procesos_rr.copy(),
-                        quantum=st.session_state.config_rr['quantum'],
-                        cambio_contexto=cambio_contexto
-                    )
-                    
-                    st.session_state.procesos_calculados_rr = procesos_calculados
-                    st.session_state.tiempo_actual_rr = 0
-                    st.session_state.simulacion_iniciada_rr = True
-                    st.rerun()
+                st.session_state.procesos_calculados_rr = procesos_calculados
+                st.session_state.gantt_rr = None
+                st.session_state.linea_rr = None
+                st.session_state.tiempo_actual_rr = 0
+                st.session_state.rendimiento_rr = medicion.a_dict()
+                st.session_state.simulacion_iniciada_rr = True
+                st.rerun()
             else:
                 st.error(f"❌ {mensaje}")
     
@@ -207,70 +312,74 @@ def main():
     if st.session_state.get("simulacion_iniciada_rr", False):
         st.header("📊 Resultados de la Simulación Round Robin")
         
-        tiempo_actual = st.session_state.tiempo_actual_rr
-        tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_rr)
-        
-        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if st.button("⏮️ Reiniciar", key="reiniciar_rr", use_container_width=True):
-                st.session_state.tiempo_actual_rr = 0
-                st.rerun()
-        
-        with col2:
-            if st.button("◀️ Retroceder", key="retroceder_rr", use_container_width=True):
-                if st.session_state.tiempo_actual_rr > 0:
-                    st.session_state.tiempo_actual_rr -= 1
-                    st.rerun()
-        
-        with col3:
-            if st.button("Avanzar ▶️", key="avanzar_rr", use_container_width=True):
-                if st.session_state.tiempo_actual_rr < tiempo_total:
-                    st.session_state.tiempo_actual_rr += 1
-                    st.rerun()
-        
-        with col4:
-            if st.button("▶️▶️ Ver Todo", key="vertodo_rr", use_container_width=True):
-                st.session_state.tiempo_actual_rr = tiempo_total
-                st.rerun()
-        
-        if tiempo_total > 0:
-            st.progress(st.session_state.tiempo_actual_rr / tiempo_total)
-        else:
-            st.progress(0)
-        
-        fig = crear_grafico_gantt(
-            st.session_state.procesos_calculados_rr,
-            st.session_state.tiempo_actual_rr,
-            "Round Robin"
+        mostrar_reproduccion()
+
+        with st.expander("📋 Ver detalles de procesos calculados"):
+            st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_rr))
+
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_rr
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                st.json(rendimiento, expanded=False)
+    
+    st.header("🔬 Barrido de Quantum y Cambio de Contexto")
+    
+    st.markdown("Evalúa Round Robin sobre los procesos configurados con varios quantums y cambios de contexto a la vez.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        rango_quantum = st.slider(
+            "Rango de quantum (ticks)",
+            min_value=1,
+            max_value=20,
+            value=(1, 10),
+            key="barrido_quantum_rr"
+        )
+    
+    with col2:
+        rango_cc = st.slider(
+            "Rango de cambio de contexto (ticks)",
+            min_value=0,
+            max_value=5,
+            value=(0, 2),
+            key="barrido_cc_rr"
         )
-        st.pyplot(fig)
+    
+    procesos_trabajo = st.selectbox(
+        "Procesos de trabajo",
+        opciones_procesos_trabajo(),
+        format_func=nombre_procesos_trabajo,
+        help="Tamaño del pool de procesos del barrido. Automático usa el pool solo si la cuadrícula lo justifica",
+        key="barrido_procesos_trabajo_rr"
+    )
+
+    if st.button("🔬 Ejecutar Barrido", key="barrido_rr_boton", use_container_width=True):
+        with st.spinner("Evaluando la cuadrícula de parámetros..."):
+            es_valido, mensaje, resultados = barrer_rr(
+                st.session_state.procesos_rr,
+                range(rango_quantum[0], rango_quantum[1] + 1),
+                range(rango_cc[0], rango_cc[1] + 1),
+                procesos_trabajo=procesos_trabajo
+            )
+        if es_valido:
+            st.session_state.barrido_rr = resultados
+        else:
+            st.error(f"❌ {mensaje}")
+    
+    if st.session_state.barrido_rr:
+        st.pyplot(crear_grafico_barrido(st.session_state.barrido_rr))
         
-        if st.session_state.tiempo_actual_rr == tiempo_total:
-            st.markdown("---")
-            st.subheader("📈 Métricas Finales Round Robin")
-            
-            metricas = mostrar_metricas(st.session_state.procesos_calculados_rr)
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
-            with col2:
-                st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
-            with col3:
-                st.metric("✅ Procesos Completados", metricas['procesos_completados'])
-            with col4:
-                st.metric("🔁 Quantum", st.session_state.config_rr['quantum'])
-            
-            if st.session_state.config_rr['usar_cambio_contexto']:
-                total_cambios = sum(len(p.get('ejecuciones', [])) - 1 for p in st.session_state.procesos_calculados_rr if len(p.get('ejecuciones', [])) > 1)
-                tiempo_cambios = total_cambios * st.session_state.config_rr['cambio_contexto']
-                st.info(f"**Cambios de contexto:** {total_cambios} cambios, {tiempo_cambios} ticks de overhead")
+        mejor = min(st.session_state.barrido_rr, key=lambda r: (r['retorno_promedio'], r['cambio_contexto'], r['quantum']))
+        st.success(f"**Menor retorno promedio:** quantum {mejor['quantum']} con cambio de contexto {mejor['cambio_contexto']} ({mejor['retorno_promedio']:.2f})")
         
-        with st.expander("📋 Ver detalles de procesos calculados"):
-            st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_rr))
+        with st.expander("📋 Ver resultados del barrido"):
+            st.dataframe(pd.DataFrame(st.session_state.barrido_rr), use_container_width=True)
     
     with st.expander("📚 Explicación Detallada del Algoritmo Round Robin"):
         st.markdown("""
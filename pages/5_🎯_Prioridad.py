@@ -1,13 +1,18 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.prioridad import calcular_prioridad
-from utils.visualizacion import crear_grafico_gantt, mostrar_metricas
-from utils.helpers import validar_procesos, calcular_tiempo_total
+from utils.cache import ejecutar_simulacion
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.visualizacion import GraficoGantt, tema_gantt, mostrar_metricas
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.helpers import calcular_tiempo_total
+from utils.generador import generar_lista, PATRONES_LLEGADA, DISTRIBUCIONES_DURACION
 
 st.set_page_config(
     page_title="Prioridad - Simulador Planificación",
@@ -23,6 +28,96 @@ if 'tiempo_actual_pri' not in st.session_state:
     st.session_state.tiempo_actual_pri = 0
 if 'simulacion_iniciada_pri' not in st.session_state:
     st.session_state.simulacion_iniciada_pri = False
+if 'gantt_pri' not in st.session_state:
+    st.session_state.gantt_pri = None
+if 'linea_pri' not in st.session_state:
+    st.session_state.linea_pri = None
+if 'rendimiento_pri' not in st.session_state:
+    st.session_state.rendimiento_pri = None
+
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_pri = min(max(st.session_state.tiempo_actual_pri + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion():
+    tiempo_actual = st.session_state.tiempo_actual_pri
+    tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_pri)
+
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_pri",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_pri is None or st.session_state.linea_pri[0] != tema:
+            st.session_state.linea_pri = (tema, *html_linea_tiempo([datos_linea_tiempo(
+                st.session_state.procesos_calculados_pri,
+                "Prioridad"
+            )], tema=tema))
+        _, html, alto = st.session_state.linea_pri
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.button("⏮️ Reiniciar", key="reiniciar_pri", use_container_width=True, on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        with col2:
+            st.button("◀️ Retroceder", key="retroceder_pri", use_container_width=True, on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        with col3:
+            st.button("Avanzar ▶️", key="avanzar_pri", use_container_width=True, on_click=mover_tiempo, args=(1, tiempo_total))
+
+        with col4:
+            st.button("▶️▶️ Ver Todo", key="vertodo_pri", use_container_width=True, on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_pri / tiempo_total)
+        else:
+            st.progress(0)
+
+        if st.session_state.gantt_pri is None:
+            st.session_state.gantt_pri = GraficoGantt(
+                st.session_state.procesos_calculados_pri,
+                "Prioridad"
+            )
+        st.image(fotograma(st.session_state.gantt_pri, st.session_state.tiempo_actual_pri, tema=tema_gantt(st.context)), use_container_width=True)
+
+    if en_navegador or st.session_state.tiempo_actual_pri == tiempo_total:
+        st.markdown("---")
+        st.subheader("📈 Métricas Finales por Prioridad")
+
+        metricas = mostrar_metricas(st.session_state.procesos_calculados_pri)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
+        with col2:
+            st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
+        with col3:
+            st.metric("✅ Procesos Completados", metricas['procesos_completados'])
+
+        st.subheader("🎯 Análisis por Niveles de Prioridad")
+
+        df_analisis = pd.DataFrame(st.session_state.procesos_calculados_pri)
+        df_analisis['Nivel'] = df_analisis['prioridad'].apply(
+            lambda x: "Alta" if x <= 3 else "Media" if x <= 6 else "Baja"
+        )
+
+        stats_prioridad = df_analisis.groupby('Nivel').agg({
+            'retorno': 'mean',
+            'espera': 'mean',
+            'pid': 'count'
+        }).round(2)
+
+        stats_prioridad.columns = ['Retorno Promedio', 'Espera Promedio', 'Cantidad Procesos']
+        st.dataframe(stats_prioridad, use_container_width=True)
+
+        st.subheader("🔄 Secuencia de Ejecución")
+        secuencia = " → ".join([f"P{p['pid']}({p['prioridad']})" for p in st.session_state.procesos_calculados_pri])
+        st.success(f"**Orden de ejecución:** {secuencia}")
 
 def main():
     st.title("🎯 Planificación por Prioridad")
@@ -72,6 +167,25 @@ def main():
             st.session_state.simulacion_iniciada_pri = False
             st.rerun()
     
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            llegadas = st.selectbox("Llegadas", PATRONES_LLEGADA, key="gen_llegadas_pri")
+        with col2:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_pri")
+        with col3:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_pri")
+        if st.button("🎲 Generar Procesos", key="generar_pri", use_container_width=True):
+            st.session_state.procesos_pri = generar_lista(num_procesos, llegadas=llegadas, duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20, tamano_rafaga=3)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"llegada_pri_{i}", None)
+                st.session_state.pop(f"duracion_pri_{i}", None)
+                st.session_state.pop(f"prioridad_pri_{i}", None)
+            st.session_state.simulacion_iniciada_pri = False
+            st.rerun()
+    
     st.subheader("✏️ Definir Procesos y Prioridades")
     
     st.info("💡 **Recordatorio:** Menor número = Mayor prioridad (0 es la más alta)")
@@ -138,15 +252,16 @@ def main():
     
     with col1:
         if st.button("🚀 Ejecutar Simulación Prioridad", type="primary", use_container_width=True):
-            es_valido, mensaje = validar_procesos(st.session_state.procesos_pri)
+            with st.spinner("Calculando planificación por prioridad..."), medir() as medicion:
+                es_valido, mensaje, procesos_calculados = ejecutar_simulacion('prioridad', st.session_state.procesos_pri)
             if es_valido:
-                with st.spinner("Calculando planificación por prioridad..."):
-                    procesos_calculados = calcular_prioridad(st.session_state.procesos_pri.copy())
-                    
-                    st.session_state.procesos_calculados_pri = procesos_calculados
-                    st.session_state.tiempo_actual_pri = 0
-                    st.session_state.simulacion_iniciada_pri = True
-                    st.rerun()
+                st.session_state.procesos_calculados_pri = procesos_calculados
+                st.session_state.gantt_pri = None
+                st.session_state.linea_pri = None
+                st.session_state.tiempo_actual_pri = 0
+                st.session_state.rendimiento_pri = medicion.a_dict()
+                st.session_state.simulacion_iniciada_pri = True
+                st.rerun()
             else:
                 st.error(f"❌ {mensaje}")
     
@@ -159,83 +274,20 @@ def main():
     if st.session_state.get("simulacion_iniciada_pri", False):
         st.header("📊 Resultados de la Simulación por Prioridad")
         
-        tiempo_actual = st.session_state.tiempo_actual_pri
-        tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_pri)
-        
-        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if st.button("⏮️ Reiniciar", key="reiniciar_pri", use_container_width=True):
-                st.session_state.tiempo_actual_pri = 0
-                st.rerun()
-        
-        with col2:
-            if st.button("◀️ Retroceder", key="retroceder_pri", use_container_width=True):
-                if st.session_state.tiempo_actual_pri > 0:
-                    st.session_state.tiempo_actual_pri -= 1
-                    st.rerun()
-        
-        with col3:
-            if st.button("Avanzar ▶️", key="avanzar_pri", use_container_width=True):
-                if st.session_state.tiempo_actual_pri < tiempo_total:
-                    st.session_state.tiempo_actual_pri += 1
-                    st.rerun()
-        
-        with col4:
-            if st.button("▶️▶️ Ver Todo", key="vertodo_pri", use_container_width=True):
-                st.session_state.tiempo_actual_pri = tiempo_total
-                st.rerun()
-        
-        if tiempo_total > 0:
-            st.progress(st.session_state.tiempo_actual_pri / tiempo_total)
-        else:
-            st.progress(0)
-        
-        fig = crear_grafico_gantt(
-            st.session_state.procesos_calculados_pri,
-            st.session_state.tiempo_actual_pri,
-            "Prioridad"
-        )
-        st.pyplot(fig)
-        
-        if st.session_state.tiempo_actual_pri == tiempo_total:
-            st.markdown("---")
-            st.subheader("📈 Métricas Finales por Prioridad")
-            
-            metricas = mostrar_metricas(st.session_state.procesos_calculados_pri)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
-            with col2:
-                st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
-            with col3:
-                st.metric("✅ Procesos Completados", metricas['procesos_completados'])
-            
-            st.subheader("🎯 Análisis por Niveles de Prioridad")
-            
-            df_analisis = pd.DataFrame(st.session_state.procesos_calculados_pri)
-            df_analisis['Nivel'] = df_analisis['prioridad'].apply(
-                lambda x: "Alta" if x <= 3 else "Media" if x <= 6 else "Baja"
-            )
-            
-            stats_prioridad = df_analisis.groupby('Nivel').agg({
-                'retorno': 'mean',
-                'espera': 'mean',
-                'pid': 'count'
-            }).round(2)
-            
-            stats_prioridad.columns = ['Retorno Promedio', 'Espera Promedio', 'Cantidad Procesos']
-            st.dataframe(stats_prioridad, use_container_width=True)
-            
-            st.subheader("🔄 Secuencia de Ejecución")
-            secuencia = " → ".join([f"P{p['pid']}({p['prioridad']})" for p in st.session_state.procesos_calculados_pri])
-            st.success(f"**Orden de ejecución:** {secuencia}")
-        
+        mostrar_reproduccion()
+
         with st.expander("📋 Ver detalles de procesos calculados"):
             st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_pri))
+
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_pri
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                st.json(rendimiento, expanded=False)
     
     with st.expander("📚 Explicación Detallada del Algoritmo de Prioridad"):
         st.markdown("""
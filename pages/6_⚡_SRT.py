@@ -1,13 +1,18 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from utils.srt import calcular_srt
-from utils.visualizacion import crear_grafico_gantt, mostrar_metricas
-from utils.helpers import validar_procesos, calcular_tiempo_total
+from utils.cache import ejecutar_simulacion
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.visualizacion import GraficoGantt, tema_gantt, mostrar_metricas
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.helpers import calcular_tiempo_total
+from utils.generador import generar_lista, PATRONES_LLEGADA, DISTRIBUCIONES_DURACION
 
 st.set_page_config(
     page_title="SRT - Simulador Planificación",
@@ -23,6 +28,91 @@ if 'tiempo_actual_srt' not in st.session_state:
     st.session_state.tiempo_actual_srt = 0
 if 'simulacion_iniciada_srt' not in st.session_state:
     st.session_state.simulacion_iniciada_srt = False
+if 'gantt_srt' not in st.session_state:
+    st.session_state.gantt_srt = None
+if 'linea_srt' not in st.session_state:
+    st.session_state.linea_srt = None
+if 'rendimiento_srt' not in st.session_state:
+    st.session_state.rendimiento_srt = None
+
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_srt = min(max(st.session_state.tiempo_actual_srt + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion():
+    tiempo_actual = st.session_state.tiempo_actual_srt
+    tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_srt)
+
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_srt",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_srt is None or st.session_state.linea_srt[0] != tema:
+            st.session_state.linea_srt = (tema, *html_linea_tiempo([datos_linea_tiempo(
+                st.session_state.procesos_calculados_srt,
+                "SRT"
+            )], tema=tema))
+        _, html, alto = st.session_state.linea_srt
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.button("⏮️ Reiniciar", key="reiniciar_srt", use_container_width=True, on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        with col2:
+            st.button("◀️ Retroceder", key="retroceder_srt", use_container_width=True, on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        with col3:
+            st.button("Avanzar ▶️", key="avanzar_srt", use_container_width=True, on_click=mover_tiempo, args=(1, tiempo_total))
+
+        with col4:
+            st.button("▶️▶️ Ver Todo", key="vertodo_srt", use_container_width=True, on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_srt / tiempo_total)
+        else:
+            st.progress(0)
+
+        if st.session_state.gantt_srt is None:
+            st.session_state.gantt_srt = GraficoGantt(
+                st.session_state.procesos_calculados_srt,
+                "SRT"
+            )
+        st.image(fotograma(st.session_state.gantt_srt, st.session_state.tiempo_actual_srt, tema=tema_gantt(st.context)), use_container_width=True)
+
+    if en_navegador or st.session_state.tiempo_actual_srt == tiempo_total:
+        st.markdown("---")
+        st.subheader("📈 Métricas Finales SRT")
+
+        metricas = mostrar_metricas(st.session_state.procesos_calculados_srt)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
+        with col2:
+            st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
+        with col3:
+            st.metric("✅ Procesos Completados", metricas['procesos_completados'])
+
+        st.subheader("🔁 Análisis de Preempciones SRT")
+
+        total_preempciones = 0
+        for proceso in st.session_state.procesos_calculados_srt:
+            if 'ejecuciones' in proceso and len(proceso['ejecuciones']) > 1:
+                total_preempciones += len(proceso['ejecuciones']) - 1
+
+        st.info(f"**Total de preempciones:** {total_preempciones} cambios entre procesos")
+
+        with st.expander("🔍 Ver detalles de ejecuciones por proceso"):
+            for proceso in st.session_state.procesos_calculados_srt:
+                if 'ejecuciones' in proceso:
+                    ejecuciones_str = " + ".join([f"{dur}t@T{ini}" for ini, dur in proceso['ejecuciones']])
+                    st.write(f"**P{proceso['pid']}:** {ejecuciones_str} = {proceso['duracion']}t total")
 
 def main():
     st.title("⚡ Algoritmo SRT (Shortest Remaining Time)")
@@ -75,6 +165,24 @@ def main():
             st.session_state.simulacion_iniciada_srt = False
             st.rerun()
     
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            llegadas = st.selectbox("Llegadas", PATRONES_LLEGADA, key="gen_llegadas_srt")
+        with col2:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_srt")
+        with col3:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_srt")
+        if st.button("🎲 Generar Procesos", key="generar_srt", use_container_width=True):
+            st.session_state.procesos_srt = generar_lista(num_procesos, llegadas=llegadas, duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20, tamano_rafaga=3)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"llegada_srt_{i}", None)
+                st.session_state.pop(f"duracion_srt_{i}", None)
+            st.session_state.simulacion_iniciada_srt = False
+            st.rerun()
+    
     st.subheader("✏️ Definir Procesos SRT")
     
     if not st.session_state.procesos_srt:
@@ -125,15 +233,16 @@ def main():
     
     with col1:
         if st.button("🚀 Ejecutar Simulación SRT", type="primary", use_container_width=True):
-            es_valido, mensaje = validar_procesos(st.session_state.procesos_srt)
+            with st.spinner("Calculando planificación SRT..."), medir() as medicion:
+                es_valido, mensaje, procesos_calculados = ejecutar_simulacion('srt', st.session_state.procesos_srt)
             if es_valido:
-                with st.spinner("Calculando planificación SRT..."):
-                    procesos_calculados = calcular_srt(st.session_state.procesos_srt.copy())
-                    
-                    st.session_state.procesos_calculados_srt = procesos_calculados
-                    st.session_state.tiempo_actual_srt = 0
-                    st.session_state.simulacion_iniciada_srt = True
-                    st.rerun()
+                st.session_state.procesos_calculados_srt = procesos_calculados
+                st.session_state.gantt_srt = None
+                st.session_state.linea_srt = None
+                st.session_state.tiempo_actual_srt = 0
+                st.session_state.rendimiento_srt = medicion.a_dict()
+                st.session_state.simulacion_iniciada_srt = True
+                st.rerun()
             else:
                 st.error(f"❌ {mensaje}")
     
@@ -146,78 +255,20 @@ def main():
     if st.session_state.get("simulacion_iniciada_srt", False):
         st.header("📊 Resultados de la Simulación SRT")
         
-        tiempo_actual = st.session_state.tiempo_actual_srt
-        tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_srt)
-        
-        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if st.button("⏮️ Reiniciar", key="reiniciar_srt", use_container_width=True):
-                st.session_state.tiempo_actual_srt = 0
-                st.rerun()
-        
-        with col2:
-            if st.button("◀️ Retroceder", key="retroceder_srt", use_container_width=True):
-                if st.session_state.tiempo_actual_srt > 0:
-                    st.session_state.tiempo_actual_srt -= 1
-                    st.rerun()
-        
-        with col3:
-            if st.button("Avanzar ▶️", key="avanzar_srt", use_container_width=True):
-                if st.session_state.tiempo_actual_srt < tiempo_total:
-                    st.session_state.tiempo_actual_srt += 1
-                    st.rerun()
-        
-        with col4:
-            if st.button("▶️▶️ Ver Todo", key="vertodo_srt", use_container_width=True):
-                st.session_state.tiempo_actual_srt = tiempo_total
-                st.rerun()
-        
-        if tiempo_total > 0:
-            st.progress(st.session_state.tiempo_actual_srt / tiempo_total)
-        else:
-            st.progress(0)
-        
-        fig = crear_grafico_gantt(
-            st.session_state.procesos_calculados_srt,
-            st.session_state.tiempo_actual_srt,
-            "SRT"
-        )
-        st.pyplot(fig)
-        
-        if st.session_state.tiempo_actual_srt == tiempo_total:
-            st.markdown("---")
-            st.subheader("📈 Métricas Finales SRT")
-            
-            metricas = mostrar_metricas(st.session_state.procesos_calculados_srt)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
-            with col2:
-                st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
-            with col3:
-                st.metric("✅ Procesos Completados", metricas['procesos_completados'])
-            
-            st.subheader("🔁 Análisis de Preempciones SRT")
-            
-            total_preempciones = 0
-            for proceso in st.session_state.procesos_calculados_srt:
-                if 'ejecuciones' in proceso and len(proceso['ejecuciones']) > 1:
-                    total_preempciones += len(proceso['ejecuciones']) - 1
-            
-            st.info(f"**Total de preempciones:** {total_preempciones} cambios entre procesos")
-            
-            with st.expander("🔍 Ver detalles de ejecuciones por proceso"):
-                for proceso in st.session_state.procesos_calculados_srt:
-                    if 'ejecuciones' in proceso:
-                        ejecuciones_str = " + ".join([f"{dur}t@T{ini}" for ini, dur in proceso['ejecuciones']])
-                        st.write(f"**P{proceso['pid']}:** {ejecuciones_str} = {proceso['duracion']}t total")
-        
+        mostrar_reproduccion()
+
         with st.expander("📋 Ver detalles de procesos calculados"):
             st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_srt))
+
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_srt
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                st.json(rendimiento, expanded=False)
     
     with st.expander("📚 Explicación Detallada del Algoritmo SRT"):
         st.markdown("""
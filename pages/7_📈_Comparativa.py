@@ -0,0 +1,364 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.comparativa import comparar_algoritmos, resumir_comparativa
+from utils.barrido import opciones_procesos_trabajo, nombre_procesos_trabajo
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.algoritmos import ALGORITMOS, NOMBRES
+from utils.montecarlo import evaluar_montecarlo
+from utils.visualizacion import GraficoGantt, tema_gantt, crear_grafico_montecarlo
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.generador import generar_lista, PATRONES_LLEGADA, DISTRIBUCIONES_DURACION
+
+st.set_page_config(
+    page_title="Comparativa - Simulador Planificación",
+    page_icon="📈",
+    layout="wide"
+)
+
+if 'procesos_cmp' not in st.session_state:
+    st.session_state.procesos_cmp = []
+if 'resultados_cmp' not in st.session_state:
+    st.session_state.resultados_cmp = {}
+if 'tiempo_actual_cmp' not in st.session_state:
+    st.session_state.tiempo_actual_cmp = 0
+if 'simulacion_iniciada_cmp' not in st.session_state:
+    st.session_state.simulacion_iniciada_cmp = False
+if 'gantt_cmp' not in st.session_state:
+    st.session_state.gantt_cmp = {}
+if 'linea_cmp' not in st.session_state:
+    st.session_state.linea_cmp = None
+if 'rendimiento_cmp' not in st.session_state:
+    st.session_state.rendimiento_cmp = None
+if 'montecarlo_cmp' not in st.session_state:
+    st.session_state.montecarlo_cmp = None
+
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_cmp = min(max(st.session_state.tiempo_actual_cmp + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion(resultados, tiempo_total):
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_cmp",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_cmp is None or st.session_state.linea_cmp[0] != tema:
+            st.session_state.linea_cmp = (tema, *html_linea_tiempo([
+                datos_linea_tiempo(resultados[algoritmo], NOMBRES[algoritmo], tiempo_total)
+                for algoritmo in ALGORITMOS
+            ], tema=tema))
+        _, html, alto = st.session_state.linea_cmp
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {st.session_state.tiempo_actual_cmp} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.button("⏮️ Reiniciar", key="reiniciar_cmp", use_container_width=True, on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        with col2:
+            st.button("◀️ Retroceder", key="retroceder_cmp", use_container_width=True, on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        with col3:
+            st.button("Avanzar ▶️", key="avanzar_cmp", use_container_width=True, on_click=mover_tiempo, args=(1, tiempo_total))
+
+        with col4:
+            st.button("▶️▶️ Ver Todo", key="vertodo_cmp", use_container_width=True, on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_cmp / tiempo_total)
+        else:
+            st.progress(0)
+
+        # Todos los Gantt comparten el mismo eje de tiempo para poder alinearlos
+        for algoritmo in ALGORITMOS:
+            if algoritmo not in st.session_state.gantt_cmp:
+                st.session_state.gantt_cmp[algoritmo] = GraficoGantt(
+                    resultados[algoritmo],
+                    NOMBRES[algoritmo],
+                    tiempo_total
+                )
+            st.image(fotograma(st.session_state.gantt_cmp[algoritmo], st.session_state.tiempo_actual_cmp, tema=tema_gantt(st.context)), use_container_width=True)
+
+def main():
+    st.title("📈 Comparativa de Algoritmos")
+
+    st.markdown("""
+    Ejecuta **FCFS, SJF, Prioridad, Round Robin, SRT, Prioridad Preemptiva y MLFQ** sobre la misma carga de procesos
+    y compara sus métricas y diagramas de Gantt lado a lado.
+    """)
+
+    with st.sidebar:
+        st.header("ℹ️ Acerca de la Comparativa")
+        st.info("""
+        **Características:**
+        - ✅ Una sola carga para todos los algoritmos
+        - ✅ Validación y ordenamiento compartidos
+        - ✅ Ejecución concurrente en cargas grandes
+        - ✅ Gantt alineados en el mismo eje de tiempo
+        - ✅ Evaluación Monte Carlo con intervalos de confianza
+        """)
+
+        if st.button("🏠 Volver al Inicio"):
+            st.switch_page("app.py")
+
+    st.header("⚙️ Configuración")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        num_procesos = st.number_input(
+            "Número de procesos",
+            min_value=1,
+            max_value=10,
+            value=4,
+            key="cmp_procesos"
+        )
+
+    with col2:
+        quantum = st.slider(
+            "Quantum para Round Robin (ticks)",
+            min_value=1,
+            max_value=10,
+            value=2,
+            key="cmp_quantum"
+        )
+
+    with col3:
+        cambio_contexto = st.number_input(
+            "Cambio de contexto RR (ticks)",
+            min_value=0,
+            max_value=5,
+            value=0,
+            key="cmp_cambio_contexto"
+        )
+
+    with col4:
+        envejecimiento = st.number_input(
+            "Envejecimiento Prioridad Preemptiva (ticks)",
+            min_value=0,
+            max_value=20,
+            value=0,
+            help="Ticks de espera para ganar un nivel de prioridad (0 = sin envejecimiento)",
+            key="cmp_envejecimiento"
+        )
+
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            llegadas = st.selectbox("Llegadas", PATRONES_LLEGADA, key="gen_llegadas_cmp")
+        with col2:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_cmp")
+        with col3:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_cmp")
+        if st.button("🎲 Generar Procesos", key="generar_cmp", use_container_width=True):
+            st.session_state.procesos_cmp = generar_lista(num_procesos, llegadas=llegadas, duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20, tamano_rafaga=3)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"llegada_cmp_{i}", None)
+                st.session_state.pop(f"duracion_cmp_{i}", None)
+                st.session_state.pop(f"prioridad_cmp_{i}", None)
+            st.session_state.simulacion_iniciada_cmp = False
+            st.rerun()
+
+    st.subheader("✏️ Definir Procesos")
+
+    if not st.session_state.procesos_cmp:
+        st.session_state.procesos_cmp = [
+            {'pid': i, 'llegada': i, 'duracion': (i+1)*2, 'prioridad': i}
+            for i in range(num_procesos)
+        ]
+
+    procesos_cmp = []
+    for i in range(num_procesos):
+        col1, col2, col3, col4 = st.columns([1, 2, 2, 2])
+        with col1:
+            st.write(f"**Proceso {i}**")
+        with col2:
+            llegada = st.number_input(
+                f"Llegada P{i}",
+                min_value=0,
+                value=st.session_state.procesos_cmp[i]['llegada'] if i < len(st.session_state.procesos_cmp) else i,
+                key=f"llegada_cmp_{i}"
+            )
+        with col3:
+            duracion = st.number_input(
+                f"Duración P{i}",
+                min_value=1,
+                value=st.session_state.procesos_cmp[i]['duracion'] if i < len(st.session_state.procesos_cmp) else (i+1)*2,
+                key=f"duracion_cmp_{i}"
+            )
+        with col4:
+            prioridad = st.number_input(
+                f"Prioridad P{i}",
+                min_value=0,
+                max_value=10,
+                value=st.session_state.procesos_cmp[i]['prioridad'] if i < len(st.session_state.procesos_cmp) else i,
+                help="Solo la usan Prioridad y Prioridad Preemptiva: 0 = Máxima prioridad",
+                key=f"prioridad_cmp_{i}"
+            )
+
+        procesos_cmp.append({
+            'pid': i,
+            'llegada': llegada,
+            'duracion': duracion,
+            'prioridad': prioridad
+        })
+
+    st.session_state.procesos_cmp = procesos_cmp
+
+    st.header("🎯 Comparativa")
+
+    procesos_trabajo = st.selectbox(
+        "Procesos de trabajo",
+        opciones_procesos_trabajo(),
+        format_func=nombre_procesos_trabajo,
+        help="Tamaño del pool de procesos para la comparativa y Monte Carlo. Automático usa el pool solo si la carga lo justifica",
+        key="cmp_procesos_trabajo"
+    )
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        if st.button("🚀 Ejecutar Comparativa", type="primary", use_container_width=True):
+            with st.spinner("Ejecutando todos los algoritmos..."), medir() as medicion:
+                es_valido, mensaje, resultados = comparar_algoritmos(
+                    st.session_state.procesos_cmp,
+                    quantum=quantum,
+                    cambio_contexto=cambio_contexto,
+                    envejecimiento=envejecimiento,
+                    procesos_trabajo=procesos_trabajo
+                )
+            if es_valido:
+                st.session_state.resultados_cmp = resultados
+                st.session_state.gantt_cmp = {}
+                st.session_state.linea_cmp = None
+                st.session_state.tiempo_actual_cmp = 0
+                st.session_state.rendimiento_cmp = medicion.a_dict()
+                st.session_state.simulacion_iniciada_cmp = True
+                st.rerun()
+            else:
+                st.error(f"❌ {mensaje}")
+
+    with col2:
+        if st.button("🔄 Reiniciar Comparativa", use_container_width=True):
+            st.session_state.simulacion_iniciada_cmp = False
+            st.session_state.tiempo_actual_cmp = 0
+            st.rerun()
+
+    if st.session_state.get("simulacion_iniciada_cmp", False):
+        resultados = st.session_state.resultados_cmp
+        metricas = resumir_comparativa(resultados)
+
+        st.header("📊 Métricas por Algoritmo")
+
+        df_metricas = pd.DataFrame(metricas)
+        df_metricas['algoritmo'] = df_metricas['algoritmo'].map(NOMBRES)
+        df_metricas = df_metricas.rename(columns={
+            'algoritmo': 'Algoritmo',
+            'retorno_promedio': 'Retorno Promedio',
+            'espera_promedio': 'Espera Promedio',
+            'respuesta_promedio': 'Respuesta Promedio',
+            'tiempo_total': 'Tiempo Total',
+            'throughput': 'Throughput'
+        })
+        st.dataframe(df_metricas, use_container_width=True, hide_index=True)
+
+        mejor_retorno = min(metricas, key=lambda m: m['retorno_promedio'])
+        mejor_espera = min(metricas, key=lambda m: m['espera_promedio'])
+        col1, col2 = st.columns(2)
+        with col1:
+            st.success(f"**Menor retorno promedio:** {NOMBRES[mejor_retorno['algoritmo']]} ({mejor_retorno['retorno_promedio']:.2f})")
+        with col2:
+            st.success(f"**Menor espera promedio:** {NOMBRES[mejor_espera['algoritmo']]} ({mejor_espera['espera_promedio']:.2f})")
+
+        st.header("📊 Diagramas de Gantt")
+
+        tiempo_total = max(m['tiempo_total'] for m in metricas)
+
+        mostrar_reproduccion(resultados, tiempo_total)
+
+        with st.expander("📋 Ver detalles de procesos calculados"):
+            for algoritmo in ALGORITMOS:
+                st.markdown(f"**{NOMBRES[algoritmo]}**")
+                st.dataframe(pd.DataFrame(resultados[algoritmo]))
+
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_cmp
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                if rendimiento['motores']:
+                    st.markdown("**Por algoritmo**")
+                    por_motor = pd.DataFrame.from_dict(rendimiento['motores'], orient='index')
+                    por_motor.index = [NOMBRES[algoritmo] for algoritmo in por_motor.index]
+                    por_motor['tiempo'] = (por_motor['tiempo'] * 1000).round(3)
+                    st.dataframe(por_motor.rename(columns={'tiempo': 'tiempo (ms)'}), use_container_width=True)
+                st.json(rendimiento, expanded=False)
+
+    st.header("🎲 Evaluación Monte Carlo")
+
+    st.markdown("""
+    Una sola carga no dice cómo se comporta un algoritmo en general. Aquí cada algoritmo corre sobre
+    **muchas cargas aleatorias** (las mismas para todos) con el quantum, cambio de contexto y
+    envejecimiento de arriba, y se reporta la media de cada métrica con su **intervalo de confianza**.
+    """)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        corridas = st.number_input("Cargas aleatorias", min_value=10, max_value=100_000, value=1000, step=100, key="mc_corridas")
+        nivel_confianza = st.selectbox("Nivel de confianza", (0.90, 0.95, 0.99), index=1, format_func=lambda n: f"{n:.0%}", key="mc_confianza")
+    with col2:
+        procesos_por_carga = st.number_input("Procesos por carga", min_value=2, max_value=500, value=20, key="mc_procesos")
+        llegadas_mc = st.selectbox("Llegadas", PATRONES_LLEGADA, key="mc_llegadas")
+    with col3:
+        semilla_mc = st.number_input("Semilla", min_value=0, value=0, key="mc_semilla")
+        duraciones_mc = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="mc_duraciones")
+
+    if st.button("🎲 Ejecutar Monte Carlo", use_container_width=True):
+        with st.spinner(f"Simulando {corridas} cargas por algoritmo..."):
+            resumen, _ = evaluar_montecarlo(
+                corridas, procesos_por_carga,
+                quantum=quantum,
+                cambio_contexto=cambio_contexto,
+                envejecimiento=envejecimiento,
+                semilla=semilla_mc,
+                nivel_confianza=nivel_confianza,
+                procesos_trabajo=procesos_trabajo,
+                llegadas=llegadas_mc,
+                duraciones=duraciones_mc
+            )
+        st.session_state.montecarlo_cmp = (resumen, nivel_confianza)
+
+    if st.session_state.montecarlo_cmp is not None:
+        resumen, confianza = st.session_state.montecarlo_cmp
+        st.caption(f"{resumen[0]['corridas']} cargas · intervalos al {confianza:.0%}")
+
+        df_mc = pd.DataFrame([
+            {
+                'Algoritmo': NOMBRES[fila['algoritmo']],
+                'Retorno Promedio': f"{fila['retorno_promedio']:.2f} ± {fila['retorno_promedio_ic']:.2f}",
+                'Espera Promedio': f"{fila['espera_promedio']:.2f} ± {fila['espera_promedio_ic']:.2f}",
+                'Respuesta Promedio': f"{fila['respuesta_promedio']:.2f} ± {fila['respuesta_promedio_ic']:.2f}",
+                'Throughput': f"{fila['throughput']:.3f} ± {fila['throughput_ic']:.3f}",
+            }
+            for fila in resumen
+        ])
+        st.dataframe(df_mc, use_container_width=True, hide_index=True)
+        st.pyplot(crear_grafico_montecarlo(resumen, NOMBRES))
+
+if __name__ == "__main__":
+    main()
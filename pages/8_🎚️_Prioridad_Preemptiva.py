@@ -0,0 +1,362 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.cache import ejecutar_simulacion
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.visualizacion import GraficoGantt, tema_gantt, mostrar_metricas
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.helpers import calcular_tiempo_total
+from utils.generador import generar_lista, PATRONES_LLEGADA, DISTRIBUCIONES_DURACION
+
+st.set_page_config(
+    page_title="Prioridad Preemptiva - Simulador Planificación",
+    page_icon="🎚️",
+    layout="wide"
+)
+
+if 'procesos_prp' not in st.session_state:
+    st.session_state.procesos_prp = []
+if 'procesos_calculados_prp' not in st.session_state:
+    st.session_state.procesos_calculados_prp = []
+if 'tiempo_actual_prp' not in st.session_state:
+    st.session_state.tiempo_actual_prp = 0
+if 'simulacion_iniciada_prp' not in st.session_state:
+    st.session_state.simulacion_iniciada_prp = False
+if 'gantt_prp' not in st.session_state:
+    st.session_state.gantt_prp = None
+if 'linea_prp' not in st.session_state:
+    st.session_state.linea_prp = None
+if 'rendimiento_prp' not in st.session_state:
+    st.session_state.rendimiento_prp = None
+
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_prp = min(max(st.session_state.tiempo_actual_prp + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion():
+    tiempo_actual = st.session_state.tiempo_actual_prp
+    tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_prp)
+
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_prp",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_prp is None or st.session_state.linea_prp[0] != tema:
+            st.session_state.linea_prp = (tema, *html_linea_tiempo([datos_linea_tiempo(
+                st.session_state.procesos_calculados_prp,
+                "Prioridad Preemptiva"
+            )], tema=tema))
+        _, html, alto = st.session_state.linea_prp
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.button("⏮️ Reiniciar", key="reiniciar_prp", use_container_width=True, on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        with col2:
+            st.button("◀️ Retroceder", key="retroceder_prp", use_container_width=True, on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        with col3:
+            st.button("Avanzar ▶️", key="avanzar_prp", use_container_width=True, on_click=mover_tiempo, args=(1, tiempo_total))
+
+        with col4:
+            st.button("▶️▶️ Ver Todo", key="vertodo_prp", use_container_width=True, on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_prp / tiempo_total)
+        else:
+            st.progress(0)
+
+        if st.session_state.gantt_prp is None:
+            st.session_state.gantt_prp = GraficoGantt(
+                st.session_state.procesos_calculados_prp,
+                "Prioridad Preemptiva"
+            )
+        st.image(fotograma(st.session_state.gantt_prp, st.session_state.tiempo_actual_prp, tema=tema_gantt(st.context)), use_container_width=True)
+
+    if en_navegador or st.session_state.tiempo_actual_prp == tiempo_total:
+        st.markdown("---")
+        st.subheader("📈 Métricas Finales Prioridad Preemptiva")
+
+        metricas = mostrar_metricas(st.session_state.procesos_calculados_prp)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
+        with col2:
+            st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
+        with col3:
+            st.metric("✅ Procesos Completados", metricas['procesos_completados'])
+
+        st.subheader("🎯 Análisis por Niveles de Prioridad")
+
+        df_analisis = pd.DataFrame(st.session_state.procesos_calculados_prp)
+        df_analisis['Nivel'] = df_analisis['prioridad'].apply(
+            lambda x: "Alta" if x <= 3 else "Media" if x <= 6 else "Baja"
+        )
+
+        stats_prioridad = df_analisis.groupby('Nivel').agg({
+            'retorno': 'mean',
+            'espera': 'mean',
+            'pid': 'count'
+        }).round(2)
+
+        stats_prioridad.columns = ['Retorno Promedio', 'Espera Promedio', 'Cantidad Procesos']
+        st.dataframe(stats_prioridad, use_container_width=True)
+
+        st.subheader("🔁 Análisis de Preempciones")
+
+        total_preempciones = 0
+        for proceso in st.session_state.procesos_calculados_prp:
+            if 'ejecuciones' in proceso and len(proceso['ejecuciones']) > 1:
+                total_preempciones += len(proceso['ejecuciones']) - 1
+
+        st.info(f"**Total de preempciones:** {total_preempciones} cambios entre procesos")
+
+        with st.expander("🔍 Ver detalles de ejecuciones por proceso"):
+            for proceso in st.session_state.procesos_calculados_prp:
+                if 'ejecuciones' in proceso:
+                    ejecuciones_str = " + ".join([f"{dur}t@T{ini}" for ini, dur in proceso['ejecuciones']])
+                    st.write(f"**P{proceso['pid']} (prioridad {proceso['prioridad']}):** {ejecuciones_str} = {proceso['duracion']}t total")
+
+def main():
+    st.title("🎚️ Prioridad Preemptiva con Envejecimiento")
+
+    st.markdown("""
+    La **Prioridad Preemptiva** siempre ejecuta el proceso de mayor prioridad disponible:
+    si llega uno más prioritario, **interrumpe** al que está en CPU. El **envejecimiento**
+    mejora la prioridad de los procesos que esperan para que ninguno quede sin ejecutarse.
+    Menor número = mayor prioridad (0 es la más alta).
+    """)
+
+    with st.sidebar:
+        st.header("ℹ️ Acerca de Prioridad Preemptiva")
+        st.info("""
+        **Características:**
+        - ✅ Preemptivo
+        - ✅ Respuesta inmediata a procesos críticos
+        - ✅ Envejecimiento contra la inanición
+        - ❌ Más cambios de contexto
+        - ⚠️ Requiere definir prioridades
+        """)
+
+        st.header("📊 Métricas Clave")
+        st.metric("Complejidad por evento", "O(log n)")
+        st.metric("Preemptivo", "Sí")
+        st.metric("Inanición", "No (con envejecimiento)")
+
+        if st.button("🏠 Volver al Inicio"):
+            st.switch_page("app.py")
+
+    st.header("📥 Configuración de Procesos")
+
+    col1, col2, col3 = st.columns([2, 2, 1])
+
+    with col1:
+        num_procesos = st.number_input(
+            "Número de procesos",
+            min_value=1,
+            max_value=8,
+            value=4,
+            key="prp_procesos"
+        )
+
+    with col2:
+        envejecimiento = st.slider(
+            "Envejecimiento (ticks por nivel)",
+            min_value=0,
+            max_value=20,
+            value=0,
+            help="Cada cuántos ticks de espera un proceso gana un nivel de prioridad (0 = sin envejecimiento)",
+            key="prp_envejecimiento"
+        )
+
+    with col3:
+        st.write("")
+        st.write("")
+        if st.button("🔄 Reiniciar Procesos", use_container_width=True):
+            st.session_state.procesos_prp = []
+            st.session_state.simulacion_iniciada_prp = False
+            st.rerun()
+
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            llegadas = st.selectbox("Llegadas", PATRONES_LLEGADA, key="gen_llegadas_prp")
+        with col2:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_prp")
+        with col3:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_prp")
+        if st.button("🎲 Generar Procesos", key="generar_prp", use_container_width=True):
+            st.session_state.procesos_prp = generar_lista(num_procesos, llegadas=llegadas, duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20, tamano_rafaga=3)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"llegada_prp_{i}", None)
+                st.session_state.pop(f"duracion_prp_{i}", None)
+                st.session_state.pop(f"prioridad_prp_{i}", None)
+            st.session_state.simulacion_iniciada_prp = False
+            st.rerun()
+
+    st.subheader("✏️ Definir Procesos y Prioridades")
+
+    st.info("💡 **Recordatorio:** Menor número = Mayor prioridad (0 es la más alta)")
+
+    if not st.session_state.procesos_prp:
+        st.session_state.procesos_prp = [
+            {'pid': i, 'llegada': i, 'duracion': (i+1)*2, 'prioridad': num_procesos - 1 - i}
+            for i in range(num_procesos)
+        ]
+
+    procesos_prp = []
+    for i in range(num_procesos):
+        col1, col2, col3, col4 = st.columns([1, 2, 2, 2])
+        with col1:
+            st.write(f"**Proceso {i}**")
+        with col2:
+            llegada = st.number_input(
+                f"Llegada P{i}",
+                min_value=0,
+                value=st.session_state.procesos_prp[i]['llegada'] if i < len(st.session_state.procesos_prp) else i,
+                key=f"llegada_prp_{i}"
+            )
+        with col3:
+            duracion = st.number_input(
+                f"Duración P{i}",
+                min_value=1,
+                value=st.session_state.procesos_prp[i]['duracion'] if i < len(st.session_state.procesos_prp) else (i+1)*2,
+                key=f"duracion_prp_{i}"
+            )
+        with col4:
+            prioridad = st.number_input(
+                f"Prioridad P{i}",
+                min_value=0,
+                max_value=10,
+                value=st.session_state.procesos_prp[i]['prioridad'] if i < len(st.session_state.procesos_prp) else 0,
+                help="0 = Máxima prioridad, 10 = Mínima prioridad",
+                key=f"prioridad_prp_{i}"
+            )
+
+        procesos_prp.append({
+            'pid': i,
+            'llegada': llegada,
+            'duracion': duracion,
+            'prioridad': prioridad
+        })
+
+    st.session_state.procesos_prp = procesos_prp
+
+    if st.session_state.procesos_prp:
+        st.subheader("📋 Procesos Definidos")
+        df_prp = pd.DataFrame(st.session_state.procesos_prp)
+        df_prp['Proceso'] = df_prp['pid'].apply(lambda x: f'P{x}')
+        df_prp['Nivel Prioridad'] = df_prp['prioridad'].apply(
+            lambda x: "🔥 Máxima" if x == 0 else "✅ Alta" if x <= 3 else "⚠️ Media" if x <= 6 else "🔻 Baja"
+        )
+        st.dataframe(df_prp[['Proceso', 'Nivel Prioridad', 'prioridad', 'llegada', 'duracion']],
+                    use_container_width=True)
+
+    st.header("🎯 Simulación Prioridad Preemptiva")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        if st.button("🚀 Ejecutar Simulación Prioridad Preemptiva", type="primary", use_container_width=True):
+            with st.spinner("Calculando planificación por prioridad preemptiva..."), medir() as medicion:
+                es_valido, mensaje, procesos_calculados = ejecutar_simulacion(
+                    'prioridad_preemptiva',
+                    st.session_state.procesos_prp,
+                    envejecimiento=envejecimiento
+                )
+            if es_valido:
+                st.session_state.procesos_calculados_prp = procesos_calculados
+                st.session_state.gantt_prp = None
+                st.session_state.linea_prp = None
+                st.session_state.tiempo_actual_prp = 0
+                st.session_state.rendimiento_prp = medicion.a_dict()
+                st.session_state.simulacion_iniciada_prp = True
+                st.rerun()
+            else:
+                st.error(f"❌ {mensaje}")
+
+    with col2:
+        if st.button("🔄 Reiniciar Simulación", use_container_width=True):
+            st.session_state.simulacion_iniciada_prp = False
+            st.session_state.tiempo_actual_prp = 0
+            st.rerun()
+
+    if st.session_state.get("simulacion_iniciada_prp", False):
+        st.header("📊 Resultados de la Simulación Prioridad Preemptiva")
+
+        mostrar_reproduccion()
+
+        with st.expander("📋 Ver detalles de procesos calculados"):
+            st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_prp))
+
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_prp
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                st.json(rendimiento, expanded=False)
+
+    with st.expander("📚 Explicación Detallada de Prioridad Preemptiva"):
+        st.markdown("""
+        ## 🎚️ Prioridad Preemptiva con Envejecimiento
+
+        **¿Cómo funciona?**
+
+        1. **Se ejecuta el proceso** con mayor prioridad (menor número) entre los que ya llegaron
+        2. **Si llega uno más prioritario**, interrumpe al actual, que vuelve a la cola
+        3. **Si hay empate**, gana el que llegó primero y el proceso en CPU no se interrumpe
+        4. **Con envejecimiento E**, cada E ticks de espera un proceso gana un nivel de prioridad (hasta 0)
+        5. **El proceso en CPU** conserva la prioridad con que fue despachado; si es interrumpido,
+           vuelve a la cola con su prioridad original y empieza a envejecer de nuevo
+
+        **Ejemplo práctico (sin envejecimiento):**
+        ```
+        Procesos: P0(llegada=0, duración=6, prioridad=3), P1(llegada=2, duración=2, prioridad=1)
+
+        Tiempo 0-2: Ejecuta P0 (único disponible)
+        Tiempo 2:   Llega P1 con prioridad 1 < 3 → interrumpe a P0
+        Tiempo 2-4: Ejecuta P1 hasta terminar
+        Tiempo 4-8: P0 retoma sus 4 ticks restantes
+        ```
+
+        **Envejecimiento sin recorrer la cola:**
+        - La prioridad efectiva de un proceso que espera desde el tiempo w es
+          `prioridad - (t - w) / E`
+        - Como el reloj t es el mismo para todos, el orden de la cola lo da la clave fija
+          `prioridad × E + w`: nadie se actualiza tick a tick y cada evento cuesta O(log n)
+        - El simulador calcula de antemano el instante en que el primero de la cola
+          alcanza al proceso en CPU y salta directamente a ese evento
+
+        **Ventajas:**
+        - ✅ **Respuesta inmediata** para procesos críticos
+        - ✅ **Sin inanición** con envejecimiento
+        - ✅ **Escalable** a cientos de miles de procesos
+
+        **Desventajas:**
+        - ❌ **Más cambios de contexto** que la versión no preemptiva
+        - ❌ **Elegir E** es un compromiso: pequeño favorece la equidad, grande respeta las prioridades
+
+        **Consejo:** Compara con la página de Prioridad (no preemptiva) usando la misma carga
+        y prueba distintos valores de envejecimiento para ver cómo cambia la espera de las prioridades bajas.
+        """)
+
+if __name__ == "__main__":
+    main()
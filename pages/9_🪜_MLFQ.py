@@ -0,0 +1,377 @@
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.cache import ejecutar_simulacion
+from utils.instrumentacion import medir, filas_rendimiento
+from utils.mlfq import resumir_niveles, DEGRADACIONES
+from utils.visualizacion import GraficoGantt, tema_gantt, mostrar_metricas
+from utils.fotogramas import fotograma
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.helpers import calcular_tiempo_total
+from utils.generador import generar_lista, PATRONES_LLEGADA, DISTRIBUCIONES_DURACION
+
+st.set_page_config(
+    page_title="MLFQ - Simulador Planificación",
+    page_icon="🪜",
+    layout="wide"
+)
+
+if 'procesos_mlfq' not in st.session_state:
+    st.session_state.procesos_mlfq = []
+if 'procesos_calculados_mlfq' not in st.session_state:
+    st.session_state.procesos_calculados_mlfq = []
+if 'quantums_calculados_mlfq' not in st.session_state:
+    st.session_state.quantums_calculados_mlfq = ()
+if 'tiempo_actual_mlfq' not in st.session_state:
+    st.session_state.tiempo_actual_mlfq = 0
+if 'simulacion_iniciada_mlfq' not in st.session_state:
+    st.session_state.simulacion_iniciada_mlfq = False
+if 'gantt_mlfq' not in st.session_state:
+    st.session_state.gantt_mlfq = None
+if 'linea_mlfq' not in st.session_state:
+    st.session_state.linea_mlfq = None
+if 'rendimiento_mlfq' not in st.session_state:
+    st.session_state.rendimiento_mlfq = None
+
+def mover_tiempo(paso, tiempo_total):
+    st.session_state.tiempo_actual_mlfq = min(max(st.session_state.tiempo_actual_mlfq + paso, 0), tiempo_total)
+
+# Los controles de reproducción vuelven a ejecutar solo este fragmento, no
+# la página con los widgets de entrada de procesos
+@st.fragment
+def mostrar_reproduccion():
+    tiempo_actual = st.session_state.tiempo_actual_mlfq
+    tiempo_total = calcular_tiempo_total(st.session_state.procesos_calculados_mlfq)
+
+    en_navegador = st.toggle("🎞️ Animación en el navegador", key="animacion_mlfq",
+                             help="Reproduce, pausa, arrastra y haz zoom sin volver a ejecutar la página")
+    if en_navegador:
+        tema = tema_gantt(st.context)
+        if st.session_state.linea_mlfq is None or st.session_state.linea_mlfq[0] != tema:
+            st.session_state.linea_mlfq = (tema, *html_linea_tiempo([datos_linea_tiempo(
+                st.session_state.procesos_calculados_mlfq,
+                "MLFQ"
+            )], tema=tema))
+        _, html, alto = st.session_state.linea_mlfq
+        components.html(html, height=alto)
+    else:
+        st.subheader(f"⏰ Tiempo Actual: {tiempo_actual} / {tiempo_total}")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.button("⏮️ Reiniciar", key="reiniciar_mlfq", use_container_width=True, on_click=mover_tiempo, args=(-tiempo_total, tiempo_total))
+
+        with col2:
+            st.button("◀️ Retroceder", key="retroceder_mlfq", use_container_width=True, on_click=mover_tiempo, args=(-1, tiempo_total))
+
+        with col3:
+            st.button("Avanzar ▶️", key="avanzar_mlfq", use_container_width=True, on_click=mover_tiempo, args=(1, tiempo_total))
+
+        with col4:
+            st.button("▶️▶️ Ver Todo", key="vertodo_mlfq", use_container_width=True, on_click=mover_tiempo, args=(tiempo_total, tiempo_total))
+
+        if tiempo_total > 0:
+            st.progress(st.session_state.tiempo_actual_mlfq / tiempo_total)
+        else:
+            st.progress(0)
+
+        if st.session_state.gantt_mlfq is None:
+            st.session_state.gantt_mlfq = GraficoGantt(
+                st.session_state.procesos_calculados_mlfq,
+                "MLFQ"
+            )
+        st.image(fotograma(st.session_state.gantt_mlfq, st.session_state.tiempo_actual_mlfq, tema=tema_gantt(st.context)), use_container_width=True)
+
+    if en_navegador or st.session_state.tiempo_actual_mlfq == tiempo_total:
+        st.markdown("---")
+        st.subheader("📈 Métricas Finales MLFQ")
+
+        metricas = mostrar_metricas(st.session_state.procesos_calculados_mlfq)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("⏱️ Retorno Promedio", f"{metricas['retorno_promedio']:.2f}")
+        with col2:
+            st.metric("⏳ Espera Promedio", f"{metricas['espera_promedio']:.2f}")
+        with col3:
+            st.metric("✅ Procesos Completados", metricas['procesos_completados'])
+
+        st.subheader("🪜 Residencia por Nivel")
+
+        niveles = resumir_niveles(
+            st.session_state.procesos_calculados_mlfq,
+            st.session_state.quantums_calculados_mlfq
+        )
+        df_niveles = pd.DataFrame(niveles).rename(columns={
+            'nivel': 'Nivel',
+            'quantum': 'Quantum',
+            'ticks_cpu': 'Ticks de CPU',
+            'porcentaje_cpu': '% de CPU',
+            'tramos': 'Tramos',
+            'procesos': 'Procesos que pasaron',
+            'terminados': 'Terminaron aquí'
+        })
+        st.dataframe(df_niveles.round(2), use_container_width=True, hide_index=True)
+
+        with st.expander("🔍 Ver recorrido de cada proceso por los niveles"):
+            for proceso in st.session_state.procesos_calculados_mlfq:
+                recorrido = " → ".join(
+                    f"N{nivel}:{dur}t@T{ini}"
+                    for (ini, dur), nivel in zip(proceso['ejecuciones'], proceso['niveles'])
+                )
+                st.write(f"**P{proceso['pid']}:** {recorrido}")
+
+def main():
+    st.title("🪜 Multilevel Feedback Queue (MLFQ)")
+
+    st.markdown("""
+    **MLFQ** reparte los procesos en varias colas con distinta prioridad y quantum. Todo proceso
+    entra al nivel más alto; el que agota su quantum **baja de nivel**, de modo que los procesos
+    cortos e interactivos terminan arriba y los largos descienden. El **refuerzo periódico**
+    sube a todos al nivel más alto para que ninguno quede sin ejecutarse.
+    """)
+
+    with st.sidebar:
+        st.header("ℹ️ Acerca de MLFQ")
+        st.info("""
+        **Características:**
+        - ✅ Preemptivo
+        - ✅ No necesita conocer la duración
+        - ✅ Favorece a los procesos cortos
+        - ✅ Refuerzo contra la inanición
+        - ❌ Muchos parámetros que ajustar
+        """)
+
+        st.header("📊 Métricas Clave")
+        st.metric("Despacho", "O(1)")
+        st.metric("Preemptivo", "Sí")
+        st.metric("Estructura", "Deque por nivel + mapa de bits")
+
+        if st.button("🏠 Volver al Inicio"):
+            st.switch_page("app.py")
+
+    st.header("⚙️ Configuración de Niveles")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        num_niveles = st.number_input(
+            "Número de niveles",
+            min_value=1,
+            max_value=5,
+            value=3,
+            key="mlfq_niveles"
+        )
+
+    with col2:
+        refuerzo = st.number_input(
+            "Refuerzo periódico (ticks)",
+            min_value=0,
+            max_value=200,
+            value=0,
+            help="Cada cuántos ticks todos los procesos vuelven al nivel 0 (0 = sin refuerzo)",
+            key="mlfq_refuerzo"
+        )
+
+    with col3:
+        degradacion = st.selectbox(
+            "Regla de degradación",
+            DEGRADACIONES,
+            help="acumulado: baja al sumar su quantum en el nivel aunque sea interrumpido; "
+                 "tramo: baja solo si usa un quantum completo de una vez",
+            key="mlfq_degradacion"
+        )
+
+    columnas_quantum = st.columns(num_niveles)
+    quantums = []
+    for nivel, columna in enumerate(columnas_quantum):
+        with columna:
+            quantums.append(st.number_input(
+                f"Quantum nivel {nivel}",
+                min_value=1,
+                max_value=50,
+                value=2 ** (nivel + 1),
+                key=f"mlfq_quantum_{nivel}"
+            ))
+
+    st.header("📥 Configuración de Procesos")
+
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        num_procesos = st.number_input(
+            "Número de procesos",
+            min_value=1,
+            max_value=8,
+            value=4,
+            key="mlfq_procesos"
+        )
+
+    with col2:
+        st.write("")
+        st.write("")
+        if st.button("🔄 Reiniciar Procesos", use_container_width=True):
+            st.session_state.procesos_mlfq = []
+            st.session_state.simulacion_iniciada_mlfq = False
+            st.rerun()
+
+    with st.expander("🎲 Generar carga aleatoria"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            llegadas = st.selectbox("Llegadas", PATRONES_LLEGADA, key="gen_llegadas_mlfq")
+        with col2:
+            duraciones = st.selectbox("Duraciones", DISTRIBUCIONES_DURACION, key="gen_duraciones_mlfq")
+        with col3:
+            semilla = st.number_input("Semilla", min_value=0, value=0, key="gen_semilla_mlfq")
+        if st.button("🎲 Generar Procesos", key="generar_mlfq", use_container_width=True):
+            st.session_state.procesos_mlfq = generar_lista(num_procesos, llegadas=llegadas, duraciones=duraciones, semilla=semilla, media_duracion=4, duracion_maxima=20, tamano_rafaga=3)
+            # Los campos de entrada conservan su valor por clave: se descartan para
+            # que tomen los valores generados
+            for i in range(num_procesos):
+                st.session_state.pop(f"llegada_mlfq_{i}", None)
+                st.session_state.pop(f"duracion_mlfq_{i}", None)
+            st.session_state.simulacion_iniciada_mlfq = False
+            st.rerun()
+
+    st.subheader("✏️ Definir Procesos")
+
+    if not st.session_state.procesos_mlfq:
+        st.session_state.procesos_mlfq = [
+            {'pid': i, 'llegada': i, 'duracion': (i+1)*3, 'prioridad': 0}
+            for i in range(num_procesos)
+        ]
+
+    procesos_mlfq = []
+    for i in range(num_procesos):
+        col1, col2, col3 = st.columns([1, 2, 2])
+        with col1:
+            st.write(f"**Proceso {i}**")
+        with col2:
+            llegada = st.number_input(
+                f"Llegada P{i}",
+                min_value=0,
+                value=st.session_state.procesos_mlfq[i]['llegada'] if i < len(st.session_state.procesos_mlfq) else i,
+                key=f"llegada_mlfq_{i}"
+            )
+        with col3:
+            duracion = st.number_input(
+                f"Duración P{i}",
+                min_value=1,
+                value=st.session_state.procesos_mlfq[i]['duracion'] if i < len(st.session_state.procesos_mlfq) else (i+1)*3,
+                key=f"duracion_mlfq_{i}"
+            )
+
+        procesos_mlfq.append({
+            'pid': i,
+            'llegada': llegada,
+            'duracion': duracion,
+            'prioridad': 0
+        })
+
+    st.session_state.procesos_mlfq = procesos_mlfq
+
+    st.header("🎯 Simulación MLFQ")
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        if st.button("🚀 Ejecutar Simulación MLFQ", type="primary", use_container_width=True):
+            with st.spinner("Calculando planificación MLFQ..."), medir() as medicion:
+                es_valido, mensaje, procesos_calculados = ejecutar_simulacion(
+                    'mlfq',
+                    st.session_state.procesos_mlfq,
+                    quantums=tuple(quantums),
+                    refuerzo=refuerzo,
+                    degradacion=degradacion
+                )
+            if es_valido:
+                st.session_state.procesos_calculados_mlfq = procesos_calculados
+                st.session_state.quantums_calculados_mlfq = tuple(quantums)
+                st.session_state.gantt_mlfq = None
+                st.session_state.linea_mlfq = None
+                st.session_state.tiempo_actual_mlfq = 0
+                st.session_state.rendimiento_mlfq = medicion.a_dict()
+                st.session_state.simulacion_iniciada_mlfq = True
+                st.rerun()
+            else:
+                st.error(f"❌ {mensaje}")
+
+    with col2:
+        if st.button("🔄 Reiniciar Simulación", use_container_width=True):
+            st.session_state.simulacion_iniciada_mlfq = False
+            st.session_state.tiempo_actual_mlfq = 0
+            st.rerun()
+
+    if st.session_state.get("simulacion_iniciada_mlfq", False):
+        st.header("📊 Resultados de la Simulación MLFQ")
+
+        mostrar_reproduccion()
+
+        with st.expander("📋 Ver detalles de procesos calculados"):
+            st.dataframe(pd.DataFrame(st.session_state.procesos_calculados_mlfq))
+
+        with st.expander("⏱️ Rendimiento del motor"):
+            rendimiento = st.session_state.rendimiento_mlfq
+            if rendimiento is None:
+                st.info("Ejecuta la simulación para medir el motor.")
+            else:
+                if rendimiento['contadores'].get('aciertos_cache'):
+                    st.info("♻️ Resultado tomado de la caché: el motor no volvió a ejecutarse.")
+                st.dataframe(pd.DataFrame(filas_rendimiento(rendimiento)), use_container_width=True, hide_index=True)
+                st.json(rendimiento, expanded=False)
+
+    with st.expander("📚 Explicación Detallada de MLFQ"):
+        st.markdown("""
+        ## 🪜 Multilevel Feedback Queue
+
+        **Reglas:**
+
+        1. **Si la prioridad de A es mayor que la de B**, se ejecuta A
+        2. **Si tienen la misma prioridad**, se turnan en Round Robin con el quantum del nivel
+        3. **Todo proceso nuevo** entra al nivel más alto (nivel 0)
+        4. **Al agotar su quantum** en un nivel, el proceso baja al siguiente
+        5. **Cada S ticks** (refuerzo) todos los procesos vuelven al nivel 0
+
+        Una llegada interrumpe a un proceso de un nivel inferior, que conserva su turno
+        al frente de su cola.
+
+        **Reglas de degradación:**
+        - **acumulado:** el tiempo usado en el nivel se suma aunque el proceso sea interrumpido;
+          baja al completar su quantum. Evita que un proceso acapare la CPU cediéndola justo antes
+        - **tramo:** solo baja si usa un quantum completo de una sola vez
+
+        **Ejemplo práctico (quantums 2, 4, 8):**
+        ```
+        Procesos: P0(llegada=0, duración=7), P1(llegada=1, duración=2)
+
+        Tiempo 0-2: P0 en nivel 0 (P1 llega en 1 y espera: mismo nivel)
+                    P0 agota su quantum de 2 → baja al nivel 1
+        Tiempo 2-4: P1 en nivel 0 termina
+        Tiempo 4-8: P0 en nivel 1 (quantum 4) → baja al nivel 2
+        Tiempo 8-9: P0 termina en nivel 2
+        ```
+
+        **Despacho O(1):** cada nivel es un deque y un mapa de bits marca los niveles con
+        procesos; el siguiente proceso es el primero de la cola del bit encendido más bajo.
+
+        **Ventajas:**
+        - ✅ **No necesita conocer duraciones** y aun así favorece a los procesos cortos
+        - ✅ **Buen tiempo de respuesta** para procesos interactivos
+        - ✅ **Sin inanición** con refuerzo periódico
+
+        **Desventajas:**
+        - ❌ **Muchos parámetros:** niveles, quantums y periodo de refuerzo
+        - ❌ **Sin refuerzo**, los procesos largos pueden esperar indefinidamente
+
+        **Aplicaciones en la vida real:**
+        - Planificadores de Solaris, FreeBSD y Windows NT usan variantes de MLFQ
+        """)
+
+if __name__ == "__main__":
+    main()
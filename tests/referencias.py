@@ -0,0 +1,281 @@
+"""
+Motores de referencia tick a tick
+
+Son los motores originales del proyecto, antes de las versiones por
+eventos, montículos y columnas: lentos pero directos. Las pruebas los
+usan como oráculo de los motores de utils/.
+"""
+
+
+def fcfs_referencia(procesos):
+    procesos.sort(key=lambda p: p['llegada'])
+
+    tiempo_actual = 0
+    for proceso in procesos:
+        if tiempo_actual < proceso['llegada']:
+            tiempo_actual = proceso['llegada']
+
+        proceso['inicio'] = tiempo_actual
+        proceso['final'] = tiempo_actual + proceso['duracion']
+        proceso['retorno'] = proceso['final'] - proceso['llegada']
+        proceso['espera'] = proceso['inicio'] - proceso['llegada']
+
+        tiempo_actual = proceso['final']
+
+    return procesos
+
+
+def _no_preemptivo_referencia(procesos, clave):
+    for p in procesos:
+        p.setdefault(clave, 0)
+        p.setdefault('llegada', 0)
+
+    tiempo_actual = 0
+    procesos_restantes = procesos.copy()
+
+    while procesos_restantes:
+        disponibles = [p for p in procesos_restantes if p['llegada'] <= tiempo_actual]
+
+        if disponibles:
+            # Empates por orden de llegada y luego por posición, como utils/despacho.py
+            # (el motor original solo desempataba por posición)
+            disponibles.sort(key=lambda p: (p[clave], p['llegada']))
+            proceso_actual = disponibles[0]
+
+            proceso_actual['inicio'] = tiempo_actual
+            proceso_actual['final'] = tiempo_actual + proceso_actual['duracion']
+            proceso_actual['retorno'] = proceso_actual['final'] - proceso_actual['llegada']
+            proceso_actual['espera'] = proceso_actual['inicio'] - proceso_actual['llegada']
+
+            tiempo_actual = proceso_actual['final']
+            procesos_restantes.remove(proceso_actual)
+        else:
+            tiempo_actual = min(p['llegada'] for p in procesos_restantes)
+
+    return procesos
+
+
+def sjf_referencia(procesos):
+    return _no_preemptivo_referencia(procesos, 'duracion')
+
+
+def prioridad_referencia(procesos):
+    return _no_preemptivo_referencia(procesos, 'prioridad')
+
+
+def rr_referencia(procesos, quantum=2, cambio_contexto=0):
+    for p in procesos:
+        p.setdefault('llegada', 0)
+
+    tiempo_actual = 0
+    cola = []
+    tiempo_restante = {p['pid']: p['duracion'] for p in procesos}
+    ejecuciones = {p['pid']: [] for p in procesos}
+    procesos_terminados = set()
+
+    while len(procesos_terminados) < len(procesos):
+        for p in procesos:
+            pid = p['pid']
+            if (pid not in procesos_terminados and
+                    p['llegada'] <= tiempo_actual and
+                    tiempo_restante[pid] > 0 and
+                    p not in cola):
+                cola.append(p)
+
+        if cola:
+            proceso_actual = cola.pop(0)
+            pid = proceso_actual['pid']
+
+            tiempo_a_ejecutar = min(quantum, tiempo_restante[pid])
+            ejecuciones[pid].append((tiempo_actual, tiempo_a_ejecutar))
+
+            tiempo_restante[pid] -= tiempo_a_ejecutar
+            tiempo_actual += tiempo_a_ejecutar
+
+            for p_nuevo in procesos:
+                pid_nuevo = p_nuevo['pid']
+                if (pid_nuevo not in procesos_terminados and
+                        p_nuevo['llegada'] <= tiempo_actual and
+                        tiempo_restante[pid_nuevo] > 0 and
+                        p_nuevo not in cola and
+                        p_nuevo != proceso_actual):
+                    cola.append(p_nuevo)
+
+            if tiempo_restante[pid] > 0:
+                cola.append(proceso_actual)
+            else:
+                procesos_terminados.add(pid)
+
+            if cambio_contexto > 0:
+                tiempo_actual += cambio_contexto
+        else:
+            tiempo_actual += 1
+
+    for p in procesos:
+        p['ejecuciones'] = ejecuciones[p['pid']]
+        p['inicio'] = ejecuciones[p['pid']][0][0]
+        ultima_ejecucion = ejecuciones[p['pid']][-1]
+        p['final'] = ultima_ejecucion[0] + ultima_ejecucion[1]
+        p['retorno'] = p['final'] - p['llegada']
+        p['espera'] = p['retorno'] - p['duracion']
+        p['quantum'] = quantum
+
+    return procesos
+
+
+def srt_referencia(procesos):
+    for p in procesos:
+        p.setdefault('llegada', 0)
+
+    procesos.sort(key=lambda p: p['llegada'])
+
+    tiempo_actual = 0
+    ejecuciones = {p['pid']: [] for p in procesos}
+    restante = {p['pid']: p['duracion'] for p in procesos}
+    completados = 0
+
+    while completados < len(procesos):
+        disponibles = [p for p in procesos if p['llegada'] <= tiempo_actual and restante[p['pid']] > 0]
+
+        if disponibles:
+            disponibles.sort(key=lambda p: restante[p['pid']])
+            pid = disponibles[0]['pid']
+
+            if not ejecuciones[pid] or ejecuciones[pid][-1][0] + ejecuciones[pid][-1][1] < tiempo_actual:
+                ejecuciones[pid].append((tiempo_actual, 1))
+            else:
+                ejecuciones[pid][-1] = (ejecuciones[pid][-1][0], ejecuciones[pid][-1][1] + 1)
+
+            restante[pid] -= 1
+            tiempo_actual += 1
+            if restante[pid] == 0:
+                completados += 1
+        else:
+            tiempo_actual = min(p['llegada'] for p in procesos if restante[p['pid']] > 0)
+
+    for p in procesos:
+        p['ejecuciones'] = ejecuciones[p['pid']]
+        p['inicio'] = ejecuciones[p['pid']][0][0]
+        p['final'] = ejecuciones[p['pid']][-1][0] + ejecuciones[p['pid']][-1][1]
+        p['retorno'] = p['final'] - p['llegada']
+        p['espera'] = p['retorno'] - p['duracion']
+        p.setdefault('prioridad', 0)
+
+    return procesos
+
+
+def prioridad_preemptiva_referencia(procesos, envejecimiento=0):
+    """
+    Prioridad preemptiva tick a tick con envejecimiento explícito
+
+    Cada tick recalcula la prioridad efectiva de los que esperan:
+    prioridad - (t - espera_desde) / envejecimiento, sin pasar de 0 para el
+    proceso despachado. Devuelve los tramos (inicio, duracion) por proceso.
+    """
+    n = len(procesos)
+    restante = [p['duracion'] for p in procesos]
+    posicion = {i: k for k, i in enumerate(sorted(range(n), key=lambda i: procesos[i]['llegada']))}
+    # índice -> tick desde el que espera en la cola
+    esperando = {}
+    actual = None
+    nivel = None
+    ejecuciones = [[] for _ in range(n)]
+
+    def efectiva(i, t):
+        # En unidades de 1/envejecimiento de nivel para comparar con enteros
+        if not envejecimiento:
+            return procesos[i]['prioridad']
+        return procesos[i]['prioridad'] * envejecimiento - (t - esperando[i])
+
+    t = 0
+    while any(restante):
+        for i in range(n):
+            if procesos[i]['llegada'] == t:
+                esperando[i] = t
+        if actual is not None and esperando:
+            mejor = efectiva(min(esperando, key=lambda i: (efectiva(i, t), posicion[i])), t)
+            # Interrumpe si es al menos un nivel mejor que el que está en CPU
+            if envejecimiento:
+                expropia = max(0, mejor) <= nivel - envejecimiento
+            else:
+                expropia = mejor < nivel
+            if expropia:
+                esperando[actual] = t
+                actual = None
+        if actual is None and esperando:
+            actual = min(esperando, key=lambda i: (efectiva(i, t), posicion[i]))
+            nivel = max(0, efectiva(actual, t)) if envejecimiento else efectiva(actual, t)
+            del esperando[actual]
+        if actual is not None:
+            tramos = ejecuciones[actual]
+            if tramos and tramos[-1][0] + tramos[-1][1] == t:
+                tramos[-1] = (tramos[-1][0], tramos[-1][1] + 1)
+            else:
+                tramos.append((t, 1))
+            restante[actual] -= 1
+            if restante[actual] == 0:
+                actual = None
+        t += 1
+    return ejecuciones
+
+
+def mlfq_referencia(procesos, quantums, refuerzo=0, degradacion='acumulado'):
+    """
+    MLFQ tick a tick con colas como listas
+
+    Devuelve los tramos (inicio, duracion) y el nivel de cada tramo por
+    proceso. Una llegada interrumpe solo a un proceso de nivel > 0; el
+    refuerzo interrumpe a cualquiera y devuelve todas las colas al nivel 0.
+    """
+    n = len(procesos)
+    restante = [p['duracion'] for p in procesos]
+    orden = sorted(range(n), key=lambda i: procesos[i]['llegada'])
+    colas = [[] for _ in quantums]
+    usado = [0] * n
+    actual = None  # [indice, nivel, ticks del tramo]
+    ejecuciones = [[] for _ in range(n)]
+    niveles = [[] for _ in range(n)]
+
+    t = 0
+    while any(restante):
+        llego = False
+        for i in orden:
+            if procesos[i]['llegada'] == t:
+                colas[0].append(i)
+                llego = True
+        refuerza = refuerzo > 0 and t > 0 and t % refuerzo == 0
+        if actual is not None:
+            i, nivel, tramo = actual
+            agotado = tramo >= quantums[nivel] if degradacion == 'tramo' else usado[i] >= quantums[nivel]
+            if agotado:
+                usado[i] = 0
+                colas[min(nivel + 1, len(quantums) - 1)].append(i)
+                actual = None
+            elif (llego and nivel > 0) or refuerza:
+                # Conserva su turno al frente de su cola
+                colas[nivel].insert(0, i)
+                actual = None
+        if refuerza:
+            for nivel in range(1, len(quantums)):
+                colas[0] += colas[nivel]
+                colas[nivel] = []
+            usado = [0] * n
+        if actual is None:
+            for nivel, cola in enumerate(colas):
+                if cola:
+                    i = cola.pop(0)
+                    actual = [i, nivel, 0]
+                    ejecuciones[i].append((t, 0))
+                    niveles[i].append(nivel)
+                    break
+        if actual is not None:
+            i = actual[0]
+            inicio, duracion = ejecuciones[i][-1]
+            ejecuciones[i][-1] = (inicio, duracion + 1)
+            restante[i] -= 1
+            usado[i] += 1
+            actual[2] += 1
+            if restante[i] == 0:
+                actual = None
+        t += 1
+    return ejecuciones, niveles
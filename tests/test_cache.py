@@ -0,0 +1,62 @@
+from utils import cache
+from utils.cache import _resultados, ejecutar_simulacion, limpiar_cache
+from utils.helpers import PROCESOS_VALIDOS
+from utils.instrumentacion import filas_rendimiento, medir
+
+
+def test_acierto_devuelve_copia_propia():
+    limpiar_cache()
+    procesos = [{'pid': i, 'llegada': i % 3, 'duracion': 3 + i % 4} for i in range(6)]
+    _, _, primero = ejecutar_simulacion('rr', procesos, quantum=2)
+    esperado = [dict(p, ejecuciones=list(p['ejecuciones'])) for p in primero]
+    primero[0]['final'] = -1
+
+    _, _, segundo = ejecutar_simulacion('rr', procesos, quantum=2)
+    assert segundo == esperado
+    segundo[1]['ejecuciones'].append((0, 0))
+    assert ejecutar_simulacion('rr', procesos, quantum=2)[2] == esperado
+    assert 'final' not in procesos[0]
+
+
+def test_carga_invalida_no_entra_en_cache():
+    limpiar_cache()
+    es_valido, _, resultado = ejecutar_simulacion('fcfs', [{'pid': 0, 'llegada': 0, 'duracion': 0}])
+    assert not es_valido and resultado is None
+    assert not _resultados
+
+
+def test_clave_sobre_carga_completada():
+    limpiar_cache()
+    ejecutar_simulacion('sjf', [{'duracion': 2}, {'duracion': 1}])
+    _, _, resultado = ejecutar_simulacion('sjf', [{'pid': 0, 'llegada': 0, 'duracion': 2}, {'pid': 1, 'llegada': 0, 'duracion': 1}])
+    assert len(_resultados) == 1
+    assert [p['final'] for p in resultado] == [3, 1]
+
+
+def test_acierto_se_cuenta_en_la_medicion():
+    limpiar_cache()
+    procesos = [{'pid': 0, 'llegada': 0, 'duracion': 3}]
+    with medir() as medicion:
+        ejecutar_simulacion('fcfs', procesos)
+    assert medicion.contadores['aciertos_cache'] == 0
+    assert medicion.contadores['tramos'] == 1
+
+    with medir() as medicion:
+        ejecutar_simulacion('fcfs', procesos)
+    assert medicion.contadores['aciertos_cache'] == 1
+    assert medicion.contadores['tramos'] == 0 and not medicion.motores
+    medidas = [f['medida'] for f in filas_rendimiento(medicion.a_dict())]
+    assert 'Aciertos cache' in medidas and 'Tramos (derivado del plan)' in medidas
+
+
+def test_acierto_no_valida_ni_copia(monkeypatch):
+    limpiar_cache()
+    procesos = [{'duracion': 2}, {'duracion': 1, 'llegada': 1}]
+    _, _, primero = ejecutar_simulacion('fcfs', procesos)
+
+    validaciones = []
+    monkeypatch.setattr(cache, 'validar_procesos', lambda p: validaciones.append(p))
+    monkeypatch.setattr(cache.copy, 'deepcopy', lambda p: validaciones.append(p))
+    es_valido, mensaje, segundo = ejecutar_simulacion('fcfs', procesos)
+    assert es_valido and mensaje == PROCESOS_VALIDOS
+    assert segundo == primero and not validaciones
@@ -0,0 +1,87 @@
+"""
+Los planificadores en línea, alimentados en orden de llegada, producen la
+misma planificación que los motores calcular_*
+"""
+import copy
+import random
+
+import pytest
+
+from utils.algoritmos import ALGORITMOS
+from utils.en_linea import ALGORITMOS_EN_LINEA, crear_planificador, planificar_en_flujo
+
+
+def parametros_aleatorios(algoritmo, rng):
+    if algoritmo == 'rr':
+        return {'quantum': rng.randint(1, 4), 'cambio_contexto': rng.choice([0, 0, 1, 2])}
+    if algoritmo == 'prioridad_preemptiva':
+        return {'envejecimiento': rng.choice([0, 0, 1, 2, 3, 5])}
+    if algoritmo == 'mlfq':
+        return {
+            'quantums': tuple(rng.randint(1, 5) for _ in range(rng.randint(1, 4))),
+            'refuerzo': rng.choice([0, 0, 3, 5, 8, 13]),
+            'degradacion': rng.choice(['acumulado', 'tramo']),
+        }
+    return {}
+
+
+def tramos_desde_eventos(eventos):
+    # Reconstruye (inicio, duracion) por pid y (retorno, espera) de cada 'fin'
+    tramos, metricas, desde = {}, {}, {}
+    for evento in eventos:
+        if evento.tipo == 'despacho':
+            desde[evento.pid] = evento.tiempo
+        else:
+            inicio = desde.pop(evento.pid)
+            tramos.setdefault(evento.pid, []).append((inicio, evento.tiempo - inicio))
+            if evento.tipo == 'fin':
+                metricas[evento.pid] = (evento.retorno, evento.espera)
+    return tramos, metricas
+
+
+def test_todos_los_motores_tienen_version_en_linea():
+    assert set(ALGORITMOS_EN_LINEA) == set(ALGORITMOS)
+
+
+@pytest.mark.parametrize('algoritmo', list(ALGORITMOS))
+def test_misma_planificacion_que_el_motor(algoritmo):
+    rng = random.Random(11)
+    for _ in range(400):
+        procesos = sorted(
+            ({'pid': i, 'llegada': rng.randint(0, 15), 'duracion': rng.randint(1, 9), 'prioridad': rng.randint(0, 5)}
+             for i in range(rng.randint(1, 10))),
+            key=lambda p: p['llegada']
+        )
+        parametros = parametros_aleatorios(algoritmo, rng)
+        calculados = ALGORITMOS[algoritmo](copy.deepcopy(procesos), **parametros)
+        tramos, metricas = tramos_desde_eventos(planificar_en_flujo(procesos, algoritmo, **parametros))
+
+        for p in calculados:
+            esperado = p.get('ejecuciones', [(p['inicio'], p['duracion'])])
+            assert tramos[p['pid']] == esperado, (algoritmo, parametros, procesos)
+            assert metricas[p['pid']] == (p['retorno'], p['espera'])
+
+
+@pytest.mark.parametrize('algoritmo', ['prioridad_preemptiva', 'mlfq'])
+def test_avanzar_en_pasos_arbitrarios(algoritmo):
+    # El resultado no depende de cada cuánto se llama a avanzar
+    rng = random.Random(12)
+    for _ in range(200):
+        procesos = sorted(
+            ({'pid': i, 'llegada': rng.randint(0, 20), 'duracion': rng.randint(1, 9), 'prioridad': rng.randint(0, 5)}
+             for i in range(rng.randint(1, 10))),
+            key=lambda p: p['llegada']
+        )
+        parametros = parametros_aleatorios(algoritmo, rng)
+        esperados = list(planificar_en_flujo(procesos, algoritmo, **parametros))
+
+        planificador = crear_planificador(algoritmo, **parametros)
+        eventos = []
+        reloj = 0
+        for p in procesos:
+            while reloj < p['llegada']:
+                reloj = min(p['llegada'], reloj + rng.randint(1, 3))
+                eventos += planificador.avanzar(reloj)
+            planificador.agregar(p['pid'], p['llegada'], p['duracion'], p['prioridad'])
+        eventos += planificador.terminar()
+        assert eventos == esperados, (parametros, procesos)
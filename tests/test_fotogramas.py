@@ -0,0 +1,56 @@
+import threading
+import time
+
+from utils.fotogramas import estadisticas_fotogramas, fotograma, limpiar_fotogramas
+from utils.visualizacion import GraficoGantt
+
+
+class GanttLento:
+    """Sustituto de GraficoGantt cuyo dibujo en segundo plano espera a 'liberar'"""
+
+    def __init__(self, huella, tiempo_maximo=100):
+        self.huella = huella
+        self.tiempo_maximo = tiempo_maximo
+        self.liberar = threading.Event()
+        self.dibujando = threading.Event()
+        self.adelantados = []
+
+    def png(self, tiempo, tema=None):
+        if threading.current_thread() is not threading.main_thread():
+            self.dibujando.set()
+            self.liberar.wait(5)
+            self.adelantados.append(tiempo)
+        return f'{self.huella}:{tiempo}:{tema}'.encode()
+
+
+def esperar_adelantador():
+    limite = time.monotonic() + 5
+    while estadisticas_fotogramas()['pendientes'] and time.monotonic() < limite:
+        time.sleep(0.01)
+
+
+def test_tema_en_la_clave_y_en_los_colores():
+    limpiar_fotogramas()
+    gantt = GraficoGantt([{'pid': 0, 'llegada': 0, 'duracion': 2, 'inicio': 0, 'final': 2}], 'FCFS')
+    oscuro = fotograma(gantt, 1, tema='oscuro', adelantar=0)
+    claro = fotograma(gantt, 1, tema='claro', adelantar=0)
+    assert oscuro != claro
+    assert estadisticas_fotogramas()['fotogramas'] == 2
+    assert fotograma(gantt, 1, tema='oscuro', adelantar=0) == oscuro
+
+
+def test_adelanta_a_lo_sumo_la_ventana_y_descarta_los_viejos():
+    limpiar_fotogramas()
+    gantt = GanttLento('lento')
+    fotograma(gantt, 0, adelantar=3)
+    assert estadisticas_fotogramas()['pendientes'] == 3
+    assert gantt.dibujando.wait(5)
+
+    # Salto: 2 y 3 se cancelan; 1 ya se está dibujando y cuenta para el tope
+    fotograma(gantt, 50, adelantar=3)
+    assert estadisticas_fotogramas()['pendientes'] == 3
+
+    gantt.liberar.set()
+    esperar_adelantador()
+    assert gantt.adelantados == [1, 51, 52]
+    assert fotograma(gantt, 51, adelantar=0) == b'lento:51:oscuro'
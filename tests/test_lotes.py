@@ -0,0 +1,48 @@
+import random
+
+from utils.lotes import ejecutar_lotes, leer_cargas
+from utils.trazas import cargar_traza
+
+
+def escribir_swf(ruta, trabajos, semilla=0):
+    rng = random.Random(semilla)
+    lineas = ['; Version: 2.2', ';']
+    envio = 1000
+    for trabajo in range(1, trabajos + 1):
+        envio += rng.randint(0, 40)
+        campos = [trabajo, envio, 0, rng.randint(1, 500), 4, -1, -1, 4, 3600, -1, 1, 3, 1, -1, rng.randint(1, 3), 1, -1, -1]
+        lineas.append(' '.join(str(c) for c in campos))
+    ruta.write_text('\n'.join(lineas) + '\n')
+
+
+def test_swf_es_una_sola_carga(tmp_path):
+    ruta = tmp_path / 'traza.swf'
+    escribir_swf(ruta, 2000)
+    cargas = list(leer_cargas([str(ruta)], tamano_bloque=8192))
+
+    assert [nombre for nombre, _ in cargas] == ['traza.swf']
+    pid, llegada, duracion, prioridad = cargas[0][1]
+    completa = cargar_traza(str(ruta))
+    assert pid.tolist() == completa.pid.tolist() and duracion.tolist() == completa.duracion.tolist()
+    assert llegada.tolist() == completa.llegada.tolist() and llegada.min() == 0
+
+
+def test_ejecutar_lotes_swf(tmp_path):
+    ruta = tmp_path / 'traza.swf'
+    escribir_swf(ruta, 500)
+    resumen = ejecutar_lotes([str(ruta)], ['fcfs', 'srt'], salida=None, bloque_traza=4096)
+    assert resumen['fcfs']['procesos_completados'] == resumen['srt']['procesos_completados'] == 500
+    assert resumen['fcfs']['cargas'] == resumen['srt']['cargas'] == 1
+
+
+def test_resultados_no_dependen_del_bloque(tmp_path):
+    # Llegadas densas y trabajos largos: la cola cruza los límites de bloque
+    ruta = tmp_path / 'traza.swf'
+    escribir_swf(ruta, 1500, semilla=3)
+    salidas = []
+    for bloque in (1024, 8192, 2**20):
+        salida = tmp_path / f'procesos_{bloque}.csv'
+        metricas = tmp_path / f'metricas_{bloque}.csv'
+        resumen = ejecutar_lotes([str(ruta)], ['fcfs', 'rr', 'mlfq'], salida=str(salida), metricas=str(metricas), bloque_traza=bloque)
+        salidas.append((resumen, salida.read_text(), metricas.read_text()))
+    assert salidas[0] == salidas[1] == salidas[2]
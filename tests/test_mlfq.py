@@ -0,0 +1,84 @@
+"""
+Pruebas de MLFQ contra la simulación de referencia tick a tick
+
+Se cubren ambas reglas de degradación, con y sin refuerzo, sobre cargas
+aleatorias con semilla fija y llegadas simultáneas.
+"""
+import copy
+import random
+
+import pytest
+
+from tests.referencias import mlfq_referencia
+from utils.mlfq import DEGRADACIONES, calcular_mlfq, resumir_niveles
+from utils.tabla import TablaProcesos
+
+CARGAS = 400
+
+
+def carga_aleatoria(rng):
+    return [
+        {'pid': i, 'llegada': rng.randint(0, 15), 'duracion': rng.randint(1, 14), 'prioridad': 0}
+        for i in range(rng.randint(1, 9))
+    ]
+
+
+@pytest.mark.parametrize('degradacion', DEGRADACIONES)
+@pytest.mark.parametrize('refuerzo', [0, 3, 5, 8, 13])
+def test_coincide_con_referencia(refuerzo, degradacion):
+    rng = random.Random(refuerzo * 10 + len(degradacion))
+    for _ in range(CARGAS):
+        procesos = carga_aleatoria(rng)
+        quantums = tuple(rng.randint(1, 5) for _ in range(rng.randint(1, 4)))
+        ejecuciones, niveles = mlfq_referencia(procesos, quantums, refuerzo, degradacion)
+
+        calculados = calcular_mlfq(copy.deepcopy(procesos), quantums, refuerzo, degradacion)
+        contexto = (quantums, procesos)
+        assert [p['ejecuciones'] for p in calculados] == ejecuciones, contexto
+        assert [p['niveles'] for p in calculados] == niveles, contexto
+        for p in calculados:
+            assert p['final'] == p['ejecuciones'][-1][0] + p['ejecuciones'][-1][1]
+
+        tabla = calcular_mlfq(TablaProcesos.desde_dicts(procesos), quantums, refuerzo, degradacion)
+        assert tabla.ejecuciones == ejecuciones, contexto
+
+        filas = resumir_niveles(calculados, quantums)
+        assert filas == resumir_niveles(tabla, quantums)
+        assert sum(f['ticks_cpu'] for f in filas) == sum(p['duracion'] for p in procesos)
+        assert sum(f['terminados'] for f in filas) == len(procesos)
+
+
+def test_degradacion_distingue_tramos_interrumpidos():
+    # P0 usa 1 tick en el nivel 1 (quantum 2) y la llegada de P1 lo
+    # interrumpe: 'acumulado' lo baja tras 1 tick más, 'tramo' tras 2
+    procesos = [
+        {'pid': 0, 'llegada': 0, 'duracion': 6, 'prioridad': 0},
+        {'pid': 1, 'llegada': 2, 'duracion': 1, 'prioridad': 0},
+    ]
+    esperado = {
+        'acumulado': [(0, 1), (1, 1), (3, 1), (4, 3)],
+        'tramo': [(0, 1), (1, 1), (3, 2), (5, 2)],
+    }
+    for degradacion, tramos in esperado.items():
+        calculados = calcular_mlfq(copy.deepcopy(procesos), (1, 2, 4), 0, degradacion)
+        assert calculados[0]['ejecuciones'] == tramos
+        assert calculados[0]['niveles'] == [0, 1, 1, 2]
+        assert calculados[1]['ejecuciones'] == [(2, 1)]
+
+
+def test_refuerzo_devuelve_al_nivel_cero():
+    procesos = [
+        {'pid': 0, 'llegada': 0, 'duracion': 20, 'prioridad': 0},
+        {'pid': 1, 'llegada': 0, 'duracion': 20, 'prioridad': 0},
+    ]
+    sin = calcular_mlfq(copy.deepcopy(procesos), (1, 2), 0)
+    con = calcular_mlfq(copy.deepcopy(procesos), (1, 2), 6)
+    assert 0 not in sin[0]['niveles'][1:]
+    assert 0 in con[0]['niveles'][1:]
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        calcular_mlfq([], (2, 0))
+    with pytest.raises(ValueError):
+        calcular_mlfq([], (2, 4), degradacion='otra')
@@ -0,0 +1,96 @@
+"""
+Pruebas diferenciales de los motores de un CPU contra los de referencia
+
+Las cargas son aleatorias con semilla fija, con llegadas desordenadas y
+simultáneas, y cada motor se ejecuta también sobre TablaProcesos.
+"""
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from tests.referencias import (
+    fcfs_referencia, prioridad_referencia, rr_referencia, sjf_referencia, srt_referencia
+)
+from utils.fcfs import calcular_fcfs, calcular_fcfs_lote
+from utils.prioridad import calcular_prioridad
+from utils.rr import calcular_rr
+from utils.sjf import calcular_sjf
+from utils.srt import calcular_srt
+from utils.tabla import TablaProcesos
+
+CARGAS = 600
+
+CASOS = [
+    (calcular_fcfs, fcfs_referencia, {}),
+    (calcular_sjf, sjf_referencia, {}),
+    (calcular_prioridad, prioridad_referencia, {}),
+    (calcular_srt, srt_referencia, {}),
+] + [
+    (calcular_rr, rr_referencia, {'quantum': quantum, 'cambio_contexto': cambio})
+    for quantum in (1, 2, 3, 5) for cambio in (0, 1, 2)
+]
+
+
+def carga_aleatoria(rng, max_procesos=10, max_llegada=12):
+    # Pocas llegadas posibles para muchos procesos: hay empates y huecos
+    return [
+        {'pid': i, 'llegada': rng.randint(0, max_llegada), 'duracion': rng.randint(1, 9), 'prioridad': rng.randint(0, 4)}
+        for i in range(rng.randint(1, max_procesos))
+    ]
+
+
+def cargas(semilla):
+    rng = random.Random(semilla)
+    fijas = [
+        # Todos llegan a la vez
+        [{'pid': i, 'llegada': 0, 'duracion': d, 'prioridad': d % 3} for i, d in enumerate((5, 3, 3, 8, 1))],
+        # Orden de entrada inverso al de llegada, con un hueco ocioso
+        [{'pid': i, 'llegada': a, 'duracion': 2, 'prioridad': 1} for i, a in enumerate((20, 9, 4, 4, 0))],
+        # Un único proceso que llega tarde
+        [{'pid': 0, 'llegada': 7, 'duracion': 4, 'prioridad': 0}],
+    ]
+    return fijas + [carga_aleatoria(rng) for _ in range(CARGAS)]
+
+
+def _id(caso):
+    motor, _, parametros = caso
+    return motor.__name__ + ''.join(f'-{k}{v}' for k, v in parametros.items())
+
+
+@pytest.mark.parametrize('caso', CASOS, ids=[_id(c) for c in CASOS])
+def test_coincide_con_referencia(caso):
+    motor, referencia, parametros = caso
+    for procesos in cargas(1):
+        esperado = referencia(copy.deepcopy(procesos), **parametros)
+        assert motor(copy.deepcopy(procesos), **parametros) == esperado, procesos
+
+
+@pytest.mark.parametrize('caso', CASOS, ids=[_id(c) for c in CASOS])
+def test_tabla_coincide_con_referencia(caso):
+    motor, referencia, parametros = caso
+    for procesos in cargas(2):
+        esperado = {p['pid']: p for p in referencia(copy.deepcopy(procesos), **parametros)}
+        tabla = motor(TablaProcesos.desde_dicts(copy.deepcopy(procesos)), **parametros)
+        for p in tabla.a_dicts():
+            r = esperado[p['pid']]
+            assert (p['inicio'], p['final'], p['retorno'], p['espera']) == (r['inicio'], r['final'], r['retorno'], r['espera']), procesos
+            if 'ejecuciones' in r:
+                assert p['ejecuciones'] == r['ejecuciones'], procesos
+
+
+def test_fcfs_lote_coincide_con_referencia():
+    rng = random.Random(3)
+    for procesos_por_carga in (1, 2, 7, 15):
+        llegadas = np.array([[rng.randint(0, 10) for _ in range(procesos_por_carga)] for _ in range(200)])
+        duraciones = np.array([[rng.randint(1, 9) for _ in range(procesos_por_carga)] for _ in range(200)])
+        inicio, final, retorno, espera = calcular_fcfs_lote(llegadas, duraciones)
+        for c in range(len(llegadas)):
+            procesos = [{'pid': i, 'llegada': int(a), 'duracion': int(d)}
+                        for i, (a, d) in enumerate(zip(llegadas[c], duraciones[c]))]
+            for p in fcfs_referencia(procesos):
+                i = p['pid']
+                assert (inicio[c, i], final[c, i], retorno[c, i], espera[c, i]) == (
+                    p['inicio'], p['final'], p['retorno'], p['espera']
+                )
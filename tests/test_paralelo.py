@@ -0,0 +1,53 @@
+"""
+El pool de procesos de la comparativa, el barrido y Monte Carlo da los
+mismos resultados que la ejecución en serie
+"""
+import numpy as np
+
+from utils.barrido import barrer_rr, opciones_procesos_trabajo
+from utils.cache import limpiar_cache
+from utils.comparativa import comparar_algoritmos
+from utils.generador import generar_lista
+from utils.instrumentacion import medir
+from utils.montecarlo import evaluar_montecarlo
+from utils.tabla import TablaProcesos
+
+
+def test_comparativa_en_pool():
+    procesos = generar_lista(300, semilla=4)
+    limpiar_cache()
+    _, _, serie = comparar_algoritmos(procesos, quantum=3, cambio_contexto=1, envejecimiento=2, procesos_trabajo=1)
+    limpiar_cache()
+    with medir() as medicion:
+        _, _, pool = comparar_algoritmos(procesos, quantum=3, cambio_contexto=1, envejecimiento=2, procesos_trabajo=2)
+    assert pool == serie
+    # Los motores corrieron en los trabajadores: la medición no los ve
+    assert not medicion.motores
+
+    tabla = TablaProcesos.desde_dicts(procesos)
+    _, _, tablas_serie = comparar_algoritmos(tabla, algoritmos=['rr', 'mlfq'], procesos_trabajo=1)
+    _, _, tablas_pool = comparar_algoritmos(tabla, algoritmos=['rr', 'mlfq'], procesos_trabajo=2)
+    for algoritmo in ('rr', 'mlfq'):
+        assert tablas_pool[algoritmo].ejecuciones == tablas_serie[algoritmo].ejecuciones
+        assert np.array_equal(tablas_pool[algoritmo].final, tablas_serie[algoritmo].final)
+
+
+def test_barrido_en_pool():
+    procesos = generar_lista(200, semilla=5)
+    limpiar_cache()
+    _, _, serie = barrer_rr(procesos, range(1, 5), range(0, 3), procesos_trabajo=1)
+    limpiar_cache()
+    _, _, pool = barrer_rr(procesos, range(1, 5), range(0, 3), procesos_trabajo=2)
+    assert pool == serie
+
+
+def test_montecarlo_en_pool():
+    serie, muestras_serie = evaluar_montecarlo(40, 15, semilla=2, procesos_trabajo=1)
+    pool, muestras_pool = evaluar_montecarlo(40, 15, semilla=2, procesos_trabajo=2)
+    assert np.array_equal(muestras_pool, muestras_serie)
+    assert pool == serie
+
+
+def test_opciones_incluyen_pool():
+    opciones = opciones_procesos_trabajo()
+    assert opciones[:2] == [None, 1] and opciones[-1] >= 2
@@ -0,0 +1,59 @@
+import copy
+import random
+
+import pytest
+
+from tests.referencias import prioridad_preemptiva_referencia
+from utils.prioridad_preemptiva import calcular_prioridad_preemptiva
+from utils.tabla import TablaProcesos
+
+
+def proceso(pid, llegada, duracion, prioridad):
+    return {'pid': pid, 'llegada': llegada, 'duracion': duracion, 'prioridad': prioridad}
+
+
+@pytest.mark.parametrize('envejecimiento', [0, 1, 2, 3, 5])
+def test_coincide_con_referencia(envejecimiento):
+    rng = random.Random(5 + envejecimiento)
+    for _ in range(500):
+        procesos = [proceso(i, rng.randint(0, 15), rng.randint(1, 9), rng.randint(0, 6)) for i in range(rng.randint(1, 10))]
+        esperado = prioridad_preemptiva_referencia(procesos, envejecimiento)
+
+        calculados = calcular_prioridad_preemptiva(copy.deepcopy(procesos), envejecimiento)
+        assert [p['ejecuciones'] for p in calculados] == esperado, procesos
+        for p in calculados:
+            assert p['retorno'] == p['final'] - p['llegada'] and p['espera'] == p['retorno'] - p['duracion']
+
+        tabla = calcular_prioridad_preemptiva(TablaProcesos.desde_dicts(procesos), envejecimiento)
+        assert tabla.ejecuciones == esperado
+
+
+@pytest.mark.parametrize('envejecimiento', [0, 10])
+def test_expropia_en_el_tick_de_llegada(envejecimiento):
+    procesos = [proceso(0, 0, 5, 3), proceso(1, 2, 2, 1)]
+    calculados = calcular_prioridad_preemptiva(procesos, envejecimiento)
+    assert [p['ejecuciones'] for p in calculados] == [[(0, 2), (4, 3)], [(2, 2)]]
+
+
+def test_igual_prioridad_no_expropia():
+    procesos = [proceso(0, 0, 5, 2), proceso(1, 1, 1, 2)]
+    calculados = calcular_prioridad_preemptiva(procesos, 0)
+    assert [p['ejecuciones'] for p in calculados] == [[(0, 5)], [(5, 1)]]
+
+
+def test_nivel_cero_no_se_expropia():
+    # P1 espera tanto que su prioridad efectiva sería negativa; se despacha
+    # en el nivel 0 y nadie puede interrumpirlo, aunque P2 envejezca más
+    procesos = [proceso(0, 0, 10, 0), proceso(1, 0, 5, 1), proceso(2, 0, 3, 3)]
+    calculados = calcular_prioridad_preemptiva(copy.deepcopy(procesos), 1)
+    assert [p['ejecuciones'] for p in calculados] == [[(0, 10)], [(10, 5)], [(15, 3)]]
+    assert prioridad_preemptiva_referencia(procesos, 1) == [[(0, 10)], [(10, 5)], [(15, 3)]]
+
+
+def test_envejecimiento_evita_inanicion():
+    # Sin envejecimiento P0 espera a que termine el flujo de prioridad 0
+    procesos = [proceso(0, 0, 2, 5)] + [proceso(i, i - 1, 1, 0) for i in range(1, 21)]
+    sin = calcular_prioridad_preemptiva(copy.deepcopy(procesos), 0)
+    con = calcular_prioridad_preemptiva(copy.deepcopy(procesos), 2)
+    assert sin[0]['inicio'] == 20
+    assert con[0]['inicio'] < 20
@@ -0,0 +1,65 @@
+import random
+
+import numpy as np
+
+from utils.rr import calcular_rr
+from utils.segmentos import RegistroSegmentos
+from utils.smp import calcular_smp
+from utils.srt import calcular_srt
+from utils.tabla import TablaProcesos
+
+
+def tabla_aleatoria(rng):
+    n = rng.randint(1, 30)
+    return TablaProcesos(range(n), [rng.randint(0, 40) for _ in range(n)], [rng.randint(1, 25) for _ in range(n)])
+
+
+def comprobar_ventanas(registro, rng):
+    proceso, inicio, duracion = (c.tolist() for c in registro.columnas())
+    for _ in range(8):
+        desde = rng.randint(-2, 200)
+        hasta = desde + rng.randint(0, 40)
+        esperado = [t for t in zip(proceso, inicio, duracion) if t[1] < hasta and t[1] + t[2] > desde]
+        p, s, d = registro.en_ventana(desde, hasta)
+        assert list(zip(p.tolist(), s.tolist(), d.tolist())) == esperado, (desde, hasta)
+
+
+def test_un_cpu(tmp_path):
+    rng = random.Random(3)
+    for k in range(300):
+        tabla = tabla_aleatoria(rng)
+        calculada = calcular_rr(tabla, rng.randint(1, 4), rng.randint(0, 2)) if k % 2 else calcular_srt(tabla)
+        registro = calculada.segmentos
+        if k % 7 == 0:
+            registro.guardar(tmp_path / 'un_cpu.npy')
+            registro = RegistroSegmentos.cargar(tmp_path / 'un_cpu.npy')
+        assert not registro.solapados
+        comprobar_ventanas(registro, rng)
+        for i, ejecuciones in enumerate(calculada.ejecuciones):
+            inicio, duracion = registro.de_proceso(i)
+            assert list(zip(inicio.tolist(), duracion.tolist())) == ejecuciones
+
+
+def test_multinucleo(tmp_path):
+    rng = random.Random(4)
+    for k in range(300):
+        calculada = calcular_smp(
+            tabla_aleatoria(rng), nucleos=rng.randint(2, 5), politica=rng.choice(['fcfs', 'rr', 'srt', 'sjf']),
+            cola=rng.choice(['global', 'por_nucleo'])
+        )
+        registro = calculada.segmentos
+        assert registro.solapados
+        _, inicio, _ = registro.columnas()
+        assert np.all(np.diff(inicio) >= 0)
+        if k % 7 == 0:
+            registro.guardar(tmp_path / 'smp.npy')
+            registro = RegistroSegmentos.cargar(tmp_path / 'smp.npy')
+            assert registro.solapados and isinstance(registro.finales, np.memmap)
+        comprobar_ventanas(registro, rng)
+
+
+def test_registro_vacio(tmp_path):
+    for solapados in (False, True):
+        RegistroSegmentos(solapados=solapados).guardar(tmp_path / 'vacio.npy')
+        registro = RegistroSegmentos.cargar(tmp_path / 'vacio.npy')
+        assert len(registro) == 0 and len(registro.en_ventana(0, 10)[0]) == 0
@@ -0,0 +1,137 @@
+"""
+Pruebas del modo SMP
+
+Con un núcleo y cola global debe reproducir al motor de un CPU de cada
+política; con varios núcleos se comprueban invariantes de la planificación
+(ningún núcleo corre dos tramos a la vez, cada proceso recibe exactamente
+su duración y ningún núcleo queda ocioso con procesos esperando).
+"""
+import copy
+import random
+
+import pytest
+
+from utils.algoritmos import ALGORITMOS
+from utils.smp import COLAS, POLITICAS, calcular_smp, resumir_nucleos
+from utils.tabla import TablaProcesos
+
+CARGAS = 300
+
+
+def carga_aleatoria(rng, max_procesos):
+    return [
+        {'pid': i, 'llegada': rng.randint(0, 15), 'duracion': rng.randint(1, 9), 'prioridad': rng.randint(0, 4)}
+        for i in range(rng.randint(1, max_procesos))
+    ]
+
+
+def parametros(politica, rng):
+    if politica == 'rr':
+        return {'quantum': rng.randint(1, 4), 'cambio_contexto': rng.choice([0, 0, 1, 2])}
+    if politica == 'mlfq':
+        quantums = tuple(rng.randint(1, 5) for _ in range(rng.randint(1, 3)))
+        return {'quantums': quantums, 'degradacion': rng.choice(['acumulado', 'tramo'])}
+    return {}
+
+
+def en_cpu(p, t):
+    return any(inicio <= t < inicio + duracion for inicio, duracion in p['ejecuciones'])
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_un_nucleo_reproduce_al_motor(politica):
+    rng = random.Random(len(politica))
+    for _ in range(CARGAS):
+        procesos = carga_aleatoria(rng, 9)
+        extra = parametros(politica, rng)
+        esperados = {p['pid']: p for p in ALGORITMOS[politica](copy.deepcopy(procesos), **extra)}
+        calculados = calcular_smp(copy.deepcopy(procesos), nucleos=1, politica=politica, **extra)
+        for p in calculados:
+            esperado = esperados[p['pid']]
+            contexto = (extra, procesos)
+            assert (p['inicio'], p['final']) == (esperado['inicio'], esperado['final']), contexto
+            if 'ejecuciones' in esperado:
+                assert p['ejecuciones'] == esperado['ejecuciones'], contexto
+            if 'niveles' in esperado:
+                assert p['niveles'] == esperado['niveles'], contexto
+            assert p['nucleos'] == [0] * len(p['ejecuciones'])
+
+
+@pytest.mark.parametrize('cola', COLAS)
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_invariantes_multinucleo(politica, cola):
+    rng = random.Random(len(politica) * 7 + len(cola))
+    for _ in range(CARGAS // 2):
+        procesos = carga_aleatoria(rng, 14)
+        nucleos = rng.randint(2, 5)
+        extra = parametros(politica, rng)
+        calculados = calcular_smp(copy.deepcopy(procesos), nucleos=nucleos, politica=politica, cola=cola, **extra)
+        contexto = (nucleos, extra, procesos)
+
+        ocupacion = {}
+        for p in calculados:
+            assert sum(d for _, d in p['ejecuciones']) == p['duracion'], contexto
+            anterior = p['llegada']
+            for (inicio, duracion), nucleo in zip(p['ejecuciones'], p['nucleos']):
+                assert duracion > 0 and inicio >= anterior and 0 <= nucleo < nucleos, contexto
+                anterior = inicio + duracion
+                for t in range(inicio, inicio + duracion):
+                    assert (nucleo, t) not in ocupacion, contexto
+                    ocupacion[(nucleo, t)] = p['pid']
+            assert p['inicio'] == p['ejecuciones'][0][0] and p['final'] == anterior
+            assert p['retorno'] == p['final'] - p['llegada']
+            assert p['espera'] == p['retorno'] - p['duracion']
+
+        # Conservación de trabajo (el cambio de contexto de RR ocupa al núcleo)
+        if not extra.get('cambio_contexto'):
+            for t in range(max(p['final'] for p in calculados)):
+                corriendo = sum((nucleo, t) in ocupacion for nucleo in range(nucleos))
+                esperando = sum(p['llegada'] <= t < p['final'] and not en_cpu(p, t) for p in calculados)
+                assert corriendo == nucleos or esperando == 0, (t, contexto)
+
+        filas = resumir_nucleos(calculados, nucleos)
+        tabla = calcular_smp(TablaProcesos.desde_dicts(procesos), nucleos=nucleos, politica=politica, cola=cola, **extra)
+        assert resumir_nucleos(tabla, nucleos) == filas
+        assert sum(f['ticks_ocupado'] for f in filas) == sum(p['duracion'] for p in procesos)
+
+
+def test_por_nucleo_roba_de_otra_cola():
+    # P2 y P3 llegan con ambos núcleos ocupados: P2 va a la cola del núcleo
+    # 0 y P3 a la del 1. Al liberarse el núcleo 1 roba a P2 sin esperar a
+    # que termine P0, y después atiende a P3
+    procesos = [
+        {'pid': 0, 'llegada': 0, 'duracion': 10},
+        {'pid': 1, 'llegada': 0, 'duracion': 5},
+        {'pid': 2, 'llegada': 1, 'duracion': 3},
+        {'pid': 3, 'llegada': 1, 'duracion': 3},
+    ]
+    calculados = calcular_smp(procesos, nucleos=2, politica='fcfs', cola='por_nucleo')
+    assert [(p['ejecuciones'], p['nucleos']) for p in calculados] == [
+        ([(0, 10)], [0]),
+        ([(0, 5)], [1]),
+        ([(5, 3)], [1]),
+        ([(8, 3)], [1]),
+    ]
+
+
+def test_por_nucleo_migra_al_robar():
+    # Con Round Robin los expropiados vuelven a la cola de su núcleo; el
+    # robo desde otro núcleo aparece como migración
+    rng = random.Random(3)
+    migraciones = 0
+    for _ in range(50):
+        procesos = carga_aleatoria(rng, 14)
+        calculados = calcular_smp(procesos, nucleos=3, politica='rr', cola='por_nucleo', quantum=2)
+        migraciones += sum(f['migraciones'] for f in resumir_nucleos(calculados, 3))
+    assert migraciones > 0
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        calcular_smp([], nucleos=0)
+    with pytest.raises(ValueError):
+        calcular_smp([], politica='otra')
+    with pytest.raises(ValueError):
+        calcular_smp([], cola='otra')
+    with pytest.raises(ValueError):
+        calcular_smp([], politica='mlfq', refuerzo=5)
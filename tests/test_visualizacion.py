@@ -0,0 +1,46 @@
+import copy
+import random
+
+import numpy as np
+
+from utils.algoritmos import ALGORITMOS
+from utils.linea_tiempo import datos_linea_tiempo, html_linea_tiempo
+from utils.visualizacion import TEMAS_GANTT, GraficoGantt, obtener_procesos_en_espera_por_tiempo
+
+
+def test_cola_por_tramos_igual_que_por_tick():
+    rng = random.Random(4)
+    for _ in range(12):
+        procesos = [
+            {'pid': i, 'llegada': rng.randint(0, 12), 'duracion': rng.randint(1, 9), 'prioridad': rng.randint(0, 4)}
+            for i in range(rng.randint(1, 8))
+        ]
+        for motor in ALGORITMOS.values():
+            calculados = motor(copy.deepcopy(procesos))
+            tiempo_maximo = max(p['final'] for p in calculados)
+            grafico = GraficoGantt(calculados, "prueba", tiempo_maximo)
+            cola = grafico._cola
+
+            celdas = {
+                (t, int(y), etiqueta)
+                for x0, x1, y, etiqueta in zip(cola.x0, cola.x1, cola.y, cola.etiquetas)
+                for t in range(int(x0), int(x1))
+            }
+            esperadas, conteos = set(), []
+            for t, en_espera in obtener_procesos_en_espera_por_tiempo(calculados, tiempo_maximo).items():
+                en_espera = sorted(en_espera, key=lambda info: info['pid'])
+                conteos.append(len(en_espera))
+                for posicion, info in enumerate(en_espera):
+                    esperadas.add((t, -1 - posicion, f"{chr(65 + info['pid'])}{info['restante']}"))
+            assert celdas == esperadas, procesos
+            assert grafico._max_espera == np.maximum.accumulate(conteos).tolist()
+
+
+def test_linea_tiempo_sigue_el_tema():
+    procesos = [{'pid': 0, 'llegada': 0, 'duracion': 2, 'inicio': 0, 'final': 2}]
+    graficos = [datos_linea_tiempo(procesos, "FCFS")]
+    for tema, otro in (('oscuro', 'claro'), ('claro', 'oscuro')):
+        html, _ = html_linea_tiempo(graficos, tema=tema)
+        assert '__COLORES__' not in html and '__DATOS__' not in html
+        assert f"--figura: {TEMAS_GANTT[tema]['figura']}" in html
+        assert f"--figura: {TEMAS_GANTT[otro]['figura']}" not in html and TEMAS_GANTT[otro]['ejes'] not in html
@@ -0,0 +1,5 @@
+import sys
+
+from utils.lotes import main
+
+sys.exit(main())
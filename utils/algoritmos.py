@@ -0,0 +1,35 @@
+from utils.fcfs import calcular_fcfs
+from utils.mlfq import calcular_mlfq
+from utils.prioridad import calcular_prioridad
+from utils.prioridad_preemptiva import calcular_prioridad_preemptiva
+from utils.rr import calcular_rr
+from utils.sjf import calcular_sjf
+from utils.smp import calcular_smp
+from utils.srt import calcular_srt
+
+# Registro de motores por nombre corto, usado por la caché y las herramientas
+ALGORITMOS = {
+    'fcfs': calcular_fcfs,
+    'sjf': calcular_sjf,
+    'prioridad': calcular_prioridad,
+    'rr': calcular_rr,
+    'srt': calcular_srt,
+    'prioridad_preemptiva': calcular_prioridad_preemptiva,
+    'mlfq': calcular_mlfq,
+}
+
+NOMBRES = {
+    'fcfs': "FCFS",
+    'sjf': "SJF",
+    'prioridad': "Prioridad",
+    'rr': "Round Robin",
+    'srt': "SRT",
+    'prioridad_preemptiva': "Prioridad Preemptiva",
+    'mlfq': "MLFQ",
+}
+
+# Modos de simulación que corren cualquiera de las políticas anteriores (la
+# política va en los parámetros); la caché los ejecuta igual que a los motores
+MODOS = {
+    'smp': calcular_smp,
+}
@@ -0,0 +1,135 @@
+"""
+Barrido de parámetros de Round Robin (quantum × cambio de contexto)
+
+Evalúa una cuadrícula de valores sobre la misma carga y resume cada corrida
+en retorno y espera promedio y en el costo de los cambios de contexto. Los
+puntos ya calculados se toman de la caché compartida (incluidas las
+corridas completas hechas desde la página) y los faltantes se reparten en
+un pool de procesos; la carga se envía una sola vez a cada trabajador.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.cache import buscar, clave_simulacion, guardar, huella_carga
+from utils.helpers import validar_procesos
+from utils.rr import calcular_rr
+from utils.tabla import TablaProcesos
+
+# Por debajo de esta cantidad de procesos simulados en total, arrancar el
+# pool cuesta más que ejecutar el barrido en serie: el pool (fork) y el
+# retorno de los resultados cuestan del orden de 10-40 ms y un motor
+# simula unos 2-3 µs por proceso, así que con dos núcleos se gana a partir
+# de unas 25 000 simulaciones de proceso
+MIN_PROCESOS_PARALELO = 50_000
+
+# Carga del trabajador, recibida una sola vez en el inicializador del pool
+_tabla_trabajador = None
+
+
+def opciones_procesos_trabajo():
+    """
+    Valores de procesos_trabajo que ofrecen las páginas: None (automático),
+    1 (en serie) y pools de 2 a N trabajadores, con al menos 2 aunque haya
+    un solo núcleo para poder usar el pool
+    """
+    return [None] + list(range(1, max(2, os.cpu_count() or 1) + 1))
+
+
+def nombre_procesos_trabajo(procesos_trabajo):
+    """Etiqueta de un valor de opciones_procesos_trabajo"""
+    if procesos_trabajo is None:
+        return "Automático"
+    return "En serie" if procesos_trabajo == 1 else f"Pool de {procesos_trabajo} procesos"
+
+
+def resumir_rr(tabla, quantum, cambio_contexto):
+    """Métricas de una corrida RR ya calculada (TablaProcesos o lista de dicts)"""
+    if isinstance(tabla, TablaProcesos):
+        n = len(tabla)
+        retorno = int(tabla.retorno.sum())
+        espera = int(tabla.espera.sum())
+        tiempo_total = int(tabla.final.max()) if n else 0
+        despachos = len(tabla.segmentos)
+    else:
+        n = len(tabla)
+        retorno = sum(p['retorno'] for p in tabla)
+        espera = sum(p['espera'] for p in tabla)
+        tiempo_total = max((p['final'] for p in tabla), default=0)
+        despachos = sum(len(p.get('ejecuciones', [])) for p in tabla)
+
+    # calcular_rr cobra un cambio de contexto después de cada despacho
+    overhead = despachos * cambio_contexto
+    return {
+        'quantum': quantum,
+        'cambio_contexto': cambio_contexto,
+        'retorno_promedio': retorno / n if n else 0.0,
+        'espera_promedio': espera / n if n else 0.0,
+        'cambios_contexto': despachos,
+        'overhead_ticks': overhead,
+        'overhead_porcentaje': 100 * overhead / tiempo_total if tiempo_total else 0.0,
+        'tiempo_total': tiempo_total,
+    }
+
+
+def _evaluar(tabla, quantum, cambio_contexto):
+    return resumir_rr(calcular_rr(tabla.copia_entrada(), quantum, cambio_contexto), quantum, cambio_contexto)
+
+
+def _iniciar_trabajador(columnas):
+    global _tabla_trabajador
+    _tabla_trabajador = TablaProcesos(*columnas)
+
+
+def _evaluar_en_trabajador(quantum, cambio_contexto):
+    return _evaluar(_tabla_trabajador, quantum, cambio_contexto)
+
+
+def barrer_rr(procesos, quantums, cambios_contexto, procesos_trabajo=None):
+    """
+    Evalúa Round Robin en cada combinación de quantum y cambio de contexto
+
+    Devuelve (es_valido, mensaje, resultados) con un resumen por punto de la
+    cuadrícula, ordenado por cambio de contexto y quantum. procesos_trabajo
+    fija el tamaño del pool (1 = en serie; None = automático).
+    """
+    if not isinstance(procesos, TablaProcesos):
+        procesos = [dict(p) for p in procesos]
+    es_valido, mensaje = validar_procesos(procesos)
+    if not es_valido:
+        return False, mensaje, None
+
+    huella = huella_carga(procesos)
+    puntos = [(q, c) for c in cambios_contexto for q in quantums]
+    resultados = {}
+    faltantes = []
+    for quantum, cambio in puntos:
+        parametros = {'quantum': quantum, 'cambio_contexto': cambio}
+        resumen = buscar(clave_simulacion(procesos, 'rr_resumen', huella, **parametros))
+        if resumen is None:
+            # Una corrida completa hecha desde la página también sirve
+            completa = buscar(clave_simulacion(procesos, 'rr', huella, **parametros))
+            if completa is not None:
+                resumen = resumir_rr(completa, quantum, cambio)
+        if resumen is None:
+            faltantes.append((quantum, cambio))
+        else:
+            resultados[(quantum, cambio)] = resumen
+
+    if faltantes:
+        tabla = procesos if isinstance(procesos, TablaProcesos) else TablaProcesos.desde_dicts(procesos)
+        if procesos_trabajo is None:
+            paralelo = len(tabla) * len(faltantes) >= MIN_PROCESOS_PARALELO
+            procesos_trabajo = min(os.cpu_count() or 1, len(faltantes)) if paralelo else 1
+
+        if procesos_trabajo > 1:
+            columnas = (tabla.pid, tabla.llegada, tabla.duracion, tabla.prioridad)
+            with ProcessPoolExecutor(procesos_trabajo, initializer=_iniciar_trabajador, initargs=(columnas,)) as ejecutor:
+                calculados = list(ejecutor.map(_evaluar_en_trabajador, *zip(*faltantes)))
+        else:
+            calculados = [_evaluar(tabla, quantum, cambio) for quantum, cambio in faltantes]
+
+        for (quantum, cambio), resumen in zip(faltantes, calculados):
+            guardar(clave_simulacion(procesos, 'rr_resumen', huella, quantum=quantum, cambio_contexto=cambio), resumen)
+            resultados[(quantum, cambio)] = resumen
+
+    return True, mensaje, [resultados[punto] for punto in puntos]
@@ -0,0 +1,105 @@
+import copy
+import hashlib
+import json
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from utils.algoritmos import ALGORITMOS, MODOS
+from utils.helpers import PROCESOS_VALIDOS, validar_procesos
+from utils.instrumentacion import contar
+from utils.tabla import TablaProcesos
+
+MAX_ENTRADAS = 256
+
+# Caché LRU a nivel de módulo: la comparten todas las páginas y sesiones
+# que corren en el mismo servidor de Streamlit. Cada resultado se guarda
+# como una instantánea inmutable (bytes de pickle), que nadie puede
+# modificar después de guardarla y ocupa menos que los dicts
+_resultados = OrderedDict()
+_candado = threading.Lock()
+
+def huella_carga(procesos):
+    """Hash de la carga normalizada (pid, llegada, duracion, prioridad en orden de lista)"""
+    if isinstance(procesos, TablaProcesos):
+        resumen = hashlib.sha256(b'tabla')
+        for columna in (procesos.pid, procesos.llegada, procesos.duracion, procesos.prioridad):
+            resumen.update(np.ascontiguousarray(columna, dtype=np.int64).tobytes())
+        return resumen.hexdigest()
+    carga = [
+        (p.get('pid', i), p.get('llegada', 0), p.get('duracion'), p.get('prioridad'))
+        for i, p in enumerate(procesos)
+    ]
+    return hashlib.sha256(json.dumps(carga, default=str).encode()).hexdigest()
+
+def clave_simulacion(procesos, algoritmo, huella=None, **parametros):
+    """
+    Hash de la carga, el algoritmo y sus parámetros
+
+    Si ya se conoce la huella de la carga (barridos de parámetros sobre la
+    misma carga) se pasa para no volver a serializarla.
+    """
+    if huella is None:
+        huella = huella_carga(procesos)
+    contenido = json.dumps(
+        {'algoritmo': algoritmo, 'parametros': sorted(parametros.items()), 'carga': huella},
+        default=str
+    )
+    return hashlib.sha256(contenido.encode()).hexdigest()
+
+def buscar(clave):
+    """Resultado guardado bajo la clave (copia propia) o None"""
+    with _candado:
+        instantanea = _resultados.get(clave)
+        if instantanea is None:
+            return None
+        _resultados.move_to_end(clave)
+    return pickle.loads(instantanea)
+
+def guardar(clave, resultado):
+    """
+    Guarda una instantánea del resultado, desalojando las entradas menos
+    usadas; el llamador puede seguir usando (y modificando) el original
+    """
+    instantanea = pickle.dumps(resultado, protocol=pickle.HIGHEST_PROTOCOL)
+    with _candado:
+        _resultados[clave] = instantanea
+        _resultados.move_to_end(clave)
+        while len(_resultados) > MAX_ENTRADAS:
+            _resultados.popitem(last=False)
+
+def ejecutar_simulacion(algoritmo, procesos, **parametros):
+    """
+    Ejecuta un algoritmo pasando por la caché de resultados
+
+    Devuelve (es_valido, mensaje, procesos_calculados). La clave se calcula
+    sobre la carga normalizada (huella_carga completa llegada y pid por
+    defecto como validar_procesos), así que un acierto no copia ni valida
+    la carga ni vuelve a planificar (con una medición activa se anota en el
+    contador 'aciertos_cache'). Solo se guardan cargas válidas, por lo que
+    lo que está en la caché ya pasó la validación. Los procesos de entrada
+    nunca se modifican y cada llamada recibe su propia copia del resultado.
+    """
+    clave = clave_simulacion(procesos, algoritmo, **parametros)
+    resultado = buscar(clave)
+    if resultado is not None:
+        contar('aciertos_cache')
+        return True, PROCESOS_VALIDOS, resultado
+
+    procesos = copy.deepcopy(procesos)
+    es_valido, mensaje = validar_procesos(procesos)
+    if not es_valido:
+        return False, mensaje, None
+
+    motor = ALGORITMOS[algoritmo] if algoritmo in ALGORITMOS else MODOS[algoritmo]
+    resultado = motor(procesos, **parametros)
+    guardar(clave, resultado)
+
+    return True, mensaje, resultado
+
+def limpiar_cache():
+    """Vacía la caché de resultados"""
+    with _candado:
+        _resultados.clear()
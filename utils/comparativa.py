@@ -0,0 +1,140 @@
+"""
+Comparativa de algoritmos sobre una misma carga
+
+La carga se valida, se resume en su huella y se ordena por llegada una
+sola vez; los motores corren sobre copias de entrada de la misma
+TablaProcesos (columnas y orden compartidos), en un pool de procesos
+cuando la carga lo justifica. Cada resultado se devuelve con el mismo
+formato que produce la página del algoritmo y se guarda en la caché
+compartida bajo la misma clave que usaría ejecutar_simulacion.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from utils.algoritmos import ALGORITMOS
+from utils.barrido import MIN_PROCESOS_PARALELO
+from utils.cache import buscar, clave_simulacion, guardar, huella_carga
+from utils.helpers import validar_procesos
+from utils.instrumentacion import contar
+from utils.tabla import TablaProcesos
+
+# Los motores que ordenan la lista de dicts por llegada antes de planificar
+ORDENAN_POR_LLEGADA = ('fcfs', 'srt')
+
+# Carga del trabajador, recibida una sola vez en el inicializador del pool
+_tabla_trabajador = None
+
+
+def parametros_algoritmo(algoritmo, quantum, cambio_contexto, envejecimiento):
+    """Argumentos del motor del algoritmo a partir de los parámetros comunes de la comparativa"""
+    if algoritmo == 'rr':
+        return {'quantum': quantum, 'cambio_contexto': cambio_contexto}
+    if algoritmo == 'prioridad_preemptiva':
+        return {'envejecimiento': envejecimiento}
+    return {}
+
+
+def _planificar(tabla, algoritmo, parametros):
+    return ALGORITMOS[algoritmo](tabla.copia_entrada(), **parametros)
+
+
+def _iniciar_trabajador(tabla):
+    global _tabla_trabajador
+    _tabla_trabajador = tabla
+
+
+def _planificar_en_trabajador(algoritmo, parametros):
+    return _planificar(_tabla_trabajador, algoritmo, parametros)
+
+
+def _a_formato_pagina(calculada, procesos, algoritmo, parametros):
+    # Reproduce la salida de calcular_* sobre la lista de dicts
+    resultado = calculada.actualizar_dicts([dict(p) for p in procesos])
+    for p in resultado:
+        if algoritmo in ('prioridad', 'srt', 'prioridad_preemptiva'):
+            p.setdefault('prioridad', 0)
+        if algoritmo == 'rr':
+            p['quantum'] = parametros['quantum']
+    if algoritmo in ORDENAN_POR_LLEGADA:
+        resultado.sort(key=lambda p: p['llegada'])
+    return resultado
+
+
+def comparar_algoritmos(procesos, algoritmos=None, quantum=2, cambio_contexto=0, envejecimiento=0, procesos_trabajo=None):
+    """
+    Ejecuta varios algoritmos sobre la misma carga
+
+    Devuelve (es_valido, mensaje, resultados) con resultados un dict
+    algoritmo -> procesos calculados (lista de dicts, o TablaProcesos si la
+    carga es una tabla). procesos_trabajo fija el tamaño del pool
+    (1 = en serie; None = automático).
+    """
+    algoritmos = list(ALGORITMOS) if algoritmos is None else list(algoritmos)
+    es_tabla = isinstance(procesos, TablaProcesos)
+    if not es_tabla:
+        procesos = [dict(p) for p in procesos]
+    es_valido, mensaje = validar_procesos(procesos)
+    if not es_valido:
+        return False, mensaje, None
+
+    huella = huella_carga(procesos)
+    resultados = {}
+    faltantes = []
+    for algoritmo in algoritmos:
+        parametros = parametros_algoritmo(algoritmo, quantum, cambio_contexto, envejecimiento)
+        resultado = None if es_tabla else buscar(clave_simulacion(procesos, algoritmo, huella, **parametros))
+        if resultado is None:
+            faltantes.append((algoritmo, parametros))
+        else:
+            contar('aciertos_cache')
+            resultados[algoritmo] = resultado
+
+    if faltantes:
+        tabla = procesos if es_tabla else TablaProcesos.desde_dicts(procesos)
+        tabla.orden_llegada()
+        if procesos_trabajo is None:
+            paralelo = len(tabla) * len(faltantes) >= MIN_PROCESOS_PARALELO
+            procesos_trabajo = min(os.cpu_count() or 1, len(faltantes)) if paralelo else 1
+
+        if procesos_trabajo > 1:
+            with ProcessPoolExecutor(procesos_trabajo, initializer=_iniciar_trabajador, initargs=(tabla,)) as ejecutor:
+                calculadas = list(ejecutor.map(_planificar_en_trabajador, *zip(*faltantes)))
+        else:
+            calculadas = [_planificar(tabla, algoritmo, parametros) for algoritmo, parametros in faltantes]
+
+        for (algoritmo, parametros), calculada in zip(faltantes, calculadas):
+            if es_tabla:
+                resultados[algoritmo] = calculada
+                continue
+            resultado = _a_formato_pagina(calculada, procesos, algoritmo, parametros)
+            guardar(clave_simulacion(procesos, algoritmo, huella, **parametros), resultado)
+            resultados[algoritmo] = resultado
+
+    return True, mensaje, {algoritmo: resultados[algoritmo] for algoritmo in algoritmos}
+
+
+def resumir_comparativa(resultados):
+    """Filas de métricas por algoritmo: retorno, espera, respuesta, tiempo total y throughput"""
+    filas = []
+    for algoritmo, calculados in resultados.items():
+        if isinstance(calculados, TablaProcesos):
+            llegada, inicio, final, retorno, espera = (
+                getattr(calculados, c) for c in ('llegada', 'inicio', 'final', 'retorno', 'espera')
+            )
+        else:
+            llegada, inicio, final, retorno, espera = (
+                np.fromiter((p[c] for p in calculados), dtype=np.int64, count=len(calculados))
+                for c in ('llegada', 'inicio', 'final', 'retorno', 'espera')
+            )
+        tiempo_total = int(final.max())
+        filas.append({
+            'algoritmo': algoritmo,
+            'retorno_promedio': float(retorno.mean()),
+            'espera_promedio': float(espera.mean()),
+            'respuesta_promedio': float((inicio - llegada).mean()),
+            'tiempo_total': tiempo_total,
+            'throughput': len(final) / tiempo_total if tiempo_total else 0.0,
+        })
+    return filas
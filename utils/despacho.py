@@ -0,0 +1,44 @@
+import heapq
+
+import numpy as np
+
+
+def despachar_no_preemptivo(tabla, claves):
+    """
+    Motor de despacho no preemptivo compartido por SJF y Prioridad
+
+    Recorre las llegadas en orden y las inserta en un montículo ordenado por
+    la clave de cada proceso (duración, prioridad...); los empates se
+    resuelven por orden de llegada (FIFO) y, si coinciden, por posición en
+    la tabla. Cada proceso despachado se ejecuta hasta terminar.
+    Complejidad O(n log n).
+    """
+    orden = tabla.orden_llegada().tolist()
+    llegadas = tabla.llegada.tolist()
+    duraciones = tabla.duracion.tolist()
+    claves = np.asarray(claves).tolist()
+    inicios = [0] * len(orden)
+
+    listos = []
+    siguiente = 0
+    total = len(orden)
+    tiempo_actual = 0
+
+    while siguiente < total or listos:
+        while siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+            idx = orden[siguiente]
+            heapq.heappush(listos, (claves[idx], llegadas[idx], idx))
+            siguiente += 1
+
+        if not listos:
+            tiempo_actual = llegadas[orden[siguiente]]
+            continue
+
+        idx = heapq.heappop(listos)[2]
+        inicios[idx] = tiempo_actual
+        tiempo_actual += duraciones[idx]
+
+    tabla.inicio = np.asarray(inicios, dtype=np.int64)
+    tabla.final = tabla.inicio + tabla.duracion
+    tabla.calcular_metricas()
+    return tabla
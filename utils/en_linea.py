@@ -0,0 +1,478 @@
+"""
+Planificadores en línea: consumen llegadas a medida que ocurren
+
+Cada motor de ALGORITMOS (utils/algoritmos.py) tiene aquí una versión
+incremental; el modo SMP no. Los procesos
+se registran con agregar() en orden de llegada y el planificador genera
+eventos de despacho, expropiación y fin a medida que el reloj avanza. La
+memoria depende de la cola de listos, no del largo de la traza, así que
+se pueden procesar flujos sin fin (archivos, tuberías, sockets).
+
+Alimentadas en orden de llegada, las políticas producen la misma
+planificación que sus motores calcular_* (incluidos los desempates).
+
+Uso:
+    planificador = crear_planificador('rr', quantum=4)
+    for p in llegadas:                       # en orden de llegada
+        for evento in planificador.avanzar(p['llegada']):
+            ...
+        planificador.agregar(p['pid'], p['llegada'], p['duracion'])
+    for evento in planificador.terminar():
+        ...
+
+    python -m utils.en_linea traza.jsonl --algoritmo srt     # '-' = stdin
+"""
+import argparse
+import heapq
+import json
+import sys
+from abc import ABC, abstractmethod
+from collections import deque, namedtuple
+
+from utils.lotes import leer_entero, leer_filas
+from utils.mlfq import DEGRADACIONES
+from utils.trazas import leer_traza
+
+# tipo: 'despacho', 'expropiacion' o 'fin'; restante es el tiempo de CPU que
+# le falta al proceso tras el evento; retorno y espera solo se llenan en 'fin'
+Evento = namedtuple('Evento', ('tiempo', 'tipo', 'pid', 'restante', 'retorno', 'espera'))
+
+
+class _Proceso:
+    __slots__ = ('pid', 'llegada', 'duracion', 'prioridad', 'restante', 'orden', 'usado', 'epoca')
+
+    def __init__(self, pid, llegada, duracion, prioridad, orden):
+        self.pid = pid
+        self.llegada = llegada
+        self.duracion = duracion
+        self.prioridad = prioridad
+        self.restante = duracion
+        self.orden = orden
+        # Solo MLFQ: tiempo consumido en el nivel y refuerzo en que se contó
+        self.usado = 0
+        self.epoca = 0
+
+
+class _Planificador(ABC):
+    """
+    Base común: registro de llegadas y reloj
+
+    avanzar(hasta) toma todas las decisiones anteriores a 'hasta' y genera
+    sus eventos; por eso las llegadas posteriores deben registrarse con
+    llegada >= hasta. terminar() vacía el sistema sin más llegadas.
+    """
+
+    def __init__(self):
+        self.tiempo = 0
+        self._pendientes = deque()
+        self._limite = 0
+        self._registrados = 0
+
+    def agregar(self, pid, llegada, duracion, prioridad=0):
+        """Registra una llegada (en orden no decreciente de llegada)"""
+        if duracion <= 0:
+            raise ValueError(f"Proceso {pid}: Duración inválida")
+        minima = self._pendientes[-1].llegada if self._pendientes else self._limite
+        if llegada < minima:
+            raise ValueError(f"Proceso {pid}: llegada {llegada} anterior a {minima}; las llegadas deben estar en orden")
+        self._pendientes.append(_Proceso(pid, llegada, duracion, prioridad, self._registrados))
+        self._registrados += 1
+
+    def avanzar(self, hasta):
+        """Genera los eventos que ocurren antes de 'hasta'"""
+        self._limite = max(self._limite, hasta)
+        return self._simular(hasta)
+
+    def terminar(self):
+        """Genera los eventos restantes suponiendo que no hay más llegadas"""
+        return self._simular(float('inf'))
+
+    def _admitir(self, encolar):
+        while self._pendientes and self._pendientes[0].llegada <= self.tiempo:
+            encolar(self._pendientes.popleft())
+
+    def _fin(self, p):
+        retorno = self.tiempo - p.llegada
+        return Evento(self.tiempo, 'fin', p.pid, 0, retorno, retorno - p.duracion)
+
+    @abstractmethod
+    def _simular(self, limite):
+        """Generador de los eventos hasta 'limite' (ver avanzar)"""
+
+
+class PlanificadorNoExpropiativo(_Planificador):
+    """FCFS, SJF y Prioridad: montículo de (clave, llegada, orden) como despachar_no_preemptivo"""
+
+    def __init__(self, clave):
+        super().__init__()
+        self._clave = clave
+        self._listos = []
+        self._actual = None
+
+    def _encolar(self, p):
+        heapq.heappush(self._listos, (self._clave(p), p.llegada, p.orden, p))
+
+    def _simular(self, limite):
+        while True:
+            if self._actual is not None:
+                p, final = self._actual
+                if final > limite:
+                    return
+                self.tiempo = final
+                self._actual = None
+                yield self._fin(p)
+
+            if self.tiempo >= limite:
+                return
+            self._admitir(self._encolar)
+            if not self._listos:
+                if not self._pendientes:
+                    return
+                self.tiempo = self._pendientes[0].llegada
+                continue
+
+            p = heapq.heappop(self._listos)[3]
+            yield Evento(self.tiempo, 'despacho', p.pid, p.restante, None, None)
+            self._actual = (p, self.tiempo + p.restante)
+            p.restante = 0
+
+
+class PlanificadorSRT(_Planificador):
+    """SRT: el proceso con menor tiempo restante corre hasta la siguiente llegada o hasta terminar"""
+
+    def __init__(self):
+        super().__init__()
+        self._listos = []
+        self._actual = None
+
+    def _encolar(self, p):
+        heapq.heappush(self._listos, (p.restante, p.orden, p))
+
+    def _simular(self, limite):
+        previo = None
+        while True:
+            if self._actual is not None:
+                p, desde = self._actual
+                final = desde + p.restante
+                proxima = self._pendientes[0].llegada if self._pendientes else None
+                if proxima is not None and proxima < final:
+                    # Una llegada interrumpe el tramo: se decide de nuevo en 'proxima'
+                    if proxima >= limite:
+                        return
+                    self.tiempo = proxima
+                    p.restante -= proxima - desde
+                    self._actual = None
+                    self._encolar(p)
+                    previo = p
+                else:
+                    if final > limite:
+                        return
+                    self.tiempo = final
+                    p.restante = 0
+                    self._actual = None
+                    yield self._fin(p)
+
+            if self.tiempo >= limite:
+                return
+            self._admitir(self._encolar)
+            if not self._listos:
+                if not self._pendientes:
+                    return
+                self.tiempo = self._pendientes[0].llegada
+                continue
+
+            p = heapq.heappop(self._listos)[2]
+            if p is not previo:
+                if previo is not None:
+                    yield Evento(self.tiempo, 'expropiacion', previo.pid, previo.restante, None, None)
+                yield Evento(self.tiempo, 'despacho', p.pid, p.restante, None, None)
+            previo = None
+            self._actual = (p, self.tiempo)
+
+
+class PlanificadorRR(_Planificador):
+    """Round Robin con quantum y cambio de contexto tras cada tramo, como calcular_rr"""
+
+    def __init__(self, quantum=2, cambio_contexto=0):
+        super().__init__()
+        self.quantum = quantum
+        self.cambio_contexto = cambio_contexto
+        self._cola = deque()
+        self._actual = None
+
+    def _simular(self, limite):
+        while True:
+            if self._actual is not None:
+                p, final = self._actual
+                # Las llegadas hasta el fin del tramo entran antes que el expropiado
+                if final >= limite:
+                    return
+                self.tiempo = final
+                self._actual = None
+                self._admitir(self._cola.append)
+                if p.restante > 0:
+                    yield Evento(self.tiempo, 'expropiacion', p.pid, p.restante, None, None)
+                    self._cola.append(p)
+                else:
+                    yield self._fin(p)
+                self.tiempo += self.cambio_contexto
+
+            if self.tiempo >= limite:
+                return
+            self._admitir(self._cola.append)
+            if self._cola:
+                p = self._cola.popleft()
+                tramo = min(self.quantum, p.restante)
+                yield Evento(self.tiempo, 'despacho', p.pid, p.restante, None, None)
+                p.restante -= tramo
+                self._actual = (p, self.tiempo + tramo)
+            elif self._pendientes:
+                self.tiempo = max(self.tiempo, self._pendientes[0].llegada)
+            else:
+                return
+
+
+class PlanificadorPrioridadPreemptiva(_Planificador):
+    """
+    Prioridad preemptiva con envejecimiento por reloj virtual, como
+    calcular_prioridad_preemptiva: la cola es un montículo de
+    (prioridad * envejecimiento + espera_desde, orden) y el proceso en CPU
+    se corta en cada llegada y cuando el primero de la cola envejece lo
+    bastante para interrumpirlo
+    """
+
+    def __init__(self, envejecimiento=0):
+        super().__init__()
+        self._escala = envejecimiento if envejecimiento > 0 else 0
+        self._listos = []
+        self._actual = None
+        self._nivel = 0
+
+    def _clave(self, p, desde):
+        return p.prioridad * self._escala + desde if self._escala else p.prioridad
+
+    def _encolar(self, p):
+        heapq.heappush(self._listos, (self._clave(p, p.llegada), p.orden, p))
+
+    def _simular(self, limite):
+        escala = self._escala
+        while True:
+            if self._actual is not None:
+                p, desde = self._actual
+                final = desde + p.restante
+                corte = self._pendientes[0].llegada if self._pendientes else final
+                if escala and self._listos and self._nivel >= escala:
+                    corte = min(corte, self._listos[0][0] - self._nivel + escala)
+                if corte < final:
+                    # Punto de decisión antes del fin: llegada o envejecimiento
+                    if corte >= limite:
+                        return
+                    p.restante -= corte - desde
+                    self.tiempo = corte
+                    self._actual = (p, corte)
+                else:
+                    if final > limite:
+                        return
+                    self.tiempo = final
+                    p.restante = 0
+                    self._actual = None
+                    yield self._fin(p)
+
+            if self.tiempo >= limite:
+                return
+            self._admitir(self._encolar)
+
+            if self._actual is None:
+                if not self._listos:
+                    if not self._pendientes:
+                        return
+                    self.tiempo = self._pendientes[0].llegada
+                    continue
+                clave, _, p = heapq.heappop(self._listos)
+                self._nivel = max(0, clave - self.tiempo) if escala else clave
+                self._actual = (p, self.tiempo)
+                yield Evento(self.tiempo, 'despacho', p.pid, p.restante, None, None)
+            elif self._listos:
+                # Interrumpe el primero de la cola si es al menos un nivel mejor
+                p = self._actual[0]
+                if escala:
+                    expropia = self._nivel >= escala and self._listos[0][0] - self.tiempo <= self._nivel - escala
+                else:
+                    expropia = self._listos[0][0] < self._nivel
+                if expropia:
+                    heapq.heappush(self._listos, (self._clave(p, self.tiempo), p.orden, p))
+                    self._actual = None
+                    yield Evento(self.tiempo, 'expropiacion', p.pid, p.restante, None, None)
+
+
+class PlanificadorMLFQ(_Planificador):
+    """
+    MLFQ con un deque por nivel y mapa de bits de niveles no vacíos, como
+    calcular_mlfq (mismas reglas de degradación, interrupción por llegada
+    y refuerzo periódico)
+    """
+
+    def __init__(self, quantums=(2, 4, 8), refuerzo=0, degradacion='acumulado'):
+        super().__init__()
+        self.quantums = tuple(quantums)
+        if not self.quantums or min(self.quantums) <= 0:
+            raise ValueError("Cada nivel necesita un quantum positivo")
+        if degradacion not in DEGRADACIONES:
+            raise ValueError(f"Regla de degradación desconocida: {degradacion}")
+        self.refuerzo = refuerzo
+        self._por_tramo = degradacion == 'tramo'
+        self._colas = [deque() for _ in self.quantums]
+        self._mapa = 0
+        self._refuerzos = 0
+        self._proximo_refuerzo = refuerzo if refuerzo > 0 else None
+        # (proceso, nivel, inicio del tramo, fin por cuota)
+        self._actual = None
+
+    def _encolar(self, p):
+        self._colas[0].append(p)
+        self._mapa |= 1
+
+    def _simular(self, limite):
+        while True:
+            if self._actual is not None:
+                p, nivel, desde, fin = self._actual
+                # Una llegada interrumpe a los niveles inferiores y el
+                # refuerzo interrumpe a cualquiera
+                corte = fin
+                if nivel > 0 and self._pendientes:
+                    corte = min(corte, self._pendientes[0].llegada)
+                if self._proximo_refuerzo is not None:
+                    corte = min(corte, self._proximo_refuerzo)
+                # Un tramo que no termina el proceso solo se cierra cuando ya
+                # se conocen todas las llegadas hasta su fin (entran antes que él)
+                termina = corte == desde + p.restante
+                if corte > limite or (corte == limite and not termina):
+                    return
+                ejecutado = corte - desde
+                p.restante -= ejecutado
+                p.usado += ejecutado
+                self.tiempo = corte
+                self._actual = None
+                self._admitir(self._encolar)
+
+                if termina:
+                    yield self._fin(p)
+                else:
+                    if corte == fin:
+                        nivel = min(nivel + 1, len(self.quantums) - 1)
+                        p.usado = 0
+                        self._colas[nivel].append(p)
+                    else:
+                        self._colas[nivel].appendleft(p)
+                    self._mapa |= 1 << nivel
+                    yield Evento(self.tiempo, 'expropiacion', p.pid, p.restante, None, None)
+
+            if self.tiempo >= limite:
+                return
+            self._admitir(self._encolar)
+
+            if self._proximo_refuerzo is not None and self._proximo_refuerzo <= self.tiempo:
+                # Todos suben al nivel 0; 'usado' se reinicia por época
+                for cola in self._colas[1:]:
+                    self._colas[0].extend(cola)
+                    cola.clear()
+                self._mapa = 1 if self._colas[0] else 0
+                self._refuerzos += 1
+                self._proximo_refuerzo = (self.tiempo // self.refuerzo + 1) * self.refuerzo
+
+            if not self._mapa:
+                if not self._pendientes:
+                    return
+                self.tiempo = max(self.tiempo, self._pendientes[0].llegada)
+                continue
+
+            nivel = (self._mapa & -self._mapa).bit_length() - 1
+            cola = self._colas[nivel]
+            p = cola.popleft()
+            if not cola:
+                self._mapa &= ~(1 << nivel)
+            if p.epoca != self._refuerzos:
+                p.epoca = self._refuerzos
+                p.usado = 0
+            cuota = self.quantums[nivel] if self._por_tramo else self.quantums[nivel] - p.usado
+            self._actual = (p, nivel, self.tiempo, self.tiempo + min(cuota, p.restante))
+            yield Evento(self.tiempo, 'despacho', p.pid, p.restante, None, None)
+
+
+ALGORITMOS_EN_LINEA = {
+    'fcfs': lambda: PlanificadorNoExpropiativo(lambda p: 0),
+    'sjf': lambda: PlanificadorNoExpropiativo(lambda p: p.duracion),
+    'prioridad': lambda: PlanificadorNoExpropiativo(lambda p: p.prioridad),
+    'rr': PlanificadorRR,
+    'srt': PlanificadorSRT,
+    'prioridad_preemptiva': PlanificadorPrioridadPreemptiva,
+    'mlfq': PlanificadorMLFQ,
+}
+
+
+def crear_planificador(algoritmo, **parametros):
+    """
+    Planificador en línea para el algoritmo, con los mismos parámetros que
+    su motor calcular_* (quantum y cambio_contexto en RR, envejecimiento en
+    Prioridad Preemptiva, quantums, refuerzo y degradacion en MLFQ)
+    """
+    return ALGORITMOS_EN_LINEA[algoritmo](**parametros)
+
+
+def planificar_en_flujo(procesos, algoritmo, **parametros):
+    """Genera los eventos de un iterable de procesos (dicts) ordenado por llegada"""
+    planificador = crear_planificador(algoritmo, **parametros)
+    for i, p in enumerate(procesos):
+        llegada = p.get('llegada', 0)
+        yield from planificador.avanzar(llegada)
+        planificador.agregar(p.get('pid', i), llegada, p['duracion'], p.get('prioridad', 0))
+    yield from planificador.terminar()
+
+
+def _leer_procesos(ruta):
+    if ruta.endswith('.swf'):
+        # La traza se recorre por bloques: nunca se carga completa
+        for bloque in leer_traza(ruta):
+            for pid, llegada, duracion, prioridad in zip(*(getattr(bloque, c).tolist() for c in ('pid', 'llegada', 'duracion', 'prioridad'))):
+                yield {'pid': pid, 'llegada': llegada, 'duracion': duracion, 'prioridad': prioridad}
+        return
+    for i, fila in enumerate(leer_filas(ruta)):
+        yield {
+            'pid': leer_entero(fila, 'pid', i),
+            'llegada': leer_entero(fila, 'llegada', 0),
+            'duracion': leer_entero(fila, 'duracion', 0),
+            'prioridad': leer_entero(fila, 'prioridad', 0),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.en_linea',
+        description="Planifica en línea un flujo de procesos y escribe los eventos en JSONL"
+    )
+    parser.add_argument('entrada', help="Archivo .csv, .jsonl o traza .swf ordenado por llegada ('-' = stdin en JSONL)")
+    parser.add_argument('--algoritmo', choices=ALGORITMOS_EN_LINEA, default='fcfs')
+    parser.add_argument('--quantum', type=int, default=2, help="Quantum para Round Robin")
+    parser.add_argument('--cambio-contexto', type=int, default=0, help="Ticks de cambio de contexto para Round Robin")
+    parser.add_argument('--envejecimiento', type=int, default=0, help="Ticks de espera por nivel de prioridad ganado en Prioridad Preemptiva (0 = sin envejecimiento)")
+    parser.add_argument('--quantums-mlfq', default='2,4,8', help="Quantum de cada nivel de MLFQ, separados por comas")
+    parser.add_argument('--refuerzo', type=int, default=0, help="Cada cuántos ticks MLFQ sube todos los procesos al nivel 0 (0 = nunca)")
+    parser.add_argument('--degradacion', choices=DEGRADACIONES, default='acumulado', help="Regla de degradación de MLFQ")
+    args = parser.parse_args(argv)
+
+    parametros = {
+        'rr': {'quantum': args.quantum, 'cambio_contexto': args.cambio_contexto},
+        'prioridad_preemptiva': {'envejecimiento': args.envejecimiento},
+        'mlfq': {
+            'quantums': [int(q) for q in args.quantums_mlfq.split(',')],
+            'refuerzo': args.refuerzo,
+            'degradacion': args.degradacion,
+        },
+    }.get(args.algoritmo, {})
+    for evento in planificar_en_flujo(_leer_procesos(args.entrada), args.algoritmo, **parametros):
+        sys.stdout.write(json.dumps(evento._asdict()) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,19 +1,59 @@
+import numpy as np
+
+from utils.instrumentacion import instrumentado
+from utils.tabla import TablaProcesos
+
+
+@instrumentado
 def calcular_fcfs(procesos):
     """
     Implementa el algoritmo First Come First Served
+
+    Acepta una lista de dicts (se ordena y actualiza en sitio) o una
+    TablaProcesos, que se devuelve con los resultados.
     """
+    if isinstance(procesos, TablaProcesos):
+        return _planificar_fcfs(procesos)
+
     procesos.sort(key=lambda p: p['llegada'])
-    
-    tiempo_actual = 0
-    for proceso in procesos:
-        if tiempo_actual < proceso['llegada']:
-            tiempo_actual = proceso['llegada']
-        
-        proceso['inicio'] = tiempo_actual
-        proceso['final'] = tiempo_actual + proceso['duracion']
-        proceso['retorno'] = proceso['final'] - proceso['llegada']
-        proceso['espera'] = proceso['inicio'] - proceso['llegada']
-        
-        tiempo_actual = proceso['final']
-    
-    return procesos
\ No newline at end of file
+    return _planificar_fcfs(TablaProcesos.desde_dicts(procesos)).actualizar_dicts(procesos)
+
+
+def calcular_fcfs_lote(llegadas, duraciones):
+    """
+    FCFS vectorizado sobre muchas cargas a la vez
+
+    Recibe dos arreglos 2-D de forma (cargas, procesos) y devuelve los
+    arreglos inicio, final, retorno y espera con la misma forma y en el
+    mismo orden de columnas que la entrada.
+    """
+    llegadas = np.asarray(llegadas, dtype=np.int64)
+    duraciones = np.asarray(duraciones, dtype=np.int64)
+
+    orden = np.argsort(llegadas, axis=-1, kind='stable')
+    final_ordenado = _final_fcfs(
+        np.take_along_axis(llegadas, orden, axis=-1),
+        np.take_along_axis(duraciones, orden, axis=-1),
+    )
+
+    final = np.empty_like(final_ordenado)
+    np.put_along_axis(final, orden, final_ordenado, axis=-1)
+    inicio = final - duraciones
+    retorno = final - llegadas
+    return inicio, final, retorno, retorno - duraciones
+
+
+def _final_fcfs(llegadas, duraciones):
+    # Con las llegadas ordenadas: final[k] = max(final[k-1], llegada[k]) + duracion[k],
+    # que en forma cerrada es acumulada[k] + max(0, max_{j<=k}(llegada[j] - acumulada[j-1]))
+    acumulada = np.cumsum(duraciones, axis=-1)
+    holgura = np.maximum.accumulate(llegadas - (acumulada - duraciones), axis=-1)
+    return acumulada + np.maximum(holgura, 0)
+
+
+def _planificar_fcfs(tabla):
+    orden = tabla.orden_llegada()
+    tabla.final[orden] = _final_fcfs(tabla.llegada[orden], tabla.duracion[orden])
+    tabla.inicio = tabla.final - tabla.duracion
+    tabla.calcular_metricas()
+    return tabla
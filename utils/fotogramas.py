@@ -0,0 +1,124 @@
+"""
+Caché de fotogramas del diagrama de Gantt
+
+Los fotogramas ya dibujados se guardan como PNG en una caché LRU a nivel
+de módulo, compartida por todas las sesiones como la de resultados, con la
+clave (huella de la simulación, tiempo, tema). El tope es de bytes, no de
+entradas, así que la memoria queda acotada sea cual sea el tamaño de las
+imágenes.
+
+Al entregar un fotograma se encargan los siguientes a un único hilo de
+fondo, de modo que Avanzar suele encontrarlos hechos y Retroceder siempre
+los encuentra. Cada Gantt tiene a lo sumo ADELANTAR encargos en vuelo, y
+los que quedan fuera de la ventana tras un salto se cancelan antes de
+dibujarse. El hilo y la página dibujan el mismo GraficoGantt bajo su
+candado, así que nunca se pisan.
+
+El tema ('claro' u 'oscuro', ver visualizacion.tema_gantt) lo indica la
+página; cambia los colores del fotograma, así que forma parte de la clave.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_BYTES = 64 * 1024 * 1024
+# Fotogramas que se adelantan en segundo plano tras cada paso
+ADELANTAR = 3
+
+_fotogramas = OrderedDict()
+_bytes = 0
+_pendientes = {}  # clave -> Future del encargo
+_candado = threading.Lock()
+_adelantador = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fotogramas')
+
+
+def buscar(clave):
+    """PNG guardado bajo la clave o None"""
+    with _candado:
+        png = _fotogramas.get(clave)
+        if png is not None:
+            _fotogramas.move_to_end(clave)
+        return png
+
+
+def guardar(clave, png):
+    """Guarda el PNG desalojando los menos usados hasta quedar bajo MAX_BYTES"""
+    global _bytes
+    if len(png) > MAX_BYTES:
+        return
+    with _candado:
+        anterior = _fotogramas.pop(clave, None)
+        if anterior is not None:
+            _bytes -= len(anterior)
+        _fotogramas[clave] = png
+        _bytes += len(png)
+        while _bytes > MAX_BYTES:
+            _, desalojado = _fotogramas.popitem(last=False)
+            _bytes -= len(desalojado)
+
+
+def fotograma(gantt, tiempo, tema='oscuro', adelantar=ADELANTAR):
+    """
+    PNG del GraficoGantt en 'tiempo' con los colores del tema, desde la
+    caché o dibujado ahora
+
+    Encarga además en segundo plano los 'adelantar' fotogramas siguientes
+    que aún no estén en la caché.
+    """
+    clave = (gantt.huella, tiempo, tema)
+    png = buscar(clave)
+    if png is None:
+        png = gantt.png(tiempo, tema=tema)
+        guardar(clave, png)
+
+    _encargar(gantt, tiempo, tema, adelantar)
+    return png
+
+
+def _encargar(gantt, tiempo, tema, adelantar):
+    ventana = range(tiempo + 1, min(tiempo + adelantar, gantt.tiempo_maximo) + 1)
+    with _candado:
+        # Los encargos de este Gantt fuera de la ventana ya no se van a
+        # mostrar pronto: se cancelan si no empezaron. El que se está
+        # dibujando cuenta para el tope
+        en_vuelo = 0
+        for clave, futuro in list(_pendientes.items()):
+            if clave[0] != gantt.huella or clave[2] != tema:
+                continue
+            if clave[1] in ventana or not futuro.cancel():
+                en_vuelo += 1
+            else:
+                del _pendientes[clave]
+
+        for siguiente in ventana:
+            if en_vuelo >= adelantar:
+                break
+            clave = (gantt.huella, siguiente, tema)
+            if clave in _fotogramas or clave in _pendientes:
+                continue
+            # Se anota bajo el candado, antes de que el hilo pueda terminarlo
+            _pendientes[clave] = _adelantador.submit(_adelantar, gantt, siguiente, tema, clave)
+            en_vuelo += 1
+
+
+def _adelantar(gantt, tiempo, tema, clave):
+    try:
+        if buscar(clave) is None:
+            guardar(clave, gantt.png(tiempo, tema=tema))
+    finally:
+        with _candado:
+            _pendientes.pop(clave, None)
+
+
+def estadisticas_fotogramas():
+    """Fotogramas guardados, bytes ocupados y fotogramas por adelantar"""
+    with _candado:
+        return {'fotogramas': len(_fotogramas), 'bytes': _bytes, 'pendientes': len(_pendientes)}
+
+
+def limpiar_fotogramas():
+    """Vacía la caché de fotogramas"""
+    global _bytes
+    with _candado:
+        _fotogramas.clear()
+        _bytes = 0
@@ -0,0 +1,167 @@
+"""
+Generador de cargas de trabajo sintéticas reproducibles
+
+Produce procesos con llegadas Poisson, en ráfagas o simultáneas, duraciones
+exponenciales, lognormales o de cola pesada (Pareto) y prioridades uniformes
+o sesgadas. La generación es perezosa y por bloques: cada bloque es una
+TablaProcesos de tamaño fijo, así que se pueden alimentar los motores o
+escribir a disco cargas de cualquier tamaño con memoria constante.
+
+Cada característica (llegadas, duraciones, prioridades) usa su propio flujo
+aleatorio derivado de la semilla, de modo que el resultado no depende del
+tamaño de bloque elegido.
+
+Uso:
+    from utils.generador import generar_bloques, escribir_carga
+    for tabla in generar_bloques(10**9, llegadas='rafagas', duraciones='pareto'):
+        calcular_fcfs(tabla)
+    escribir_carga('traza.csv', 10**7, semilla=42)
+
+    python -m utils.generador traza.csv -n 10000000 --llegadas rafagas --duraciones pareto
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from utils.lotes import abrir_escritor
+from utils.tabla import TablaProcesos
+
+PATRONES_LLEGADA = ('poisson', 'rafagas', 'simultanea')
+DISTRIBUCIONES_DURACION = ('exponencial', 'lognormal', 'pareto')
+DISTRIBUCIONES_PRIORIDAD = ('uniforme', 'sesgada', 'constante')
+TAMANO_BLOQUE = 65_536
+
+
+def _duraciones(rng, n, distribucion, media, sigma, alfa, maxima):
+    if distribucion == 'exponencial':
+        valores = rng.exponential(media, n)
+    elif distribucion == 'lognormal':
+        # mu elegido para que la media de la lognormal sea 'media'
+        valores = rng.lognormal(np.log(media) - sigma ** 2 / 2, sigma, n)
+    elif distribucion == 'pareto':
+        # Pareto tipo I con mínimo xm y media alfa*xm/(alfa-1) = media
+        xm = media * (alfa - 1) / alfa if alfa > 1 else 1.0
+        valores = xm * (1 + rng.pareto(alfa, n))
+    else:
+        raise ValueError(f"Distribución de duración desconocida: {distribucion}")
+    return np.clip(np.rint(valores), 1, maxima).astype(np.int64)
+
+
+def _prioridades(rng, n, distribucion, maxima):
+    # random() consume un double por valor: el flujo es el mismo sin importar el bloque
+    u = rng.random(n)
+    if distribucion == 'uniforme':
+        return (u * (maxima + 1)).astype(np.int64)
+    if distribucion == 'sesgada':
+        # Geométrica truncada: la mayoría con prioridad alta (números bajos)
+        return np.minimum(np.floor(np.log1p(-u) / np.log(0.5)), maxima).astype(np.int64)
+    if distribucion == 'constante':
+        return np.zeros(n, dtype=np.int64)
+    raise ValueError(f"Distribución de prioridad desconocida: {distribucion}")
+
+
+def generar_bloques(n=None, llegadas='poisson', duraciones='exponencial', prioridades='uniforme',
+                    semilla=0, media_duracion=5.0, utilizacion=0.9, tamano_rafaga=50,
+                    sigma=1.0, alfa=1.5, duracion_maxima=10_000, prioridad_maxima=10,
+                    tamano_bloque=TAMANO_BLOQUE):
+    """
+    Genera la carga en bloques de TablaProcesos (n=None = sin fin)
+
+    El tiempo medio entre llegadas es media_duracion / utilizacion, así que
+    'utilizacion' aproxima la carga de la CPU. En 'rafagas' llegan juntos
+    tamano_rafaga procesos (la primera en t=0) y el silencio entre ráfagas
+    conserva esa tasa.
+    """
+    if llegadas not in PATRONES_LLEGADA:
+        raise ValueError(f"Patrón de llegada desconocido: {llegadas}")
+
+    rng_llegadas, rng_duraciones, rng_prioridades = (
+        np.random.default_rng(s) for s in np.random.SeedSequence(semilla).spawn(3)
+    )
+    entre_llegadas = media_duracion / utilizacion
+
+    generados = 0
+    tiempo = 0.0
+    while n is None or generados < n:
+        tamano = tamano_bloque if n is None else min(tamano_bloque, n - generados)
+        indices = np.arange(generados, generados + tamano, dtype=np.int64)
+
+        if llegadas == 'poisson':
+            marcas = tiempo + np.cumsum(rng_llegadas.exponential(entre_llegadas, tamano))
+            tiempo = float(marcas[-1])
+            llegada = marcas.astype(np.int64)
+        elif llegadas == 'rafagas':
+            primera = generados // tamano_rafaga
+            rafaga = indices // tamano_rafaga - primera
+            # Si el bloque empieza a mitad de una ráfaga, ésta conserva su inicio
+            # ('tiempo' es siempre el inicio de la última ráfaga sorteada)
+            continua = generados % tamano_rafaga != 0
+            huecos = rng_llegadas.exponential(tamano_rafaga * entre_llegadas, rafaga[-1] + 1 - continua)
+            if generados == 0:
+                huecos[0] = 0.0  # la primera ráfaga llega en t=0
+            inicios = tiempo + np.cumsum(huecos)
+            if continua:
+                inicios = np.concatenate(([tiempo], inicios))
+            tiempo = float(inicios[-1])
+            llegada = inicios[rafaga].astype(np.int64)
+        else:
+            llegada = np.zeros(tamano, dtype=np.int64)
+
+        duracion = _duraciones(rng_duraciones, tamano, duraciones, media_duracion, sigma, alfa, duracion_maxima)
+        prioridad = _prioridades(rng_prioridades, tamano, prioridades, prioridad_maxima)
+
+        generados += tamano
+        yield TablaProcesos(indices, llegada, duracion, prioridad)
+
+
+def generar_procesos(n=None, **opciones):
+    """Itera los procesos uno a uno como dicts (pid, llegada, duracion, prioridad)"""
+    for tabla in generar_bloques(n, **opciones):
+        columnas = (tabla.pid.tolist(), tabla.llegada.tolist(), tabla.duracion.tolist(), tabla.prioridad.tolist())
+        for pid, llegada, duracion, prioridad in zip(*columnas):
+            yield {'pid': pid, 'llegada': llegada, 'duracion': duracion, 'prioridad': prioridad}
+
+
+def generar_lista(n, **opciones):
+    """Lista de n procesos lista para las páginas o los motores calcular_*"""
+    return list(generar_procesos(n, **opciones))
+
+
+def escribir_carga(ruta, n, **opciones):
+    """Escribe n procesos a CSV o JSONL ('-' = stdout) en flujo, compatible con python -m utils"""
+    archivo, escribir = abrir_escritor(ruta, ('pid', 'llegada', 'duracion', 'prioridad'))
+    try:
+        for tabla in generar_bloques(n, **opciones):
+            for fila in zip(tabla.pid.tolist(), tabla.llegada.tolist(), tabla.duracion.tolist(), tabla.prioridad.tolist()):
+                escribir(fila)
+    finally:
+        if archivo is not None and ruta != '-':
+            archivo.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.generador',
+        description="Genera una carga sintética en CSV o JSONL para python -m utils"
+    )
+    parser.add_argument('salida', help="Archivo .csv o .jsonl ('-' = stdout)")
+    parser.add_argument('-n', '--procesos', type=int, default=1000)
+    parser.add_argument('--llegadas', choices=PATRONES_LLEGADA, default='poisson')
+    parser.add_argument('--duraciones', choices=DISTRIBUCIONES_DURACION, default='exponencial')
+    parser.add_argument('--prioridades', choices=DISTRIBUCIONES_PRIORIDAD, default='uniforme')
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--media-duracion', type=float, default=5.0)
+    parser.add_argument('--utilizacion', type=float, default=0.9)
+    args = parser.parse_args(argv)
+
+    escribir_carga(
+        args.salida, args.procesos,
+        llegadas=args.llegadas, duraciones=args.duraciones, prioridades=args.prioridades,
+        semilla=args.semilla, media_duracion=args.media_duracion, utilizacion=args.utilizacion
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,26 @@
+import numpy as np
+
+from utils.instrumentacion import fase
+from utils.tabla import TablaProcesos
+
+# Mensaje de validar_procesos para una carga válida
+PROCESOS_VALIDOS = "Procesos válidos"
+
 def validar_procesos(procesos):
     """Valida que la lista de procesos sea correcta"""
-    if not procesos:
+    with fase('validacion'):
+        return _validar_procesos(procesos)
+
+def _validar_procesos(procesos):
+    if not len(procesos):
         return False, "No hay procesos definidos"
     
+    if isinstance(procesos, TablaProcesos):
+        invalidos = np.flatnonzero(procesos.duracion <= 0)
+        if len(invalidos):
+            return False, f"Proceso {invalidos[0]}: Duración inválida"
+        return True, PROCESOS_VALIDOS
+    
     for i, proceso in enumerate(procesos):
         if 'duracion' not in proceso or proceso['duracion'] <= 0:
             return False, f"Proceso {i}: Duración inválida"
@@ -11,12 +29,14 @@ def validar_procesos(procesos):
         if 'pid' not in proceso:
             proceso['pid'] = i
     
-    return True, "Procesos válidos"
+    return True, PROCESOS_VALIDOS
 
 def calcular_tiempo_total(procesos):
     """Calcula el tiempo total de simulación"""
-    if not procesos:
+    if not len(procesos):
         return 0
+    if isinstance(procesos, TablaProcesos):
+        return int(procesos.final.max())
     return max(p.get('final', 0) for p in procesos)
 
 def formatear_tiempo(tiempo):
@@ -0,0 +1,250 @@
+"""
+Instrumentación opcional de los motores calcular_*
+
+Dentro de un bloque medir() cada motor anota el tiempo de pared de sus
+fases y los contadores de su planificación; fuera de él la instrumentación
+cuesta una consulta a una ContextVar por llamada al motor y por fase, y
+nada dentro de los bucles de simulación. La medición es propia del hilo (y
+de la sesión de Streamlit) que la abre; los motores que corren en los
+trabajadores de un pool no se miden.
+
+Fases (tiempo exclusivo: una fase anidada se descuenta de la que la contiene):
+    validacion     validar_procesos
+    preparacion    conversión de la lista de dicts a TablaProcesos
+    planificacion  el bucle de despacho del motor
+    postproceso    inicio/final desde los tramos, métricas y escritura de los dicts
+
+Contadores derivados: no se cuentan en los sitios de push/pop de la
+simulación (eso costaría dentro de los bucles), sino que se reconstruyen
+del plan que emite el motor, donde cada tramo es una decisión suya. Son
+exactos para tramos, despachos y expropiaciones; operaciones_cola es la
+cuenta mínima que el plan implica, no las operaciones que hizo el motor:
+    procesos         procesos planificados
+    tramos           tramos de CPU emitidos
+    despachos        tramos que no continúan al mismo proceso en el mismo núcleo
+    expropiaciones   tramos que terminan con trabajo pendiente (quantum agotado o expropiación)
+    operaciones_cola entradas a la cola de listos (llegadas y reencolados) más extracciones (un tramo cada una)
+    saltos_ocioso    veces que el reloj salta sobre un intervalo sin procesos en el sistema
+
+Contadores medidos en el sitio donde ocurren:
+    aciertos_cache   simulaciones resueltas por la caché sin llamar al motor
+
+Uso:
+    with medir() as medicion:
+        calcular_rr(procesos, quantum=3)
+    print(medicion.a_json(indent=2))
+"""
+import json
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+import numpy as np
+
+FASES = ('validacion', 'preparacion', 'planificacion', 'postproceso')
+DERIVADOS = ('procesos', 'tramos', 'despachos', 'expropiaciones', 'operaciones_cola', 'saltos_ocioso')
+CONTADORES = DERIVADOS + ('aciertos_cache',)
+
+_medicion_activa = ContextVar('medicion_activa', default=None)
+_sin_medicion = nullcontext()
+
+
+class Medicion:
+    """Tiempos por fase y contadores acumulados durante un bloque medir()"""
+
+    def __init__(self):
+        self.fases = dict.fromkeys(FASES, 0.0)
+        self.contadores = dict.fromkeys(CONTADORES, 0)
+        # Por motor: llamadas, tiempo total y sus propios contadores
+        self.motores = {}
+        self.total = 0.0
+        self._pila = []
+
+    def fase(self, nombre):
+        """Context manager que acumula el tiempo exclusivo de la fase"""
+        return _Fase(self, nombre)
+
+    def contar(self, nombre, cantidad=1):
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def registrar_motor(self, motor, resultado, segundos):
+        """Suma los contadores del plan calculado por una llamada al motor"""
+        contadores = contar_plan(resultado)
+        registro = self.motores.setdefault(motor, {'llamadas': 0, 'tiempo': 0.0, **dict.fromkeys(DERIVADOS, 0)})
+        registro['llamadas'] += 1
+        registro['tiempo'] += segundos
+        for nombre, valor in contadores.items():
+            registro[nombre] += valor
+            self.contar(nombre, valor)
+
+    def a_dict(self):
+        """Informe serializable: tiempos en segundos y contadores enteros"""
+        return {
+            'total': self.total,
+            'fases': dict(self.fases),
+            'contadores': dict(self.contadores),
+            'motores': {motor: dict(registro) for motor, registro in self.motores.items()},
+        }
+
+    def a_json(self, **opciones):
+        return json.dumps(self.a_dict(), **opciones)
+
+
+class _Fase:
+    __slots__ = ('medicion', 'nombre')
+
+    def __init__(self, medicion, nombre):
+        self.medicion = medicion
+        self.nombre = nombre
+
+    def __enter__(self):
+        ahora = perf_counter()
+        pila = self.medicion._pila
+        if pila:
+            # Pausa la fase que contiene a esta
+            externa = pila[-1]
+            self.medicion.fases[externa[0]] += ahora - externa[1]
+        pila.append([self.nombre, ahora])
+
+    def __exit__(self, *excepcion):
+        ahora = perf_counter()
+        pila = self.medicion._pila
+        nombre, desde = pila.pop()
+        fases = self.medicion.fases
+        fases[nombre] = fases.get(nombre, 0.0) + ahora - desde
+        if pila:
+            pila[-1][1] = ahora
+        return False
+
+
+@contextmanager
+def medir():
+    """Activa la instrumentación en el bloque y entrega la Medicion"""
+    medicion = Medicion()
+    token = _medicion_activa.set(medicion)
+    inicio = perf_counter()
+    try:
+        yield medicion
+    finally:
+        medicion.total = perf_counter() - inicio
+        _medicion_activa.reset(token)
+
+
+def medicion_activa():
+    """La Medicion en curso o None"""
+    return _medicion_activa.get()
+
+
+def fase(nombre):
+    """Mide la fase si hay una medición activa; si no, un contexto vacío"""
+    medicion = _medicion_activa.get()
+    return _sin_medicion if medicion is None else medicion.fase(nombre)
+
+
+def contar(nombre, cantidad=1):
+    """Suma al contador si hay una medición activa"""
+    medicion = _medicion_activa.get()
+    if medicion is not None:
+        medicion.contar(nombre, cantidad)
+
+
+def instrumentado(motor):
+    """
+    Decorador de los calcular_*: sin medición activa llama al motor tal
+    cual; con ella mide la llamada como planificación y cuenta su plan
+    """
+    nombre = motor.__name__[len('calcular_'):]
+
+    @wraps(motor)
+    def envoltura(*args, **kwargs):
+        medicion = _medicion_activa.get()
+        if medicion is None:
+            return motor(*args, **kwargs)
+        inicio = perf_counter()
+        with medicion.fase('planificacion'):
+            resultado = motor(*args, **kwargs)
+        medicion.registrar_motor(nombre, resultado, perf_counter() - inicio)
+        return resultado
+
+    return envoltura
+
+
+def contar_plan(procesos):
+    """
+    Contadores del plan calculado (TablaProcesos o lista de dicts)
+
+    Los motores no preemptivos no guardan tramos: cada proceso con
+    duración es un tramo [inicio, inicio + duracion).
+    """
+    if isinstance(procesos, list):
+        llegada = np.fromiter((p.get('llegada', 0) for p in procesos), dtype=np.int64, count=len(procesos))
+        final = np.fromiter((p.get('final', 0) for p in procesos), dtype=np.int64, count=len(procesos))
+        if procesos and 'ejecuciones' in procesos[0]:
+            proceso, inicio, duracion, nucleo = [], [], [], []
+            for i, p in enumerate(procesos):
+                for inicio_tramo, duracion_tramo in p['ejecuciones']:
+                    proceso.append(i)
+                    inicio.append(inicio_tramo)
+                    duracion.append(duracion_tramo)
+                nucleo.extend(p.get('nucleos', ()))
+            proceso, inicio, duracion, nucleo = (np.asarray(c, dtype=np.int64) for c in (proceso, inicio, duracion, nucleo))
+            if len(nucleo) != len(proceso):
+                nucleo = None
+        else:
+            duraciones = np.fromiter((p.get('duracion', 0) for p in procesos), dtype=np.int64, count=len(procesos))
+            inicios = np.fromiter((p.get('inicio', 0) for p in procesos), dtype=np.int64, count=len(procesos))
+            proceso = np.flatnonzero(duraciones > 0)
+            inicio, duracion, nucleo = inicios[proceso], duraciones[proceso], None
+    else:
+        llegada, final = procesos.llegada, procesos.final
+        if procesos.segmentos is not None:
+            proceso, inicio, duracion = procesos.segmentos.columnas()
+            nucleo = procesos.nucleos
+        else:
+            proceso = np.flatnonzero(procesos.duracion > 0)
+            inicio, duracion, nucleo = procesos.inicio[proceso], procesos.duracion[proceso], None
+
+    tramos = len(proceso)
+    con_tramos = len(np.unique(proceso))
+    expropiaciones = tramos - con_tramos
+
+    # Continuaciones: el mismo proceso sigue sin pausa en el mismo núcleo
+    if nucleo is None:
+        nucleo = np.zeros(tramos, dtype=np.int64)
+    orden = np.lexsort((inicio, nucleo))
+    proceso, inicio, fin, nucleo = proceso[orden], inicio[orden], (inicio + duracion)[orden], nucleo[orden]
+    continuaciones = int(np.count_nonzero(
+        (nucleo[1:] == nucleo[:-1]) & (proceso[1:] == proceso[:-1]) & (inicio[1:] == fin[:-1])
+    ))
+
+    # Saltos: llegadas posteriores a todo lo que había en el sistema
+    orden = np.argsort(llegada, kind='stable')
+    llegada, final = llegada[orden], final[orden]
+    saltos = 0
+    if len(llegada):
+        ocupado_hasta = np.maximum.accumulate(final)
+        saltos = int(llegada[0] > 0) + int(np.count_nonzero(llegada[1:] > ocupado_hasta[:-1]))
+
+    return {
+        'procesos': len(llegada),
+        'tramos': tramos,
+        'despachos': tramos - continuaciones,
+        'expropiaciones': expropiaciones,
+        'operaciones_cola': con_tramos + expropiaciones + tramos,
+        'saltos_ocioso': saltos,
+    }
+
+
+def filas_rendimiento(informe):
+    """Filas (medida, valor) de un informe de Medicion.a_dict para mostrarlo en tabla"""
+    filas = [{'medida': 'Tiempo total (ms)', 'valor': round(informe['total'] * 1000, 3)}]
+    filas += [
+        {'medida': f'Fase {nombre} (ms)', 'valor': round(segundos * 1000, 3)}
+        for nombre, segundos in informe['fases'].items()
+    ]
+    filas += [
+        {'medida': nombre.replace('_', ' ').capitalize() + (' (derivado del plan)' if nombre in DERIVADOS else ''), 'valor': valor}
+        for nombre, valor in informe['contadores'].items()
+    ]
+    return filas
@@ -0,0 +1,390 @@
+"""
+Línea de tiempo animada en el navegador
+
+Alternativa a GraficoGantt para la reproducción: el plan calculado se
+envía una sola vez como JSON compacto a un componente HTML con un canvas,
+y reproducir, pausar, adelantar, retroceder, arrastrar el cursor y hacer
+zoom (rueda del ratón; arrastrar desplaza, doble clic ajusta) ocurren en
+el navegador sin volver a ejecutar nada en el servidor. Conserva los dos
+paneles del Gantt: ejecución (un carril por núcleo en SMP) y cola de
+procesos en espera.
+
+El fondo, los bordes y los textos siguen el tema del Gantt
+(visualizacion.TEMAS_GANTT), así que la animación combina con la página.
+
+Uso en una página:
+    html, alto = html_linea_tiempo([datos_linea_tiempo(procesos, "Round Robin")], tema=tema_gantt(st.context))
+    components.html(html, height=alto)
+"""
+import json
+
+from matplotlib.colors import to_hex
+
+from utils.visualizacion import TEMAS_GANTT, apilar_intervalos_espera, generar_colores, obtener_intervalos_espera
+
+# Geometría en píxeles, compartida con el script del componente
+GEOMETRIA = {
+    'controles': 46,
+    'titulo': 24,
+    'carril': 28,
+    'celda': 20,
+    'eje': 22,
+    'separacion': 14,
+    'margen_izquierdo': 58,
+    'margen_derecho': 12,
+}
+
+
+def datos_linea_tiempo(procesos, algoritmo, tiempo_maximo=None, nucleos=None):
+    """
+    Plan de una simulación (lista de dicts) en la forma compacta que
+    dibuja el componente
+
+    Los tramos van aplanados como [inicio, duracion, proceso, carril, ...]
+    y la cola como [desde, hasta, proceso, posicion, restante, ...], con
+    'proceso' el índice en la lista 'procesos' ([etiqueta, color]).
+    """
+    if tiempo_maximo is None:
+        tiempo_maximo = max([p.get('final', 0) for p in procesos]) if procesos else 0
+    multinucleo = any('nucleos' in p for p in procesos)
+    if multinucleo and nucleos is None:
+        nucleos = max((n for p in procesos for n in p['nucleos']), default=0) + 1
+    carriles = nucleos if multinucleo else 1
+
+    colores = [to_hex(color) for color in generar_colores(len(procesos))]
+    indice_por_pid = {p['pid']: i for i, p in enumerate(procesos)}
+
+    tramos = []
+    for i, proceso in enumerate(procesos):
+        if 'ejecuciones' in proceso:
+            ejecuciones = proceso['ejecuciones']
+        elif 'inicio' in proceso:
+            ejecuciones = [(proceso['inicio'], proceso['duracion'])]
+        else:
+            ejecuciones = []
+        nucleos_tramo = proceso['nucleos'] if multinucleo else [0] * len(ejecuciones)
+        for (inicio, duracion), nucleo in zip(ejecuciones, nucleos_tramo):
+            tramos.append((inicio, duracion, i, nucleo))
+    tramos.sort()
+
+    piezas, max_espera = apilar_intervalos_espera(obtener_intervalos_espera(procesos, tiempo_maximo))
+    espera = sorted(
+        [desde, hasta, indice_por_pid[pid], posicion, restante] for desde, hasta, pid, posicion, restante in piezas
+    )
+
+    return {
+        'titulo': f"Ejecución - Algoritmo {algoritmo}",
+        'tiempo_maximo': tiempo_maximo,
+        'carriles': carriles,
+        'multinucleo': multinucleo,
+        'procesos': [[chr(65 + p['pid']), colores[i]] for i, p in enumerate(procesos)],
+        'tramos': [valor for tramo in tramos for valor in tramo],
+        'espera': [valor for pieza in espera for valor in pieza],
+        'max_espera': max_espera,
+    }
+
+
+def alto_linea_tiempo(graficos):
+    """Alto en píxeles del componente para los gráficos dados"""
+    g = GEOMETRIA
+    alto = g['controles']
+    for grafico in graficos:
+        alto += 2 * (g['titulo'] + g['eje']) + g['separacion']
+        alto += grafico['carriles'] * g['carril'] + max(1, grafico['max_espera']) * g['celda']
+    return alto
+
+
+def html_linea_tiempo(graficos, tema='oscuro'):
+    """
+    Documento HTML autocontenido del componente y su alto en píxeles
+
+    Con varios gráficos (comparativa) comparten el eje de tiempo, el
+    cursor y los controles. tema es el del Gantt ('claro' u 'oscuro').
+    """
+    datos = {
+        'tiempo_maximo': max((g['tiempo_maximo'] for g in graficos), default=0),
+        'graficos': graficos,
+        'geometria': GEOMETRIA,
+        'colores': TEMAS_GANTT[tema],
+    }
+    # '</' escapado para que el JSON no pueda cerrar la etiqueta <script>
+    carga = json.dumps(datos, separators=(',', ':')).replace('</', '<\\/')
+    colores = '; '.join(f"--{nombre}: {color}" for nombre, color in TEMAS_GANTT[tema].items())
+    return _PLANTILLA.replace('__COLORES__', colores).replace('__DATOS__', carga), alto_linea_tiempo(graficos)
+
+
+_PLANTILLA = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><style>
+:root { __COLORES__; }
+body { margin: 0; background: var(--figura); color: var(--texto); font-family: "Source Sans Pro", sans-serif; font-size: 13px; user-select: none; }
+#controles { display: flex; gap: 6px; align-items: center; height: 46px; padding: 0 4px; box-sizing: border-box; }
+button, select { background: var(--ejes); color: var(--texto); border: 1px solid var(--bordes); border-radius: 6px; padding: 4px 10px; cursor: pointer; font-size: 13px; }
+button:hover { border-color: #ff4b4b; }
+#cursor { flex: 1; min-width: 80px; accent-color: #ff4b4b; }
+#reloj { min-width: 110px; text-align: right; font-weight: bold; }
+canvas { display: block; width: 100%; cursor: grab; }
+</style></head><body>
+<div id="controles">
+  <button id="reiniciar" title="Reiniciar">⏮️</button>
+  <button id="retroceder" title="Retroceder un tick">◀️</button>
+  <button id="reproducir" title="Reproducir / pausar (espacio)">▶️</button>
+  <button id="avanzar" title="Avanzar un tick">▶️|</button>
+  <button id="final" title="Ver todo">⏭️</button>
+  <select id="velocidad" title="Ticks por segundo">
+    <option value="1">1×</option><option value="2" selected>2×</option><option value="5">5×</option>
+    <option value="10">10×</option><option value="25">25×</option><option value="100">100×</option>
+  </select>
+  <input id="cursor" type="range" min="0" step="any" value="0">
+  <span id="reloj"></span>
+  <button id="ajustar" title="Quitar el zoom (doble clic)">🔍 Ajustar</button>
+</div>
+<canvas id="lienzo"></canvas>
+<script>
+const DATOS = __DATOS__;
+const G = DATOS.geometria;
+const C = DATOS.colores;
+const T = DATOS.tiempo_maximo;
+const lienzo = document.getElementById('lienzo');
+const ctx = lienzo.getContext('2d');
+const cursor = document.getElementById('cursor');
+const reloj = document.getElementById('reloj');
+const botonReproducir = document.getElementById('reproducir');
+cursor.max = T;
+
+let tiempo = 0, reproduciendo = false, ultimoCuadro = null;
+let vista = [-0.5, T + 1];
+let arrastre = null;
+
+function altoGrafico(g) {
+  return 2 * (G.titulo + G.eje) + G.separacion + g.carriles * G.carril + Math.max(1, g.max_espera) * G.celda;
+}
+const ALTO = DATOS.graficos.reduce((total, g) => total + altoGrafico(g), 0);
+
+function ajustarLienzo() {
+  const dpr = window.devicePixelRatio || 1;
+  lienzo.style.height = ALTO + 'px';
+  lienzo.width = Math.round(lienzo.clientWidth * dpr);
+  lienzo.height = Math.round(ALTO * dpr);
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+}
+
+function anchoUtil() { return lienzo.clientWidth - G.margen_izquierdo - G.margen_derecho; }
+function aX(t) { return G.margen_izquierdo + (t - vista[0]) / (vista[1] - vista[0]) * anchoUtil(); }
+function aTiempo(x) { return vista[0] + (x - G.margen_izquierdo) / anchoUtil() * (vista[1] - vista[0]); }
+
+function paso() {
+  // Separación entre marcas del eje de al menos 40 px
+  const porTick = anchoUtil() / (vista[1] - vista[0]);
+  for (const p of [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000]) {
+    if (p * porTick >= 40) return p;
+  }
+  return Math.pow(10, Math.ceil(Math.log10(40 / porTick)));
+}
+
+function etiqueta(texto, x0, x1, y) {
+  if (x1 - x0 >= texto.length * 8.5) ctx.fillText(texto, (x0 + x1) / 2, y);
+}
+
+function panel(y, alto, titulo, marcas) {
+  ctx.fillStyle = C.texto;
+  ctx.font = 'bold 14px sans-serif';
+  ctx.textAlign = 'center';
+  ctx.textBaseline = 'middle';
+  ctx.fillText(titulo, lienzo.clientWidth / 2, y + G.titulo / 2);
+  const arriba = y + G.titulo;
+  ctx.fillStyle = C.ejes;
+  ctx.fillRect(G.margen_izquierdo, arriba, anchoUtil(), alto);
+  ctx.strokeStyle = C.bordes;
+  ctx.strokeRect(G.margen_izquierdo, arriba, anchoUtil(), alto);
+  ctx.font = '11px sans-serif';
+  ctx.textBaseline = 'top';
+  for (let t = Math.ceil(Math.max(vista[0], 0) / marcas) * marcas; t <= vista[1]; t += marcas) {
+    const x = aX(t);
+    // Rejilla tenue del color del texto, legible en ambos temas
+    ctx.strokeStyle = C.texto;
+    ctx.globalAlpha = 0.12;
+    ctx.beginPath(); ctx.moveTo(x, arriba); ctx.lineTo(x, arriba + alto); ctx.stroke();
+    ctx.globalAlpha = 1;
+    ctx.fillStyle = C.texto;
+    ctx.fillText(String(t), x, arriba + alto + 4);
+  }
+  return arriba;
+}
+
+function cursorRojo(arriba, alto) {
+  const x = aX(tiempo);
+  if (x < G.margen_izquierdo || x > G.margen_izquierdo + anchoUtil()) return;
+  ctx.strokeStyle = 'rgba(255,0,0,0.8)';
+  ctx.lineWidth = 2;
+  ctx.setLineDash([6, 4]);
+  ctx.beginPath(); ctx.moveTo(x, arriba); ctx.lineTo(x, arriba + alto); ctx.stroke();
+  ctx.setLineDash([]);
+  ctx.lineWidth = 1;
+  ctx.fillStyle = '#ff4b4b';
+  ctx.font = 'bold 12px sans-serif';
+  ctx.textAlign = 'left';
+  ctx.textBaseline = 'top';
+  ctx.fillText(' T=' + Math.floor(tiempo), x, arriba + 2);
+}
+
+function dibujarGrafico(g, y, marcas) {
+  const izquierda = G.margen_izquierdo, derecha = G.margen_izquierdo + anchoUtil();
+  // Panel de ejecución: tramos recortados en el tiempo actual
+  const altoEjecucion = g.carriles * G.carril;
+  let arriba = panel(y, altoEjecucion, g.titulo, marcas);
+  ctx.save();
+  ctx.beginPath(); ctx.rect(izquierda, arriba, anchoUtil(), altoEjecucion); ctx.clip();
+  const tr = g.tramos;
+  for (let i = 0; i < tr.length; i += 4) {
+    const inicio = tr[i];
+    if (inicio >= tiempo || inicio > vista[1]) break;
+    const fin = Math.min(inicio + tr[i + 1], tiempo);
+    if (fin < vista[0]) continue;
+    const [texto, color] = g.procesos[tr[i + 2]];
+    const x0 = aX(inicio), x1 = aX(fin);
+    const yc = arriba + tr[i + 3] * G.carril + 3;
+    ctx.globalAlpha = 0.8;
+    ctx.fillStyle = color;
+    ctx.fillRect(x0, yc, Math.max(x1 - x0, 1), G.carril - 6);
+    ctx.globalAlpha = 1;
+    ctx.fillStyle = '#ffffff';
+    ctx.font = 'bold 12px sans-serif';
+    ctx.textAlign = 'center';
+    ctx.textBaseline = 'middle';
+    etiqueta(texto, Math.max(x0, izquierda), Math.min(x1, derecha), yc + (G.carril - 6) / 2);
+  }
+  ctx.restore();
+  if (g.multinucleo) {
+    ctx.fillStyle = C.texto;
+    ctx.font = '11px sans-serif';
+    ctx.textAlign = 'right';
+    ctx.textBaseline = 'middle';
+    for (let c = 0; c < g.carriles; c++) ctx.fillText('CPU ' + c, izquierda - 6, arriba + c * G.carril + G.carril / 2);
+  }
+  cursorRojo(arriba, altoEjecucion);
+
+  // Cola de espera: celdas de tick completo [t, t+1) hasta el tick actual
+  y = arriba + altoEjecucion + G.eje;
+  const altoCola = Math.max(1, g.max_espera) * G.celda;
+  arriba = panel(y, altoCola, 'Cola de Procesos en Espera', marcas);
+  ctx.save();
+  ctx.beginPath(); ctx.rect(izquierda, arriba, anchoUtil(), altoCola); ctx.clip();
+  const corte = Math.floor(tiempo) + 1;
+  const porTick = anchoUtil() / (vista[1] - vista[0]);
+  const es = g.espera;
+  for (let i = 0; i < es.length; i += 5) {
+    const desde = es[i];
+    if (desde >= corte || desde > vista[1]) break;
+    const hasta = Math.min(es[i + 1], corte);
+    if (hasta < vista[0]) continue;
+    const [texto, color] = g.procesos[es[i + 2]];
+    const yc = arriba + es[i + 3] * G.celda + 2;
+    ctx.globalAlpha = 0.6;
+    ctx.fillStyle = color;
+    ctx.fillRect(aX(desde), yc, aX(hasta) - aX(desde), G.celda - 4);
+    ctx.globalAlpha = 1;
+    ctx.fillStyle = '#ffffff';
+    ctx.font = 'bold 10px sans-serif';
+    ctx.textAlign = 'center';
+    ctx.textBaseline = 'middle';
+    const rotulo = texto + es[i + 4];
+    if (porTick >= rotulo.length * 8.5) {
+      // Una etiqueta por tick visible, como el Gantt del servidor
+      for (let t = Math.max(desde, Math.floor(vista[0])); t < hasta && t <= vista[1]; t++) {
+        ctx.fillText(rotulo, aX(t + 0.5), yc + (G.celda - 4) / 2);
+      }
+    } else {
+      etiqueta(rotulo, Math.max(aX(desde), izquierda), Math.min(aX(hasta), derecha), yc + (G.celda - 4) / 2);
+    }
+  }
+  ctx.restore();
+  cursorRojo(arriba, altoCola);
+  return arriba + altoCola + G.eje + G.separacion;
+}
+
+function dibujar() {
+  ctx.clearRect(0, 0, lienzo.clientWidth, ALTO);
+  const marcas = paso();
+  let y = 0;
+  for (const g of DATOS.graficos) y = dibujarGrafico(g, y, marcas);
+  cursor.value = tiempo;
+  reloj.textContent = 'Tiempo ' + Math.floor(tiempo) + ' / ' + T;
+  botonReproducir.textContent = reproduciendo ? '⏸️' : '▶️';
+}
+
+function irA(t) {
+  tiempo = Math.min(Math.max(t, 0), T);
+  if (tiempo >= T) reproduciendo = false;
+  // Con zoom, la vista sigue al cursor
+  const margen = (vista[1] - vista[0]) * 0.05;
+  if (tiempo > vista[1] - margen || tiempo < vista[0]) {
+    const ancho = vista[1] - vista[0];
+    vista = [tiempo - ancho * 0.2, tiempo + ancho * 0.8];
+    limitarVista();
+  }
+  dibujar();
+}
+
+function limitarVista() {
+  const ancho = Math.min(vista[1] - vista[0], T + 1.5);
+  let inicio = Math.max(vista[0], -0.5);
+  inicio = Math.min(inicio, T + 1 - ancho);
+  vista = [inicio, inicio + ancho];
+}
+
+function cuadro(marca) {
+  if (!reproduciendo) { ultimoCuadro = null; return; }
+  if (ultimoCuadro !== null) {
+    irA(tiempo + (marca - ultimoCuadro) / 1000 * Number(document.getElementById('velocidad').value));
+  }
+  ultimoCuadro = marca;
+  requestAnimationFrame(cuadro);
+}
+
+function alternar() {
+  if (!reproduciendo && tiempo >= T) tiempo = 0;
+  reproduciendo = !reproduciendo;
+  dibujar();
+  if (reproduciendo) requestAnimationFrame(cuadro);
+}
+
+botonReproducir.onclick = alternar;
+document.getElementById('reiniciar').onclick = () => { reproduciendo = false; irA(0); };
+document.getElementById('retroceder').onclick = () => { reproduciendo = false; irA(Math.ceil(tiempo) - 1); };
+document.getElementById('avanzar').onclick = () => { reproduciendo = false; irA(Math.floor(tiempo) + 1); };
+document.getElementById('final').onclick = () => { reproduciendo = false; irA(T); };
+document.getElementById('ajustar').onclick = () => { vista = [-0.5, T + 1]; dibujar(); };
+cursor.oninput = () => { reproduciendo = false; irA(Number(cursor.value)); };
+
+lienzo.addEventListener('wheel', (evento) => {
+  evento.preventDefault();
+  const centro = aTiempo(evento.offsetX);
+  const factor = evento.deltaY > 0 ? 1.25 : 0.8;
+  const ancho = Math.min(Math.max((vista[1] - vista[0]) * factor, 4), T + 1.5);
+  const proporcion = (centro - vista[0]) / (vista[1] - vista[0]);
+  vista = [centro - ancho * proporcion, centro + ancho * (1 - proporcion)];
+  limitarVista();
+  dibujar();
+}, { passive: false });
+lienzo.addEventListener('mousedown', (evento) => { arrastre = { x: evento.clientX, vista: vista.slice() }; lienzo.style.cursor = 'grabbing'; });
+window.addEventListener('mouseup', () => { arrastre = null; lienzo.style.cursor = 'grab'; });
+window.addEventListener('mousemove', (evento) => {
+  if (!arrastre) return;
+  const desplazamiento = (evento.clientX - arrastre.x) / anchoUtil() * (arrastre.vista[1] - arrastre.vista[0]);
+  vista = [arrastre.vista[0] - desplazamiento, arrastre.vista[1] - desplazamiento];
+  limitarVista();
+  dibujar();
+});
+lienzo.addEventListener('dblclick', () => { vista = [-0.5, T + 1]; dibujar(); });
+document.addEventListener('keydown', (evento) => {
+  if (evento.code === 'Space') { evento.preventDefault(); alternar(); }
+  else if (evento.code === 'ArrowRight') { reproduciendo = false; irA(Math.floor(tiempo) + 1); }
+  else if (evento.code === 'ArrowLeft') { reproduciendo = false; irA(Math.ceil(tiempo) - 1); }
+});
+window.addEventListener('resize', () => { ajustarLienzo(); dibujar(); });
+
+ajustarLienzo();
+dibujar();
+</script>
+</body></html>
+"""
@@ -0,0 +1,237 @@
+"""
+Ejecución por lotes de los motores de planificación, sin Streamlit
+
+Lee cargas de trabajo desde archivos CSV o JSONL (una fila por proceso con
+pid, llegada, duracion y prioridad; la columna opcional 'carga' agrupa filas
+consecutivas en cargas distintas) y escribe en flujo los resultados por
+proceso y las métricas por carga y algoritmo. En memoria solo se mantienen
+las cargas que se están procesando.
+
+Uso:
+    python -m utils trazas.csv --algoritmos fcfs,rr --quantum 4 \\
+        --salida resultados.jsonl --metricas metricas.csv --procesos 4
+    python -m utils trazas.csv --nucleos 16 --cola por_nucleo --sin-salida --metricas smp.csv
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from utils.algoritmos import ALGORITMOS
+from utils.helpers import validar_procesos
+from utils.smp import COLAS, calcular_smp
+from utils.tabla import TablaProcesos
+from utils.trazas import TAMANO_BLOQUE, cargar_traza
+
+CAMPOS_PROCESO = ('carga', 'algoritmo', 'pid', 'llegada', 'duracion', 'prioridad', 'inicio', 'final', 'retorno', 'espera')
+CAMPOS_METRICAS = ('carga', 'algoritmo', 'procesos_completados', 'retorno_promedio', 'espera_promedio', 'tiempo_total', 'throughput')
+
+
+def leer_filas(ruta):
+    """Itera las filas (dicts) de un archivo CSV o JSONL sin cargarlo completo ('-' = stdin en JSONL)"""
+    if ruta == '-':
+        for linea in sys.stdin:
+            if linea.strip():
+                yield json.loads(linea)
+        return
+    with open(ruta, newline='') as archivo:
+        if ruta.endswith('.jsonl') or ruta.endswith('.json'):
+            for linea in archivo:
+                if linea.strip():
+                    yield json.loads(linea)
+        else:
+            yield from csv.DictReader(archivo)
+
+
+def leer_entero(fila, campo, defecto):
+    """Campo entero de una fila leída con leer_filas; defecto si falta o está vacío"""
+    valor = fila.get(campo)
+    return defecto if valor is None or valor == '' else int(valor)
+
+
+def leer_cargas(rutas, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Agrupa las filas de cada archivo en cargas de trabajo
+
+    Genera pares (nombre_carga, columnas) donde columnas son arreglos
+    compactos de pid, llegada, duracion y prioridad. Una traza .swf es una
+    sola carga: utils.trazas.cargar_traza la lee por bloques de tamano_bloque
+    bytes de texto (lo único que depende del bloque) y junta las columnas
+    compactas en una TablaProcesos, así que la cola y el reloj siguen de un
+    bloque al siguiente y los resultados no dependen de tamano_bloque.
+    """
+    for ruta in rutas:
+        nombre_archivo = os.path.basename(ruta)
+        if ruta.endswith('.swf'):
+            tabla = cargar_traza(ruta, tamano_bloque=tamano_bloque)
+            yield nombre_archivo, (tabla.pid, tabla.llegada, tabla.duracion, tabla.prioridad)
+            continue
+        for carga, filas in itertools.groupby(leer_filas(ruta), key=lambda fila: fila.get('carga')):
+            columnas = tuple(array('q') for _ in range(4))
+            for i, fila in enumerate(filas):
+                columnas[0].append(leer_entero(fila, 'pid', i))
+                columnas[1].append(leer_entero(fila, 'llegada', 0))
+                columnas[2].append(leer_entero(fila, 'duracion', 0))
+                columnas[3].append(leer_entero(fila, 'prioridad', 0))
+            yield (nombre_archivo if carga is None else str(carga)), columnas
+
+
+def simular_carga(nombre, columnas, algoritmos, parametros, nucleos=1, cola='global'):
+    """
+    Ejecuta los algoritmos pedidos sobre una carga (también en procesos de
+    trabajo); parametros: algoritmo -> argumentos. Con nucleos > 1 cada
+    algoritmo se simula en modo SMP
+    """
+    tabla = TablaProcesos(*(np.frombuffer(c, dtype=np.int64) for c in columnas))
+    es_valido, mensaje = validar_procesos(tabla)
+    if not es_valido:
+        return nombre, mensaje, []
+
+    resultados = []
+    for algoritmo in algoritmos:
+        if nucleos > 1:
+            calculada = calcular_smp(tabla.copia_entrada(), nucleos, algoritmo, cola, **parametros.get(algoritmo, {}))
+        else:
+            calculada = ALGORITMOS[algoritmo](tabla.copia_entrada(), **parametros.get(algoritmo, {}))
+        resultados.append((algoritmo, calculada.inicio, calculada.final, calculada.retorno, calculada.espera))
+    return nombre, mensaje, [tabla.pid, tabla.llegada, tabla.duracion, tabla.prioridad, resultados]
+
+
+def _simular_en_paralelo(cargas, algoritmos, parametros, nucleos, cola, procesos):
+    # Ventana deslizante de tareas pendientes: mantiene el orden de salida y
+    # evita leer más cargas de las que los trabajadores pueden consumir
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        pendientes = deque()
+        for nombre, columnas in cargas:
+            pendientes.append(ejecutor.submit(simular_carga, nombre, columnas, algoritmos, parametros, nucleos, cola))
+            if len(pendientes) >= 2 * procesos:
+                yield pendientes.popleft().result()
+        while pendientes:
+            yield pendientes.popleft().result()
+
+
+def abrir_escritor(ruta, campos):
+    """
+    Abre la salida en flujo de filas con los campos dados: .csv con
+    cabecera o JSONL ('-' = stdout, None = sin salida)
+
+    Devuelve (archivo, escribir_fila); el llamador cierra el archivo si no
+    es stdout.
+    """
+    if ruta is None:
+        return None, None
+    archivo = sys.stdout if ruta == '-' else open(ruta, 'w', newline='')
+    if ruta.endswith('.csv'):
+        escritor = csv.writer(archivo)
+        escritor.writerow(campos)
+        return archivo, escritor.writerow
+    return archivo, lambda fila: archivo.write(json.dumps(dict(zip(campos, fila))) + '\n')
+
+
+def ejecutar_lotes(rutas, algoritmos, quantum=2, cambio_contexto=0, envejecimiento=0, quantums_mlfq=(2, 4, 8), refuerzo=0,
+                   nucleos=1, cola='global', salida='-', metricas=None, procesos=1, bloque_traza=TAMANO_BLOQUE):
+    """Procesa los archivos y escribe resultados y métricas en flujo; devuelve el resumen global"""
+    parametros = {
+        'rr': {'quantum': quantum, 'cambio_contexto': cambio_contexto},
+        'prioridad_preemptiva': {'envejecimiento': envejecimiento},
+        'mlfq': {'quantums': tuple(quantums_mlfq), 'refuerzo': refuerzo},
+    }
+    cargas = leer_cargas(rutas, bloque_traza)
+    if procesos > 1:
+        simulaciones = _simular_en_paralelo(cargas, algoritmos, parametros, nucleos, cola, procesos)
+    else:
+        simulaciones = (simular_carga(nombre, columnas, algoritmos, parametros, nucleos, cola) for nombre, columnas in cargas)
+
+    archivo_salida, escribir_proceso = abrir_escritor(salida, CAMPOS_PROCESO)
+    archivo_metricas, escribir_metricas = abrir_escritor(metricas, CAMPOS_METRICAS)
+    resumen = {a: {'procesos_completados': 0, 'retorno_total': 0, 'espera_total': 0, 'cargas': 0} for a in algoritmos}
+
+    try:
+        for nombre, mensaje, datos in simulaciones:
+            if not datos:
+                print(f"Carga {nombre} omitida: {mensaje}", file=sys.stderr)
+                continue
+            pid, llegada, duracion, prioridad, resultados = datos
+            for algoritmo, inicio, final, retorno, espera in resultados:
+                if escribir_proceso:
+                    columnas = [c.tolist() for c in (pid, llegada, duracion, prioridad, inicio, final, retorno, espera)]
+                    for fila in zip(*columnas):
+                        escribir_proceso((nombre, algoritmo) + fila)
+
+                n = len(pid)
+                tiempo_total = int(final.max())
+                if escribir_metricas:
+                    escribir_metricas((
+                        nombre, algoritmo, n,
+                        float(retorno.mean()), float(espera.mean()),
+                        tiempo_total, n / tiempo_total if tiempo_total else 0.0
+                    ))
+
+                acumulado = resumen[algoritmo]
+                acumulado['procesos_completados'] += n
+                acumulado['retorno_total'] += int(retorno.sum())
+                acumulado['espera_total'] += int(espera.sum())
+                acumulado['cargas'] += 1
+    finally:
+        for archivo in (archivo_salida, archivo_metricas):
+            if archivo is not None and archivo is not sys.stdout:
+                archivo.close()
+
+    return {
+        algoritmo: {
+            'cargas': a['cargas'],
+            'procesos_completados': a['procesos_completados'],
+            'retorno_promedio': a['retorno_total'] / a['procesos_completados'] if a['procesos_completados'] else 0.0,
+            'espera_promedio': a['espera_total'] / a['procesos_completados'] if a['procesos_completados'] else 0.0,
+        }
+        for algoritmo, a in resumen.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m utils',
+        description="Ejecuta los algoritmos de planificación sobre cargas en CSV o JSONL"
+    )
+    parser.add_argument('archivos', nargs='+', help="Archivos .csv o .jsonl con columnas pid, llegada, duracion, prioridad y opcionalmente carga, o trazas .swf")
+    parser.add_argument('--algoritmos', default=','.join(ALGORITMOS), help="Lista separada por comas (por defecto todos)")
+    parser.add_argument('--quantum', type=int, default=2, help="Quantum para Round Robin")
+    parser.add_argument('--cambio-contexto', type=int, default=0, help="Ticks de cambio de contexto para Round Robin")
+    parser.add_argument('--envejecimiento', type=int, default=0, help="Ticks de espera por nivel de prioridad ganado en Prioridad Preemptiva (0 = sin envejecimiento)")
+    parser.add_argument('--quantums-mlfq', default='2,4,8', help="Quantum de cada nivel de MLFQ, separados por comas")
+    parser.add_argument('--refuerzo', type=int, default=0, help="Cada cuántos ticks MLFQ sube todos los procesos al nivel 0 (0 = nunca)")
+    parser.add_argument('--nucleos', type=int, default=1, help="CPUs simuladas; con más de una, cada algoritmo corre en modo SMP")
+    parser.add_argument('--cola', choices=COLAS, default='global', help="Cola de listos en modo SMP: global o por núcleo con robo de trabajo")
+    parser.add_argument('--salida', default='-', help="Resultados por proceso (.csv o .jsonl, '-' = stdout)")
+    parser.add_argument('--sin-salida', action='store_true', help="No escribir resultados por proceso")
+    parser.add_argument('--metricas', default=None, help="Métricas por carga y algoritmo (.csv o .jsonl)")
+    parser.add_argument('--procesos', type=int, default=1, help="Procesos de trabajo en paralelo")
+    parser.add_argument('--bloque-traza', type=int, default=TAMANO_BLOQUE // 2**20, help="MiB de texto de traza .swf leídos por bloque")
+    args = parser.parse_args(argv)
+
+    algoritmos = [a.strip() for a in args.algoritmos.split(',') if a.strip()]
+    desconocidos = [a for a in algoritmos if a not in ALGORITMOS]
+    if desconocidos:
+        parser.error(f"Algoritmos desconocidos: {', '.join(desconocidos)}")
+    if args.nucleos < 1:
+        parser.error("--nucleos debe ser al menos 1")
+    if args.nucleos > 1 and (args.envejecimiento or args.refuerzo):
+        parser.error("--envejecimiento y --refuerzo no están disponibles con más de un núcleo")
+
+    resumen = ejecutar_lotes(
+        args.archivos, algoritmos,
+        quantum=args.quantum, cambio_contexto=args.cambio_contexto, envejecimiento=args.envejecimiento,
+        quantums_mlfq=[int(q) for q in args.quantums_mlfq.split(',')], refuerzo=args.refuerzo,
+        nucleos=args.nucleos, cola=args.cola,
+        salida=None if args.sin_salida else args.salida,
+        metricas=args.metricas, procesos=args.procesos, bloque_traza=args.bloque_traza * 2**20
+    )
+    print(json.dumps(resumen, indent=2), file=sys.stderr)
+    return 0
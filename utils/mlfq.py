@@ -0,0 +1,189 @@
+from array import array
+from collections import deque
+
+import numpy as np
+
+from utils.instrumentacion import instrumentado
+from utils.segmentos import RegistroSegmentos
+from utils.tabla import TablaProcesos
+
+# 'acumulado': baja de nivel al consumir su quantum en el nivel, sumando los
+# tramos interrumpidos (no se puede acaparar la CPU cediéndola justo antes).
+# 'tramo': baja solo si consume un quantum completo de una vez
+DEGRADACIONES = ('acumulado', 'tramo')
+
+
+@instrumentado
+def calcular_mlfq(procesos, quantums=(2, 4, 8), refuerzo=0, degradacion='acumulado'):
+    """
+    Implementa Multilevel Feedback Queue (MLFQ)
+
+    Hay un nivel por quantum (el 0 es el más prioritario). Los procesos
+    llegan al nivel 0; el que agota su quantum baja un nivel y el último
+    nivel rota como Round Robin. Una llegada interrumpe a un proceso de un
+    nivel inferior, que conserva su turno al frente de su cola. Con
+    refuerzo > 0, cada 'refuerzo' ticks todos los procesos vuelven al
+    nivel 0. Cada nivel es un deque y un mapa de bits marca los niveles no
+    vacíos, así que elegir el siguiente proceso es O(1).
+    """
+    quantums = tuple(quantums)
+    if not quantums or min(quantums) <= 0:
+        raise ValueError("Cada nivel necesita un quantum positivo")
+    if degradacion not in DEGRADACIONES:
+        raise ValueError(f"Regla de degradación desconocida: {degradacion}")
+
+    if isinstance(procesos, TablaProcesos):
+        return _planificar_mlfq(procesos, quantums, refuerzo, degradacion)
+
+    for p in procesos:
+        p.setdefault('llegada', 0)
+
+    _planificar_mlfq(TablaProcesos.desde_dicts(procesos), quantums, refuerzo, degradacion).actualizar_dicts(procesos)
+    return procesos
+
+
+def _planificar_mlfq(tabla, quantums, refuerzo, degradacion):
+    total = len(tabla)
+    ultimo_nivel = len(quantums) - 1
+    orden = tabla.orden_llegada().tolist()
+    llegadas = tabla.llegada.tolist()
+    restantes = tabla.duracion.tolist()
+    por_tramo = degradacion == 'tramo'
+    # Tiempo consumido en el nivel actual; 'epoca' anota en qué refuerzo se
+    # contó, para reiniciarlo sin recorrer la cola en cada refuerzo
+    usado = [0] * total
+    epoca = [0] * total
+    refuerzos = 0
+    proximo_refuerzo = refuerzo if refuerzo > 0 else None
+
+    colas = [deque() for _ in quantums]
+    mapa = 0  # bit l encendido = la cola del nivel l tiene procesos
+    segmentos = RegistroSegmentos()
+    agregar_segmento = segmentos.agregar
+    niveles = array('q')
+
+    siguiente = 0
+    terminados = 0
+    tiempo_actual = 0
+
+    while terminados < total:
+        while siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+            idx = orden[siguiente]
+            siguiente += 1
+            if restantes[idx] > 0:
+                colas[0].append(idx)
+                mapa |= 1
+            else:
+                terminados += 1
+
+        if proximo_refuerzo is not None and proximo_refuerzo <= tiempo_actual:
+            # Todos suben al nivel 0 conservando el orden entre niveles
+            for cola in colas[1:]:
+                colas[0].extend(cola)
+                cola.clear()
+            mapa = 1 if colas[0] else 0
+            refuerzos += 1
+            proximo_refuerzo = (tiempo_actual // refuerzo + 1) * refuerzo
+
+        if not mapa:
+            if siguiente < total:
+                tiempo_actual = llegadas[orden[siguiente]]
+            continue
+
+        # Nivel más prioritario no vacío: el bit encendido más bajo
+        nivel = (mapa & -mapa).bit_length() - 1
+        cola = colas[nivel]
+        idx = cola.popleft()
+        if not cola:
+            mapa &= ~(1 << nivel)
+        if epoca[idx] != refuerzos:
+            epoca[idx] = refuerzos
+            usado[idx] = 0
+
+        cuota = quantums[nivel] if por_tramo else quantums[nivel] - usado[idx]
+        fin = tiempo_actual + min(cuota, restantes[idx])
+        # Una llegada (al nivel 0) interrumpe a los niveles inferiores y el
+        # refuerzo interrumpe a cualquiera
+        corte = fin
+        if nivel > 0 and siguiente < total:
+            corte = min(corte, llegadas[orden[siguiente]])
+        if proximo_refuerzo is not None:
+            corte = min(corte, proximo_refuerzo)
+
+        ejecutado = corte - tiempo_actual
+        agregar_segmento(idx, tiempo_actual, ejecutado)
+        niveles.append(nivel)
+        restantes[idx] -= ejecutado
+        usado[idx] += ejecutado
+        tiempo_actual = corte
+
+        # Las llegadas hasta el fin del tramo entran antes que el proceso
+        # que vuelve a la cola, como en Round Robin
+        while siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+            idx_llegada = orden[siguiente]
+            siguiente += 1
+            if restantes[idx_llegada] > 0:
+                colas[0].append(idx_llegada)
+                mapa |= 1
+            else:
+                terminados += 1
+
+        if restantes[idx] == 0:
+            terminados += 1
+        elif corte == fin:
+            destino = min(nivel + 1, ultimo_nivel)
+            usado[idx] = 0
+            colas[destino].append(idx)
+            mapa |= 1 << destino
+        else:
+            colas[nivel].appendleft(idx)
+            mapa |= 1 << nivel
+
+    tabla.segmentos = segmentos
+    tabla.niveles = np.frombuffer(niveles, dtype=np.int64)
+    tabla.completar_desde_segmentos()
+    tabla.calcular_metricas()
+    return tabla
+
+
+def resumir_niveles(procesos, quantums):
+    """
+    Residencia por nivel de una corrida MLFQ (TablaProcesos o lista de dicts)
+
+    Por nivel: ticks de CPU y su porcentaje, tramos despachados, procesos
+    que pasaron por el nivel y procesos que terminaron en él.
+    """
+    if isinstance(procesos, TablaProcesos):
+        proceso, _, duracion = procesos.segmentos.columnas()
+        niveles = procesos.niveles
+    else:
+        proceso, duracion, niveles = [], [], []
+        for i, p in enumerate(procesos):
+            for (_, d), nivel in zip(p['ejecuciones'], p['niveles']):
+                proceso.append(i)
+                duracion.append(d)
+                niveles.append(nivel)
+        proceso, duracion, niveles = (np.asarray(c, dtype=np.int64) for c in (proceso, duracion, niveles))
+
+    cantidad = len(quantums)
+    ticks = np.bincount(niveles, weights=duracion, minlength=cantidad)
+    tramos = np.bincount(niveles, minlength=cantidad)
+    # Pares (proceso, nivel) distintos, y el nivel del último tramo de cada proceso
+    visitas = np.bincount(np.unique(proceso * cantidad + niveles) % cantidad, minlength=cantidad)
+    ultimo = np.full(int(proceso.max(initial=-1)) + 1, -1, dtype=np.int64)
+    np.maximum.at(ultimo, proceso, np.arange(len(proceso)))
+    terminados = np.bincount(niveles[ultimo[ultimo >= 0]], minlength=cantidad)
+    total = float(ticks.sum())
+
+    return [
+        {
+            'nivel': nivel,
+            'quantum': quantums[nivel],
+            'ticks_cpu': int(ticks[nivel]),
+            'porcentaje_cpu': 100 * float(ticks[nivel]) / total if total else 0.0,
+            'tramos': int(tramos[nivel]),
+            'procesos': int(visitas[nivel]),
+            'terminados': int(terminados[nivel]),
+        }
+        for nivel in range(cantidad)
+    ]
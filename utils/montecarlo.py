@@ -0,0 +1,184 @@
+"""
+Evaluación Monte Carlo de los algoritmos sobre cargas aleatorias
+
+Genera N cargas con utils.generador (la corrida r usa la semilla
+[semilla, r], así que el resultado no depende de cómo se repartan las
+corridas) y ejecuta todos los algoritmos sobre cada una: compararlos sobre
+las mismas cargas reduce la varianza de las diferencias.
+
+Las métricas de cada corrida se escriben directamente en un arreglo
+float64 de forma (corridas, algoritmos, métricas) en memoria compartida
+(multiprocessing.shared_memory). A cada trabajador solo se le envían la
+configuración, una vez en el inicializador, y los límites de sus bloques
+de corridas; no se serializa ningún resultado.
+
+Uso:
+    resumen, muestras = evaluar_montecarlo(10_000, procesos_por_carga=50, llegadas='rafagas')
+
+    python -m utils.montecarlo -n 100000 --procesos-por-carga 20 --duraciones pareto
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from statistics import NormalDist
+
+import numpy as np
+
+from utils.algoritmos import ALGORITMOS
+from utils.barrido import MIN_PROCESOS_PARALELO
+from utils.comparativa import parametros_algoritmo, resumir_comparativa
+from utils.generador import DISTRIBUCIONES_DURACION, DISTRIBUCIONES_PRIORIDAD, PATRONES_LLEGADA, generar_bloques
+
+METRICAS = ('retorno_promedio', 'espera_promedio', 'respuesta_promedio', 'tiempo_total', 'throughput')
+# Bloques por trabajador: suficientes para equilibrar la carga entre ellos
+BLOQUES_POR_TRABAJADOR = 16
+
+# Estado del trabajador, recibido una sola vez en el inicializador del pool
+_memoria_trabajador = None
+_muestras_trabajador = None
+_configuracion_trabajador = None
+
+
+def _evaluar_corridas(muestras, desde, hasta, configuracion):
+    # Llena las filas [desde, hasta) del arreglo de muestras
+    algoritmos, parametros, procesos_por_carga, semilla, opciones_carga = configuracion
+    for corrida in range(desde, hasta):
+        tabla = next(generar_bloques(
+            procesos_por_carga, semilla=[semilla, corrida], tamano_bloque=procesos_por_carga, **opciones_carga
+        ))
+        tabla.orden_llegada()
+        calculadas = {
+            algoritmo: ALGORITMOS[algoritmo](tabla.copia_entrada(), **parametros[algoritmo])
+            for algoritmo in algoritmos
+        }
+        for fila, resumen in zip(muestras[corrida], resumir_comparativa(calculadas)):
+            fila[:] = [resumen[m] for m in METRICAS]
+
+
+def _iniciar_trabajador(nombre, forma, configuracion):
+    global _memoria_trabajador, _muestras_trabajador, _configuracion_trabajador
+    _memoria_trabajador = shared_memory.SharedMemory(name=nombre)
+    _muestras_trabajador = np.ndarray(forma, dtype=np.float64, buffer=_memoria_trabajador.buf)
+    _configuracion_trabajador = configuracion
+
+
+def _evaluar_en_trabajador(desde, hasta):
+    _evaluar_corridas(_muestras_trabajador, desde, hasta, _configuracion_trabajador)
+
+
+def evaluar_montecarlo(corridas, procesos_por_carga=20, algoritmos=None, quantum=2, cambio_contexto=0,
+                       envejecimiento=0, semilla=0, nivel_confianza=0.95, procesos_trabajo=None, **opciones_carga):
+    """
+    Ejecuta los algoritmos sobre 'corridas' cargas aleatorias
+
+    opciones_carga se pasan a generar_bloques (llegadas, duraciones,
+    utilizacion...). Devuelve (resumen, muestras): el resumen por algoritmo
+    de resumir_montecarlo y el arreglo (corridas, algoritmos, METRICAS) con
+    las métricas de cada corrida. procesos_trabajo fija el tamaño del pool
+    (1 = en serie; None = todos los núcleos si la evaluación lo justifica).
+    """
+    algoritmos = list(ALGORITMOS) if algoritmos is None else list(algoritmos)
+    if corridas < 1 or procesos_por_carga < 1:
+        raise ValueError("Se necesita al menos una corrida y un proceso por carga")
+    parametros = {a: parametros_algoritmo(a, quantum, cambio_contexto, envejecimiento) for a in algoritmos}
+    configuracion = (algoritmos, parametros, procesos_por_carga, semilla, opciones_carga)
+    forma = (corridas, len(algoritmos), len(METRICAS))
+
+    if procesos_trabajo is None:
+        paralelo = corridas * procesos_por_carga * len(algoritmos) >= MIN_PROCESOS_PARALELO
+        procesos_trabajo = (os.cpu_count() or 1) if paralelo else 1
+    procesos_trabajo = min(procesos_trabajo, corridas)
+
+    if procesos_trabajo <= 1:
+        muestras = np.empty(forma, dtype=np.float64)
+        _evaluar_corridas(muestras, 0, corridas, configuracion)
+        return resumir_montecarlo(muestras, algoritmos, nivel_confianza), muestras
+
+    memoria = shared_memory.SharedMemory(create=True, size=int(np.prod(forma)) * 8)
+    try:
+        compartidas = np.ndarray(forma, dtype=np.float64, buffer=memoria.buf)
+        tamano = -(-corridas // (procesos_trabajo * BLOQUES_POR_TRABAJADOR))
+        desdes = range(0, corridas, tamano)
+        hastas = [min(desde + tamano, corridas) for desde in desdes]
+        with ProcessPoolExecutor(procesos_trabajo, initializer=_iniciar_trabajador,
+                                 initargs=(memoria.name, forma, configuracion)) as ejecutor:
+            # list() propaga cualquier excepción de los trabajadores
+            list(ejecutor.map(_evaluar_en_trabajador, desdes, hastas))
+        muestras = compartidas.copy()
+        del compartidas
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+    return resumir_montecarlo(muestras, algoritmos, nivel_confianza), muestras
+
+
+def resumir_montecarlo(muestras, algoritmos, nivel_confianza=0.95):
+    """
+    Media e intervalo de confianza de cada métrica por algoritmo
+
+    El intervalo usa la aproximación normal de la media (media ± z·s/√N),
+    adecuada desde unas decenas de corridas. Cada fila trae la media de
+    cada métrica y su semiancho en '<métrica>_ic'.
+    """
+    corridas = muestras.shape[0]
+    z = NormalDist().inv_cdf((1 + nivel_confianza) / 2)
+    medias = muestras.mean(axis=0)
+    if corridas > 1:
+        semiancho = z * muestras.std(axis=0, ddof=1) / np.sqrt(corridas)
+    else:
+        semiancho = np.full_like(medias, np.nan)
+
+    filas = []
+    for i, algoritmo in enumerate(algoritmos):
+        fila = {'algoritmo': algoritmo, 'corridas': corridas}
+        for j, metrica in enumerate(METRICAS):
+            fila[metrica] = float(medias[i, j])
+            fila[f'{metrica}_ic'] = float(semiancho[i, j])
+        filas.append(fila)
+    return filas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.montecarlo',
+        description="Compara los algoritmos sobre muchas cargas aleatorias con intervalos de confianza"
+    )
+    parser.add_argument('-n', '--corridas', type=int, default=1000)
+    parser.add_argument('--procesos-por-carga', type=int, default=20)
+    parser.add_argument('--algoritmos', default=','.join(ALGORITMOS), help="Lista separada por comas (por defecto todos)")
+    parser.add_argument('--quantum', type=int, default=2, help="Quantum para Round Robin")
+    parser.add_argument('--cambio-contexto', type=int, default=0, help="Ticks de cambio de contexto para Round Robin")
+    parser.add_argument('--envejecimiento', type=int, default=0, help="Envejecimiento de Prioridad Preemptiva")
+    parser.add_argument('--llegadas', choices=PATRONES_LLEGADA, default='poisson')
+    parser.add_argument('--duraciones', choices=DISTRIBUCIONES_DURACION, default='exponencial')
+    parser.add_argument('--prioridades', choices=DISTRIBUCIONES_PRIORIDAD, default='uniforme')
+    parser.add_argument('--media-duracion', type=float, default=5.0)
+    parser.add_argument('--utilizacion', type=float, default=0.9)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--confianza', type=float, default=0.95, help="Nivel de confianza de los intervalos")
+    parser.add_argument('--procesos', type=int, default=None, help="Procesos de trabajo (por defecto todos los núcleos)")
+    args = parser.parse_args(argv)
+
+    algoritmos = [a.strip() for a in args.algoritmos.split(',') if a.strip()]
+    desconocidos = [a for a in algoritmos if a not in ALGORITMOS]
+    if desconocidos:
+        parser.error(f"Algoritmos desconocidos: {', '.join(desconocidos)}")
+
+    resumen, _ = evaluar_montecarlo(
+        args.corridas, args.procesos_por_carga, algoritmos,
+        quantum=args.quantum, cambio_contexto=args.cambio_contexto, envejecimiento=args.envejecimiento,
+        semilla=args.semilla, nivel_confianza=args.confianza, procesos_trabajo=args.procesos,
+        llegadas=args.llegadas, duraciones=args.duraciones, prioridades=args.prioridades,
+        media_duracion=args.media_duracion, utilizacion=args.utilizacion
+    )
+    json.dump(resumen, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,32 +1,19 @@
+from utils.despacho import despachar_no_preemptivo
+from utils.instrumentacion import instrumentado
+from utils.tabla import TablaProcesos
+
+
+@instrumentado
 def calcular_prioridad(procesos):
     """
     Implementa planificación por prioridad (no preemptivo)
     """
+    if isinstance(procesos, TablaProcesos):
+        return despachar_no_preemptivo(procesos, procesos.prioridad)
+
     for p in procesos:
         p.setdefault('prioridad', 0)
         p.setdefault('llegada', 0)
-    
-    tiempo_actual = 0
-    procesos_restantes = procesos.copy()
-    procesos_ejecutados = []
-    
-    while procesos_restantes:
-        disponibles = [p for p in procesos_restantes if p['llegada'] <= tiempo_actual]
-        
-        if disponibles:
-            disponibles.sort(key=lambda p: p['prioridad'])
-            proceso_actual = disponibles[0]
-            
-            proceso_actual['inicio'] = tiempo_actual
-            proceso_actual['final'] = tiempo_actual + proceso_actual['duracion']
-            proceso_actual['retorno'] = proceso_actual['final'] - proceso_actual['llegada']
-            proceso_actual['espera'] = proceso_actual['inicio'] - proceso_actual['llegada']
-            
-            tiempo_actual = proceso_actual['final']
-            procesos_restantes.remove(proceso_actual)
-            procesos_ejecutados.append(proceso_actual)
-        else:
-            siguiente_llegada = min(p['llegada'] for p in procesos_restantes)
-            tiempo_actual = siguiente_llegada
-    
-    return procesos
\ No newline at end of file
+
+    tabla = TablaProcesos.desde_dicts(procesos)
+    return despachar_no_preemptivo(tabla, tabla.prioridad).actualizar_dicts(procesos)
@@ -0,0 +1,108 @@
+import heapq
+
+from utils.instrumentacion import instrumentado
+from utils.segmentos import RegistroSegmentos
+from utils.tabla import TablaProcesos
+
+
+@instrumentado
+def calcular_prioridad_preemptiva(procesos, envejecimiento=0):
+    """
+    Implementa planificación por prioridad preemptiva con envejecimiento opcional
+
+    Menor número = mayor prioridad. Un proceso que llega con prioridad
+    estrictamente mayor que la del que está en CPU lo interrumpe. Con
+    envejecimiento > 0, cada 'envejecimiento' ticks de espera el proceso
+    gana un nivel (sin pasar de 0); el que está en CPU conserva la
+    prioridad con que fue despachado y, si es interrumpido, vuelve a la
+    cola con su prioridad original.
+    """
+    if isinstance(procesos, TablaProcesos):
+        return _planificar_prioridad_preemptiva(procesos, envejecimiento)
+
+    for p in procesos:
+        p.setdefault('prioridad', 0)
+        p.setdefault('llegada', 0)
+
+    tabla = TablaProcesos.desde_dicts(procesos)
+    return _planificar_prioridad_preemptiva(tabla, envejecimiento).actualizar_dicts(procesos)
+
+
+def _planificar_prioridad_preemptiva(tabla, envejecimiento):
+    total = len(tabla)
+    orden = tabla.orden_llegada().tolist()
+    llegadas = tabla.llegada.tolist()
+    prioridades = tabla.prioridad.tolist()
+    restantes = tabla.duracion.tolist()
+    segmentos = RegistroSegmentos()
+    agregar_segmento = segmentos.agregar
+    duraciones_segmento = segmentos.duracion
+
+    # Envejecimiento con reloj virtual: la prioridad efectiva de un proceso
+    # que espera desde 'w' es prioridad - (t - w) / envejecimiento. Como t es
+    # común a toda la cola, el orden lo da la clave fija
+    # prioridad * envejecimiento + w y nunca hay que recorrer la cola para
+    # envejecerla. Sin envejecimiento la clave es la prioridad.
+    escala = envejecimiento if envejecimiento > 0 else 0
+
+    def clave(idx, desde):
+        return prioridades[idx] * escala + desde if escala else prioridades[idx]
+
+    # Montículo de (clave, posición de llegada, índice)
+    listos = []
+    siguiente = 0
+    tiempo_actual = 0
+    actual = None
+    nivel = 0  # prioridad efectiva del proceso en CPU (× escala con envejecimiento)
+    ultimo = -1
+    fin_ultimo = -1
+
+    while siguiente < total or listos or actual is not None:
+        while siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+            idx = orden[siguiente]
+            if restantes[idx] > 0:
+                heapq.heappush(listos, (clave(idx, llegadas[idx]), siguiente, idx))
+            siguiente += 1
+
+        if actual is None:
+            if not listos:
+                if siguiente < total:
+                    tiempo_actual = llegadas[orden[siguiente]]
+                continue
+            clave_actual, posicion, actual = heapq.heappop(listos)
+            nivel = max(0, clave_actual - tiempo_actual) if escala else clave_actual
+        elif listos:
+            # El primero de la cola interrumpe si su prioridad efectiva es al
+            # menos un nivel mejor que la del proceso en CPU
+            if escala:
+                expropia = nivel >= escala and listos[0][0] - tiempo_actual <= nivel - escala
+            else:
+                expropia = listos[0][0] < nivel
+            if expropia:
+                heapq.heappush(listos, (clave(actual, tiempo_actual), posicion, actual))
+                actual = None
+                continue
+
+        # Corre hasta terminar, hasta la siguiente llegada o hasta que el
+        # primero de la cola envejezca lo suficiente para interrumpirlo
+        hasta = tiempo_actual + restantes[actual]
+        if siguiente < total:
+            hasta = min(hasta, llegadas[orden[siguiente]])
+        if escala and listos and nivel >= escala:
+            hasta = min(hasta, listos[0][0] - nivel + escala)
+
+        if actual == ultimo and fin_ultimo == tiempo_actual:
+            duraciones_segmento[-1] += hasta - tiempo_actual
+        else:
+            agregar_segmento(actual, tiempo_actual, hasta - tiempo_actual)
+            ultimo = actual
+
+        restantes[actual] -= hasta - tiempo_actual
+        tiempo_actual = fin_ultimo = hasta
+        if restantes[actual] == 0:
+            actual = None
+
+    tabla.segmentos = segmentos
+    tabla.completar_desde_segmentos()
+    tabla.calcular_metricas()
+    return tabla
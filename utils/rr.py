@@ -1,69 +1,92 @@
+from collections import deque
+
+from utils.instrumentacion import instrumentado
+from utils.segmentos import RegistroSegmentos
+from utils.tabla import TablaProcesos
+
+
+@instrumentado
 def calcular_rr(procesos, quantum=2, cambio_contexto=0):
     """
     Implementa el algoritmo Round Robin
+
+    La cola de listos es un deque de índices y las llegadas se recorren con
+    un cursor sobre los procesos ordenados por llegada, por lo que el costo
+    es O(n log n + número de quantums). Los tiempos ociosos se saltan de
+    una vez hasta la siguiente llegada. Los tramos se anotan en un
+    RegistroSegmentos (tabla.segmentos).
     """
+    if isinstance(procesos, TablaProcesos):
+        return _planificar_rr(procesos, quantum, cambio_contexto)
+
     for p in procesos:
         p.setdefault('llegada', 0)
-    
+
+    _planificar_rr(TablaProcesos.desde_dicts(procesos), quantum, cambio_contexto).actualizar_dicts(procesos)
+    for p in procesos:
+        p['quantum'] = quantum
+
+    return procesos
+
+
+def _planificar_rr(tabla, quantum, cambio_contexto):
+    total = len(tabla)
+    llegadas = tabla.llegada.tolist()
+    orden = tabla.orden_llegada().tolist()
+    tiempo_restante = tabla.duracion.tolist()
+    segmentos = RegistroSegmentos()
+    agregar_segmento = segmentos.agregar
+
+    cola = deque()
+    siguiente = 0
+    terminados = 0
     tiempo_actual = 0
-    cola = []
-    tiempo_restante = {p['pid']: p['duracion'] for p in procesos}
-    ejecuciones = {p['pid']: [] for p in procesos}
-    procesos_terminados = set()
-    
-    while len(procesos_terminados) < len(procesos):
-        for p in procesos:
-            pid = p['pid']
-            if (pid not in procesos_terminados and 
-                p['llegada'] <= tiempo_actual and 
-                tiempo_restante[pid] > 0 and
-                p not in cola):
-                cola.append(p)
-        
+
+    def admitir_llegadas(tiempo):
+        # Los que llegan en el mismo intervalo entran en el orden de la
+        # tabla, igual que el recorrido original
+        nonlocal siguiente, terminados
+        inicio = siguiente
+        while siguiente < total and llegadas[orden[siguiente]] <= tiempo:
+            siguiente += 1
+        if siguiente - inicio == 1:
+            nuevos = (orden[inicio],)
+        else:
+            nuevos = sorted(orden[inicio:siguiente])
+        for idx in nuevos:
+            if tiempo_restante[idx] > 0:
+                cola.append(idx)
+            else:
+                terminados += 1
+
+    while terminados < total:
+        if siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+            admitir_llegadas(tiempo_actual)
+
         if cola:
-            proceso_actual = cola.pop(0)
-            pid = proceso_actual['pid']
-            
-            tiempo_a_ejecutar = min(quantum, tiempo_restante[pid])
-            
-            ejecuciones[pid].append((tiempo_actual, tiempo_a_ejecutar))
-            
-            tiempo_restante[pid] -= tiempo_a_ejecutar
+            idx = cola.popleft()
+
+            tiempo_a_ejecutar = min(quantum, tiempo_restante[idx])
+
+            agregar_segmento(idx, tiempo_actual, tiempo_a_ejecutar)
+
+            tiempo_restante[idx] -= tiempo_a_ejecutar
             tiempo_actual += tiempo_a_ejecutar
-            
-            for p_nuevo in procesos:
-                pid_nuevo = p_nuevo['pid']
-                if (pid_nuevo not in procesos_terminados and 
-                    p_nuevo['llegada'] <= tiempo_actual and 
-                    tiempo_restante[pid_nuevo] > 0 and
-                    p_nuevo not in cola and
-                    p_nuevo != proceso_actual):
-                    cola.append(p_nuevo)
-            
-            if tiempo_restante[pid] > 0:
-                cola.append(proceso_actual)
+
+            if siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+                admitir_llegadas(tiempo_actual)
+
+            if tiempo_restante[idx] > 0:
+                cola.append(idx)
             else:
-                procesos_terminados.add(pid)
-                proceso_actual['final'] = tiempo_actual
-            
+                terminados += 1
+
             if cambio_contexto > 0:
                 tiempo_actual += cambio_contexto
-        else:
-            tiempo_actual += 1
-    
-    for p in procesos:
-        p['ejecuciones'] = ejecuciones[p['pid']]
-        
-        if ejecuciones[p['pid']]:
-            p['inicio'] = ejecuciones[p['pid']][0][0]
-            ultima_ejecucion = ejecuciones[p['pid']][-1]
-            p['final'] = ultima_ejecucion[0] + ultima_ejecucion[1]
-        else:
-            p['inicio'] = p['llegada']
-            p['final'] = p['llegada'] + p['duracion']
-        
-        p['retorno'] = p['final'] - p['llegada']
-        p['espera'] = p['retorno'] - p['duracion']
-        p['quantum'] = quantum
-    
-    return procesos
\ No newline at end of file
+        elif siguiente < total:
+            tiempo_actual = max(tiempo_actual, llegadas[orden[siguiente]])
+
+    tabla.segmentos = segmentos
+    tabla.completar_desde_segmentos()
+    tabla.calcular_metricas()
+    return tabla
@@ -0,0 +1,159 @@
+"""
+Registro compacto de segmentos de ejecución
+
+Los motores preemptivos (calcular_rr, calcular_srt) anotan cada tramo de
+CPU en tres columnas paralelas array('q') de proceso (índice de fila en
+la TablaProcesos), inicio y duración: 24 bytes por tramo en lugar de una
+tupla dentro de una lista por proceso. Los tramos quedan ordenados por
+inicio, así que las consultas por ventana de tiempo son búsquedas
+binarias. En un registro multinúcleo (calcular_smp) los tramos de
+núcleos distintos se solapan: el registro se marca como 'solapados' y la
+búsqueda usa además el máximo acumulado de los finales.
+
+El registro se guarda en un .npy de forma (3, n) (o (4, n) si está
+solapado: la cuarta fila es ese máximo acumulado) y se reabre con
+np.memmap: una línea de tiempo de cientos de millones de tramos se
+consulta sin cargarla ni convertirla a tuplas.
+
+Uso:
+    tabla = calcular_rr(tabla, quantum=4)
+    tabla.segmentos.guardar('rr.npy')
+    registro = RegistroSegmentos.cargar('rr.npy')
+    proceso, inicio, duracion = registro.en_ventana(1000, 2000)
+"""
+from array import array
+
+import numpy as np
+
+CAMPOS = ('proceso', 'inicio', 'duracion')
+TAMANO_BLOQUE = 2**22
+
+
+class RegistroSegmentos:
+    """
+    Tramos (proceso, inicio, duracion) en columnas paralelas
+
+    Mientras el motor escribe, las columnas son array('q'); al cargar desde
+    disco son vistas np.memmap de solo lectura. columnas() devuelve siempre
+    arreglos NumPy sin copiar. solapados indica que los tramos pueden
+    solaparse (varios núcleos); finales es entonces el máximo acumulado de
+    inicio + duracion, que se calcula al consultar si no viene dado.
+    """
+
+    __slots__ = CAMPOS + ('solapados', 'finales')
+
+    def __init__(self, proceso=None, inicio=None, duracion=None, solapados=False, finales=None):
+        self.proceso = array('q') if proceso is None else proceso
+        self.inicio = array('q') if inicio is None else inicio
+        self.duracion = array('q') if duracion is None else duracion
+        self.solapados = solapados
+        self.finales = finales
+
+    def __len__(self):
+        return len(self.proceso)
+
+    def agregar(self, proceso, inicio, duracion):
+        """Anota un tramo; deben llegar en orden cronológico"""
+        self.proceso.append(proceso)
+        self.inicio.append(inicio)
+        self.duracion.append(duracion)
+
+    def columnas(self):
+        """(proceso, inicio, duracion) como arreglos NumPy int64 que comparten la memoria del registro"""
+        return tuple(
+            c if isinstance(c, np.ndarray) else np.frombuffer(c, dtype=np.int64)
+            for c in (self.proceso, self.inicio, self.duracion)
+        )
+
+    def extremos(self, n):
+        """
+        Inicio del primer tramo y final del último de cada uno de los n
+        procesos (-1 si el proceso no tiene tramos)
+        """
+        proceso, inicio, duracion = self.columnas()
+        primero = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+        ultimo = np.full(n, -1, dtype=np.int64)
+        np.minimum.at(primero, proceso, inicio)
+        np.maximum.at(ultimo, proceso, inicio + duracion)
+        primero[ultimo < 0] = -1
+        return primero, ultimo
+
+    def de_proceso(self, proceso):
+        """Arreglos (inicio, duracion) de los tramos de un proceso, en orden cronológico"""
+        columna, inicio, duracion = self.columnas()
+        # Recorrido por bloques: en un registro mapeado solo se leen las
+        # páginas de la columna proceso y las de los tramos encontrados
+        posiciones = np.concatenate([
+            np.flatnonzero(columna[desde:desde + TAMANO_BLOQUE] == proceso) + desde
+            for desde in range(0, len(columna), TAMANO_BLOQUE)
+        ] or [np.zeros(0, dtype=np.intp)])
+        return inicio[posiciones], duracion[posiciones]
+
+    def maximos_finales(self):
+        """Máximo acumulado de inicio + duracion (no decreciente), calculado una vez"""
+        if self.finales is None or len(self.finales) != len(self):
+            _, inicio, duracion = self.columnas()
+            self.finales = np.maximum.accumulate(inicio + duracion) if len(inicio) else np.zeros(0, dtype=np.int64)
+        return self.finales
+
+    def en_ventana(self, desde, hasta):
+        """
+        Tramos (proceso, inicio, duracion) que se solapan con [desde, hasta),
+        en el orden del registro
+        """
+        proceso, inicio, duracion = self.columnas()
+        ultimo = int(np.searchsorted(inicio, hasta, side='left'))
+        if self.solapados:
+            # Un tramo de otro núcleo que empezó mucho antes puede cruzar
+            # 'desde': el primer candidato es el primero cuyo máximo
+            # acumulado de finales pasa de 'desde', y entre ese y 'ultimo'
+            # se descartan los que ya terminaron
+            primero = min(ultimo, int(np.searchsorted(self.maximos_finales(), desde, side='right')))
+            cruzan = inicio[primero:ultimo] + duracion[primero:ultimo] > desde
+            return proceso[primero:ultimo][cruzan], inicio[primero:ultimo][cruzan], duracion[primero:ultimo][cruzan]
+
+        # Los tramos no se solapan: solo el anterior al primer inicio > desde
+        # puede cruzar 'desde', y basta mirar ese
+        primero = int(np.searchsorted(inicio, desde, side='right'))
+        if primero and inicio[primero - 1] + duracion[primero - 1] > desde:
+            primero -= 1
+        ultimo = max(primero, ultimo)
+        return proceso[primero:ultimo], inicio[primero:ultimo], duracion[primero:ultimo]
+
+    def por_proceso(self, n, valores=None):
+        """
+        Lista de (inicio, duracion) por proceso: el formato 'ejecuciones' de
+        los dicts. Con valores (una columna paralela a los tramos) agrupa esa
+        columna en lugar de los tramos
+        """
+        grupos = [[] for _ in range(n)]
+        proceso, inicio, duracion = (c.tolist() for c in self.columnas())
+        if valores is None:
+            valores = zip(inicio, duracion)
+        else:
+            valores = np.asarray(valores).tolist()
+        for idx, valor in zip(proceso, valores):
+            grupos[idx].append(valor)
+        return grupos
+
+    def guardar(self, ruta):
+        """
+        Escribe el registro como un .npy int64 de forma (3, n), fila por
+        campo; un registro solapado lleva una cuarta fila con maximos_finales
+        """
+        filas = self.columnas() + ((self.maximos_finales(),) if self.solapados else ())
+        destino = np.lib.format.open_memmap(ruta, mode='w+', dtype=np.int64, shape=(len(filas), len(self)))
+        for fila, columna in zip(destino, filas):
+            fila[:] = columna
+        destino.flush()
+        del destino
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Abre un registro guardado mapeándolo en memoria (solo lectura)"""
+        datos = np.load(ruta, mmap_mode='r')
+        if datos.ndim != 2 or datos.shape[0] not in (3, 4):
+            raise ValueError(f"{ruta}: no es un registro de segmentos (forma {datos.shape})")
+        if datos.shape[0] == 4:
+            return cls(datos[0], datos[1], datos[2], solapados=True, finales=datos[3])
+        return cls(datos[0], datos[1], datos[2])
@@ -0,0 +1,406 @@
+"""
+Simulación multinúcleo (SMP) de las políticas de planificación
+
+Reproduce cualquiera de las políticas de un solo CPU sobre k núcleos con
+una simulación dirigida por eventos: un montículo de fines de tramo por
+núcleo y un cursor sobre las llegadas, así que el costo es
+O((n + tramos) log k) sin importar cuántos ticks dure la carga.
+
+Dos organizaciones de la cola de listos:
+- 'global': una sola cola; el núcleo libre de menor número toma el mejor
+  proceso y, en las políticas preemptivas, un proceso listo interrumpe al
+  peor de los que están en CPU.
+- 'por_nucleo': cada núcleo tiene su cola. Un proceso nuevo despierta a un
+  núcleo libre o, si no hay, entra a la cola del núcleo posicion % k; el
+  expropiado o el que agota su quantum vuelve a la del núcleo donde
+  corrió. Un núcleo sin trabajo roba el mejor proceso de la cola más
+  larga (work stealing).
+
+Cada tramo se anota en tabla.segmentos con su núcleo en tabla.nucleos
+(paralelo a los segmentos). Una migración es un tramo que corre en un
+núcleo distinto al del tramo anterior del mismo proceso.
+
+Con un núcleo, 'global' da los mismos resultados que el motor de un CPU
+de la política (MLFQ sin refuerzo y Prioridad Preemptiva sin
+envejecimiento, que no están disponibles en SMP).
+"""
+import heapq
+from array import array
+
+import numpy as np
+
+from utils.instrumentacion import instrumentado
+from utils.segmentos import RegistroSegmentos
+from utils.tabla import TablaProcesos
+
+COLAS = ('global', 'por_nucleo')
+POLITICAS = ('fcfs', 'sjf', 'prioridad', 'rr', 'srt', 'prioridad_preemptiva', 'mlfq')
+PREEMPTIVAS = ('srt', 'prioridad_preemptiva', 'mlfq')
+
+# Estado de un núcleo que no está ejecutando un proceso
+LIBRE = -1
+CAMBIO = -2  # en cambio de contexto (Round Robin)
+
+
+@instrumentado
+def calcular_smp(procesos, nucleos=2, politica='fcfs', cola='global', quantum=2, cambio_contexto=0,
+                 quantums=(2, 4, 8), degradacion='acumulado', envejecimiento=0, refuerzo=0):
+    """
+    Simula una política de planificación sobre 'nucleos' CPUs
+
+    quantum y cambio_contexto son los de Round Robin; quantums y
+    degradacion los de MLFQ. Acepta una lista de dicts (se actualiza en
+    sitio, con 'ejecuciones' y 'nucleos' en todas las políticas) o una
+    TablaProcesos.
+    """
+    if nucleos < 1:
+        raise ValueError("Se necesita al menos un núcleo")
+    if politica not in POLITICAS:
+        raise ValueError(f"Política desconocida: {politica}")
+    if cola not in COLAS:
+        raise ValueError(f"Organización de cola desconocida: {cola}")
+    if envejecimiento or refuerzo:
+        raise ValueError("El envejecimiento y el refuerzo no están disponibles en modo SMP")
+    quantums = tuple(quantums)
+    if politica == 'rr' and quantum <= 0:
+        raise ValueError("El quantum debe ser positivo")
+    if politica == 'mlfq' and (not quantums or min(quantums) <= 0):
+        raise ValueError("Cada nivel necesita un quantum positivo")
+
+    argumentos = (nucleos, politica, cola, quantum, cambio_contexto, quantums, degradacion == 'tramo')
+    if isinstance(procesos, TablaProcesos):
+        return _planificar_smp(procesos, *argumentos)
+
+    for p in procesos:
+        p.setdefault('llegada', 0)
+        p.setdefault('prioridad', 0)
+
+    _planificar_smp(TablaProcesos.desde_dicts(procesos), *argumentos).actualizar_dicts(procesos)
+    return procesos
+
+
+def _planificar_smp(tabla, nucleos, politica, cola, quantum, cambio_contexto, quantums, por_tramo):
+    total = len(tabla)
+    orden = tabla.orden_llegada().tolist()
+    llegadas = tabla.llegada.tolist()
+    prioridades = tabla.prioridad.tolist()
+    restantes = tabla.duracion.tolist()
+    posicion = [0] * total
+    for pos, idx in enumerate(orden):
+        posicion[idx] = pos
+
+    preemptiva = politica in PREEMPTIVAS
+    por_nucleo = cola == 'por_nucleo'
+    es_rr = politica == 'rr'
+    es_mlfq = politica == 'mlfq'
+    es_srt = politica == 'srt'
+    ultimo_nivel = len(quantums) - 1
+    nivel = [0] * total
+    usado = [0] * total
+    # Orden FIFO de Round Robin y MLFQ: al final con contadores crecientes,
+    # al frente (expropiado en MLFQ) con decrecientes
+    secuencia = 0
+    al_frente = 0
+
+    # Los tramos de núcleos distintos se solapan en el tiempo
+    segmentos = RegistroSegmentos(solapados=nucleos > 1)
+    agregar_segmento = segmentos.agregar
+    duraciones_segmento = segmentos.duracion
+    nucleo_segmento = array('q')
+    nivel_segmento = array('q')
+
+    ejecutando = [LIBRE] * nucleos
+    inicio_tramo = [0] * nucleos
+    tramo_actual = [0] * nucleos  # posición del tramo en curso en el registro
+    version = [0] * nucleos  # invalida los eventos y entradas de un despacho anterior
+    eventos = []  # (fin del tramo o del cambio de contexto, núcleo, versión)
+    libres = list(range(nucleos))  # montículo de núcleos libres (con entradas viejas)
+    num_libres = nucleos
+    # Peor proceso en CPU para expropiar en la cola global: (-rango, -núcleo, versión)
+    ocupados = []
+
+    listos = []  # cola global
+    colas = [[] for _ in range(nucleos)] if por_nucleo else None
+    cargas = []  # montículo de (-largo, núcleo) para elegir a quién robar
+    en_cola = 0  # procesos en las colas por núcleo
+
+    def clave(idx, frente=False):
+        # (primario, desempate, idx): menor es mejor; el primario es lo que
+        # compara la expropiación
+        nonlocal secuencia, al_frente
+        if politica == 'fcfs':
+            return (posicion[idx], 0, idx)
+        if politica == 'sjf':
+            return (restantes[idx], llegadas[idx], idx)
+        if politica == 'prioridad':
+            return (prioridades[idx], llegadas[idx], idx)
+        if es_srt:
+            return (restantes[idx], posicion[idx], idx)
+        if politica == 'prioridad_preemptiva':
+            return (prioridades[idx], posicion[idx], idx)
+        if frente:
+            al_frente -= 1
+            return (nivel[idx], al_frente, idx)
+        secuencia += 1
+        return (nivel[idx] if es_mlfq else 0, secuencia, idx)
+
+    def encolar(idx, nucleo, frente=False):
+        nonlocal en_cola
+        entrada = clave(idx, frente)
+        if not por_nucleo:
+            heapq.heappush(listos, entrada)
+            return
+        cola_nucleo = colas[nucleo]
+        heapq.heappush(cola_nucleo, entrada)
+        en_cola += 1
+        heapq.heappush(cargas, (-len(cola_nucleo), nucleo))
+        if len(cargas) > 2 * nucleos + 1024:
+            cargas[:] = [(-len(c), n) for n, c in enumerate(colas) if c]
+            heapq.heapify(cargas)
+
+    def robar():
+        # Cola más larga; las entradas viejas se corrigen al salir a la cima
+        while True:
+            largo, victima = cargas[0]
+            actual = len(colas[victima])
+            if actual == -largo:
+                return victima
+            if actual:
+                heapq.heapreplace(cargas, (-actual, victima))
+            else:
+                heapq.heappop(cargas)
+
+    def destino_llegada(idx):
+        # Un núcleo libre que nadie haya reclamado en este instante (su cola
+        # sigue vacía y no le vuelve un proceso que agotó su quantum); si no
+        # hay, el núcleo asignado al proceso
+        while libres:
+            nucleo = libres[0]
+            if ejecutando[nucleo] == LIBRE and not colas[nucleo] and nucleo not in reservados:
+                return nucleo
+            heapq.heappop(libres)
+        return posicion[idx] % nucleos
+
+    def despachar(nucleo, idx, tiempo):
+        nonlocal num_libres
+        if es_rr:
+            tramo = min(quantum, restantes[idx])
+        elif es_mlfq:
+            cuota = quantums[nivel[idx]] if por_tramo else quantums[nivel[idx]] - usado[idx]
+            tramo = min(cuota, restantes[idx])
+        else:
+            tramo = restantes[idx]
+        if ejecutando[nucleo] == LIBRE:
+            num_libres -= 1
+        ejecutando[nucleo] = idx
+        inicio_tramo[nucleo] = tiempo
+        tramo_actual[nucleo] = len(nucleo_segmento)
+        agregar_segmento(idx, tiempo, tramo)
+        nucleo_segmento.append(nucleo)
+        if es_mlfq:
+            nivel_segmento.append(nivel[idx])
+        version[nucleo] += 1
+        heapq.heappush(eventos, (tiempo + tramo, nucleo, version[nucleo]))
+        if preemptiva and not por_nucleo:
+            # Rango del proceso en CPU; en SRT, el fin del tramo (el
+            # restante es fin - tiempo y el tiempo es común a todos)
+            if es_srt:
+                rango = tiempo + tramo
+            elif es_mlfq:
+                rango = nivel[idx]
+            else:
+                rango = prioridades[idx]
+            heapq.heappush(ocupados, (-rango, -nucleo, version[nucleo]))
+            if len(ocupados) > 2 * nucleos + 1024:
+                ocupados[:] = [e for e in ocupados if e[2] == version[-e[1]] and ejecutando[-e[1]] >= 0]
+                heapq.heapify(ocupados)
+
+    def liberar(nucleo):
+        nonlocal num_libres
+        ejecutando[nucleo] = LIBRE
+        num_libres += 1
+        heapq.heappush(libres, nucleo)
+        if len(libres) > 2 * nucleos + 1024:
+            libres[:] = [n for n in range(nucleos) if ejecutando[n] == LIBRE]
+        tocados.append(nucleo)
+
+    def interrumpir(nucleo, tiempo):
+        # Corta el tramo en curso y devuelve el proceso a la cola
+        nonlocal num_libres
+        idx = ejecutando[nucleo]
+        ejecutado = tiempo - inicio_tramo[nucleo]
+        duraciones_segmento[tramo_actual[nucleo]] = ejecutado
+        restantes[idx] -= ejecutado
+        usado[idx] += ejecutado
+        version[nucleo] += 1
+        ejecutando[nucleo] = LIBRE
+        num_libres += 1
+        encolar(idx, nucleo, frente=True)
+
+    def supera(primario, nucleo, tiempo):
+        # ¿Un listo con ese primario expropia al proceso en el núcleo?
+        idx = ejecutando[nucleo]
+        if es_srt:
+            return primario < inicio_tramo[nucleo] + duraciones_segmento[tramo_actual[nucleo]] - tiempo
+        if es_mlfq:
+            return primario < nivel[idx]
+        return primario < prioridades[idx]
+
+    siguiente = 0
+    terminados = 0
+    tiempo_actual = 0
+
+    while terminados < total:
+        while eventos and eventos[0][2] != version[eventos[0][1]]:
+            heapq.heappop(eventos)
+        # Las llegadas solo cambian algo si hay un núcleo libre o pueden
+        # expropiar; si no, esperan al siguiente fin de tramo
+        if siguiente < total and (num_libres or preemptiva):
+            tiempo_actual = llegadas[orden[siguiente]]
+            if eventos and eventos[0][0] < tiempo_actual:
+                tiempo_actual = eventos[0][0]
+        else:
+            tiempo_actual = eventos[0][0]
+
+        # 1. Tramos y cambios de contexto que terminan ahora
+        tocados = []  # núcleos cuya cola o estado cambió en este instante
+        vencidos = []
+        while eventos and eventos[0][0] == tiempo_actual:
+            _, nucleo, v = heapq.heappop(eventos)
+            if v != version[nucleo]:
+                continue
+            idx = ejecutando[nucleo]
+            if idx == CAMBIO:
+                liberar(nucleo)
+                continue
+            ejecutado = tiempo_actual - inicio_tramo[nucleo]
+            restantes[idx] -= ejecutado
+            usado[idx] += ejecutado
+            if restantes[idx] == 0:
+                terminados += 1
+            else:
+                vencidos.append((idx, nucleo))
+            if cambio_contexto > 0 and es_rr:
+                ejecutando[nucleo] = CAMBIO
+                version[nucleo] += 1
+                heapq.heappush(eventos, (tiempo_actual + cambio_contexto, nucleo, version[nucleo]))
+            else:
+                liberar(nucleo)
+
+        reservados = {nucleo for _, nucleo in vencidos} if por_nucleo else ()
+
+        # 2. Llegadas hasta ahora (antes que los que vuelven a la cola, como
+        # en Round Robin); en RR las del mismo intervalo en orden de tabla
+        if siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+            desde = siguiente
+            while siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+                siguiente += 1
+            nuevos = orden[desde:siguiente]
+            if es_rr and len(nuevos) > 1:
+                nuevos.sort()
+            for idx in nuevos:
+                if restantes[idx] > 0:
+                    nucleo = destino_llegada(idx) if por_nucleo else 0
+                    encolar(idx, nucleo)
+                    tocados.append(nucleo)
+                else:
+                    terminados += 1
+
+        # 3. Los que agotaron su quantum vuelven a la cola (en MLFQ, un nivel abajo)
+        for idx, nucleo in vencidos:
+            if es_mlfq:
+                nivel[idx] = min(nivel[idx] + 1, ultimo_nivel)
+                usado[idx] = 0
+            encolar(idx, nucleo)
+            tocados.append(nucleo)
+
+        # 4. Núcleos libres: primero su propia cola, luego roban; y 5. expropiación
+        if por_nucleo:
+            for nucleo in tocados:
+                cola_nucleo = colas[nucleo]
+                if not cola_nucleo:
+                    continue
+                if ejecutando[nucleo] == LIBRE:
+                    en_cola -= 1
+                    despachar(nucleo, heapq.heappop(cola_nucleo)[2], tiempo_actual)
+                elif preemptiva and ejecutando[nucleo] >= 0 and supera(cola_nucleo[0][0], nucleo, tiempo_actual):
+                    interrumpir(nucleo, tiempo_actual)
+                    en_cola -= 1
+                    despachar(nucleo, heapq.heappop(cola_nucleo)[2], tiempo_actual)
+            while en_cola and num_libres:
+                nucleo = heapq.heappop(libres)
+                if ejecutando[nucleo] != LIBRE:
+                    continue
+                en_cola -= 1
+                despachar(nucleo, heapq.heappop(colas[robar()])[2], tiempo_actual)
+        else:
+            while listos and num_libres:
+                nucleo = heapq.heappop(libres)
+                if ejecutando[nucleo] != LIBRE:
+                    continue
+                despachar(nucleo, heapq.heappop(listos)[2], tiempo_actual)
+            while preemptiva and listos and ocupados:
+                _, menos_nucleo, v = ocupados[0]
+                nucleo = -menos_nucleo
+                if v != version[nucleo] or ejecutando[nucleo] < 0:
+                    heapq.heappop(ocupados)
+                    continue
+                if not supera(listos[0][0], nucleo, tiempo_actual):
+                    break
+                heapq.heappop(ocupados)
+                interrumpir(nucleo, tiempo_actual)
+                despachar(nucleo, heapq.heappop(listos)[2], tiempo_actual)
+
+    tabla.segmentos = segmentos
+    tabla.nucleos = np.frombuffer(nucleo_segmento, dtype=np.int64)
+    if es_mlfq:
+        tabla.niveles = np.frombuffer(nivel_segmento, dtype=np.int64)
+    tabla.completar_desde_segmentos()
+    tabla.calcular_metricas()
+    return tabla
+
+
+def _columnas_smp(procesos):
+    # (proceso, inicio, duracion, nucleo) de cada tramo, en orden cronológico por proceso
+    if isinstance(procesos, TablaProcesos):
+        proceso, inicio, duracion = procesos.segmentos.columnas()
+        return proceso, inicio, duracion, procesos.nucleos
+    columnas = ([], [], [], [])
+    for i, p in enumerate(procesos):
+        for (ini, dur), nucleo in zip(p['ejecuciones'], p['nucleos']):
+            for columna, valor in zip(columnas, (i, ini, dur, nucleo)):
+                columna.append(valor)
+    return tuple(np.asarray(c, dtype=np.int64) for c in columnas)
+
+
+def resumir_nucleos(procesos, nucleos):
+    """
+    Uso de cada núcleo en una corrida SMP (TablaProcesos o lista de dicts)
+
+    Por núcleo: ticks ocupados, utilización sobre el tiempo total, tramos,
+    procesos distintos que corrieron en él y migraciones que recibió.
+    """
+    proceso, inicio, duracion, nucleo = _columnas_smp(procesos)
+    tiempo_total = int((inicio + duracion).max(initial=0))
+
+    ocupado = np.bincount(nucleo, weights=duracion, minlength=nucleos)
+    tramos = np.bincount(nucleo, minlength=nucleos)
+    distintos = np.bincount(np.unique(proceso * nucleos + nucleo) % nucleos, minlength=nucleos)
+    # Tramos de cada proceso en orden cronológico: hay migración donde
+    # cambia el núcleo entre dos tramos seguidos del mismo proceso
+    orden = np.argsort(proceso, kind='stable')
+    proceso, nucleo = proceso[orden], nucleo[orden]
+    migra = (proceso[1:] == proceso[:-1]) & (nucleo[1:] != nucleo[:-1])
+    migraciones = np.bincount(nucleo[1:][migra], minlength=nucleos)
+
+    return [
+        {
+            'nucleo': n,
+            'ticks_ocupado': int(ocupado[n]),
+            'utilizacion': 100 * float(ocupado[n]) / tiempo_total if tiempo_total else 0.0,
+            'tramos': int(tramos[n]),
+            'procesos': int(distintos[n]),
+            'migraciones': int(migraciones[n]),
+        }
+        for n in range(nucleos)
+    ]
@@ -1,58 +1,85 @@
+import heapq
+
+from utils.instrumentacion import instrumentado
+from utils.segmentos import RegistroSegmentos
+from utils.tabla import TablaProcesos
+
+
+@instrumentado
 def calcular_srt(procesos):
     """
     Implementa el algoritmo Shortest Remaining Time (preemptivo)
+
+    Simulación dirigida por eventos: en lugar de avanzar tick a tick, el
+    proceso con menor tiempo restante (montículo) se ejecuta hasta la
+    siguiente llegada o hasta terminar, lo que ocurra primero. Los tramos
+    se anotan en un RegistroSegmentos (tabla.segmentos).
     """
+    if isinstance(procesos, TablaProcesos):
+        return _planificar_srt(procesos)
+
     for p in procesos:
         p.setdefault('llegada', 0)
-    
+
     procesos.sort(key=lambda p: p['llegada'])
-    
-    tiempo_actual = 0
-    ejecuciones = {p['pid']: [] for p in procesos}
-    restante = {p['pid']: p['duracion'] for p in procesos}
-    completados = 0
-    total_procesos = len(procesos)
-    
-    while completados < total_procesos:
-        disponibles = [p for p in procesos if p['llegada'] <= tiempo_actual and restante[p['pid']] > 0]
-        
-        if disponibles:
-            disponibles.sort(key=lambda p: restante[p['pid']])
-            actual = disponibles[0]
-            pid = actual['pid']
-            
-            if not ejecuciones[pid] or ejecuciones[pid][-1][0] + ejecuciones[pid][-1][1] < tiempo_actual:
-                ejecuciones[pid].append((tiempo_actual, 1))
-            else:
-                ejecuciones[pid][-1] = (ejecuciones[pid][-1][0], ejecuciones[pid][-1][1] + 1)
-                
-            restante[pid] -= 1
-            tiempo_actual += 1
-            
-            if restante[pid] == 0:
-                completados += 1
-                actual['final'] = tiempo_actual
-        else:
-            procesos_pendientes = [p for p in procesos if p['llegada'] > tiempo_actual and restante[p['pid']] > 0]
-            if procesos_pendientes:
-                siguiente_llegada = min(p['llegada'] for p in procesos_pendientes)
-                tiempo_actual = siguiente_llegada
-            else:
-                tiempo_actual += 1
-    
+
+    _planificar_srt(TablaProcesos.desde_dicts(procesos)).actualizar_dicts(procesos)
     for p in procesos:
-        p['ejecuciones'] = ejecuciones[p['pid']]
-        if ejecuciones[p['pid']]:
-            p['inicio'] = ejecuciones[p['pid']][0][0]
-            p['final'] = ejecuciones[p['pid']][-1][0] + ejecuciones[p['pid']][-1][1]
-            p['retorno'] = p['final'] - p['llegada']
-            p['espera'] = p['retorno'] - p['duracion']
-        else:
-            p['inicio'] = p['llegada']
-            p['final'] = p['llegada'] + p['duracion']
-            p['retorno'] = p['duracion']
-            p['espera'] = 0
-        
         p.setdefault('prioridad', 0)
-    
-    return procesos
\ No newline at end of file
+
+    return procesos
+
+
+def _planificar_srt(tabla):
+    total = len(tabla)
+    orden = tabla.orden_llegada().tolist()
+    llegadas = tabla.llegada.tolist()
+    duraciones = tabla.duracion.tolist()
+    segmentos = RegistroSegmentos()
+    agregar_segmento = segmentos.agregar
+    duraciones_segmento = segmentos.duracion
+    ultimo = -1
+    fin_ultimo = -1
+
+    # Montículo de (restante, posición de llegada): el desempate por posición
+    # reproduce el ordenamiento estable del recorrido tick a tick
+    listos = []
+    siguiente = 0
+    tiempo_actual = 0
+
+    while siguiente < total or listos:
+        while siguiente < total and llegadas[orden[siguiente]] <= tiempo_actual:
+            duracion = duraciones[orden[siguiente]]
+            if duracion > 0:
+                heapq.heappush(listos, (duracion, siguiente))
+            siguiente += 1
+
+        if not listos:
+            tiempo_actual = llegadas[orden[siguiente]]
+            continue
+
+        restante, posicion = heapq.heappop(listos)
+
+        tramo = restante
+        if siguiente < total:
+            tramo = min(tramo, llegadas[orden[siguiente]] - tiempo_actual)
+
+        # Si el mismo proceso sigue sin interrupción, se extiende su último
+        # tramo, que es también el último del registro
+        if posicion == ultimo and fin_ultimo == tiempo_actual:
+            duraciones_segmento[-1] += tramo
+        else:
+            agregar_segmento(orden[posicion], tiempo_actual, tramo)
+            ultimo = posicion
+
+        tiempo_actual += tramo
+        fin_ultimo = tiempo_actual
+        restante -= tramo
+
+        if restante > 0:
+            heapq.heappush(listos, (restante, posicion))
+
+    tabla.segmentos = segmentos
+    tabla.completar_desde_segmentos()
+    tabla.calcular_metricas()
+    return tabla
@@ -0,0 +1,118 @@
+import numpy as np
+
+from utils.instrumentacion import fase
+
+COLUMNAS = ('pid', 'llegada', 'duracion', 'prioridad', 'inicio', 'final', 'retorno', 'espera')
+COLUMNAS_RESULTADO = ('inicio', 'final', 'retorno', 'espera')
+
+
+class TablaProcesos:
+    """
+    Tabla columnar de procesos: un arreglo NumPy por campo en lugar de un
+    dict por proceso. Es el modelo de datos nativo de los motores calcular_*
+    """
+
+    __slots__ = COLUMNAS + ('segmentos', 'niveles', 'nucleos', '_orden_llegada')
+
+    def __init__(self, pid, llegada, duracion, prioridad=None):
+        self.pid = np.asarray(pid, dtype=np.int64)
+        n = len(self.pid)
+        self.llegada = np.asarray(llegada, dtype=np.int64)
+        self.duracion = np.asarray(duracion, dtype=np.int64)
+        if prioridad is None:
+            self.prioridad = np.zeros(n, dtype=np.int64)
+        else:
+            self.prioridad = np.asarray(prioridad, dtype=np.int64)
+        for columna in COLUMNAS_RESULTADO:
+            setattr(self, columna, np.zeros(n, dtype=np.int64))
+        # RegistroSegmentos de los tramos de CPU; solo lo llenan los
+        # algoritmos preemptivos
+        self.segmentos = None
+        # Nivel de cola de cada segmento (paralelo a segmentos); solo MLFQ
+        self.niveles = None
+        # Núcleo de cada segmento (paralelo a segmentos); solo en modo SMP
+        self.nucleos = None
+        self._orden_llegada = None
+
+    def __len__(self):
+        return len(self.pid)
+
+    @classmethod
+    def desde_dicts(cls, procesos):
+        """Construye la tabla a partir de la lista de dicts que usan las páginas"""
+        n = len(procesos)
+        with fase('preparacion'):
+            return cls(
+                np.fromiter((p['pid'] for p in procesos), dtype=np.int64, count=n),
+                np.fromiter((p.get('llegada', 0) for p in procesos), dtype=np.int64, count=n),
+                np.fromiter((p['duracion'] for p in procesos), dtype=np.int64, count=n),
+                np.fromiter((p.get('prioridad', 0) for p in procesos), dtype=np.int64, count=n),
+            )
+
+    def orden_llegada(self):
+        """Índices en orden de llegada (estable); se ordena una sola vez por carga"""
+        if self._orden_llegada is None:
+            self._orden_llegada = np.argsort(self.llegada, kind='stable')
+        return self._orden_llegada
+
+    def copia_entrada(self):
+        """
+        Tabla nueva sin resultados que comparte las columnas de entrada y el
+        orden de llegada ya calculado: permite correr varios algoritmos sobre
+        la misma carga sin copiarla ni reordenarla
+        """
+        copia = TablaProcesos(self.pid, self.llegada, self.duracion, self.prioridad)
+        copia._orden_llegada = self._orden_llegada
+        return copia
+
+    @property
+    def ejecuciones(self):
+        """Lista de (inicio, duracion) por proceso, materializada desde los segmentos"""
+        if self.segmentos is None:
+            return None
+        return self.segmentos.por_proceso(len(self))
+
+    def a_dicts(self):
+        """Convierte la tabla al formato de lista de dicts"""
+        with fase('postproceso'):
+            columnas = [getattr(self, c).tolist() for c in COLUMNAS]
+            procesos = [dict(zip(COLUMNAS, fila)) for fila in zip(*columnas)]
+            self._escribir_segmentos(procesos)
+            return procesos
+
+    def actualizar_dicts(self, procesos):
+        """Escribe los resultados de la tabla en los dicts originales (mismo orden)"""
+        with fase('postproceso'):
+            resultados = [getattr(self, c).tolist() for c in COLUMNAS_RESULTADO]
+            self._escribir_segmentos(procesos)
+            for p, fila in zip(procesos, zip(*resultados)):
+                p['inicio'], p['final'], p['retorno'], p['espera'] = fila
+            return procesos
+
+    def _escribir_segmentos(self, procesos):
+        # 'ejecuciones' y, en MLFQ y SMP, 'niveles' y 'nucleos' (nivel y
+        # núcleo de cada ejecución)
+        if self.segmentos is None:
+            return
+        for p, ejecuciones in zip(procesos, self.ejecuciones):
+            p['ejecuciones'] = ejecuciones
+        for campo in ('niveles', 'nucleos'):
+            valores = getattr(self, campo)
+            if valores is None:
+                continue
+            for p, grupo in zip(procesos, self.segmentos.por_proceso(len(self), valores)):
+                p[campo] = grupo
+
+    def completar_desde_segmentos(self):
+        """Deriva inicio y final del primer y último tramo de cada proceso"""
+        with fase('postproceso'):
+            primero, ultimo = self.segmentos.extremos(len(self))
+            sin_tramos = ultimo < 0
+            self.inicio = np.where(sin_tramos, self.llegada, primero)
+            self.final = np.where(sin_tramos, self.llegada + self.duracion, ultimo)
+
+    def calcular_metricas(self):
+        """Calcula retorno y espera de forma vectorizada a partir de final"""
+        with fase('postproceso'):
+            self.retorno = self.final - self.llegada
+            self.espera = self.retorno - self.duracion
@@ -0,0 +1,198 @@
+"""
+Importador de trazas reales de trabajos (SWF y registros similares)
+
+Lee trazas en Standard Workload Format (Parallel Workloads Archive) y
+registros de trabajos separados por espacios o por comas. El archivo se
+mapea en memoria y se convierte por bloques alineados a fin de línea con
+np.loadtxt, sin crear objetos Python por trabajo; de cada bloque solo se
+convierten las columnas usadas y se conservan pid, llegada, duracion y
+prioridad de los trabajos que pasan los filtros.
+
+Uso:
+    tabla = cargar_traza('CTC-SP2-1996-3.1-cln.swf', desde=0, hasta=7 * 86400, unidad=60)
+    calcular_sjf(tabla)
+
+    python -m utils traza.swf --algoritmos fcfs,sjf --sin-salida --metricas metricas.csv
+"""
+import io
+import mmap
+import os
+import warnings
+
+import numpy as np
+
+from utils.tabla import TablaProcesos
+
+# Campos de una línea SWF, en orden (los valores ausentes valen -1)
+CAMPOS_SWF = (
+    'trabajo', 'envio', 'espera', 'ejecucion', 'procesadores', 'cpu_promedio',
+    'memoria', 'procesadores_pedidos', 'tiempo_pedido', 'memoria_pedida', 'estado',
+    'usuario', 'grupo', 'ejecutable', 'cola', 'particion', 'trabajo_previo', 'pensar',
+)
+
+# Columnas de la traza que alimentan cada campo de TablaProcesos. SWF no
+# tiene prioridad: se usa el número de cola, que suele codificarla
+COLUMNAS_SWF = {'pid': 'trabajo', 'llegada': 'envio', 'duracion': 'ejecucion', 'prioridad': 'cola'}
+
+TAMANO_BLOQUE = 32 * 2**20
+COMENTARIOS = (b';', b'#')
+
+
+def _abrir(fuente):
+    # Devuelve un objeto con interfaz de bytes (mmap o el propio buffer) y su cierre
+    if isinstance(fuente, (bytes, bytearray)):
+        return fuente, lambda: None
+    if isinstance(fuente, memoryview):
+        return fuente.tobytes(), lambda: None
+    archivo = open(fuente, 'rb')
+    if os.fstat(archivo.fileno()).st_size == 0:
+        archivo.close()
+        return b'', lambda: None
+    datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def cerrar():
+        datos.close()
+        archivo.close()
+    return datos, cerrar
+
+
+def _formato(datos, separador):
+    """Detecta separador, nombres de campos y si la primera línea de datos es encabezado"""
+    inicio = 0
+    while inicio < len(datos):
+        fin = datos.find(b'\n', inicio)
+        fin = len(datos) if fin < 0 else fin
+        linea = bytes(datos[inicio:fin]).strip()
+        if linea and not linea.startswith(COMENTARIOS):
+            break
+        inicio = fin + 1
+    else:
+        return separador, CAMPOS_SWF, 0
+
+    if separador is None:
+        separador = ',' if b',' in linea else None
+    valores = [v.strip() for v in (linea.split(separador.encode()) if separador else linea.split())]
+    try:
+        [float(v) for v in valores]
+    except ValueError:
+        # Encabezado con nombres de columnas (CSV o similar)
+        return separador, tuple(v.decode().lower() for v in valores), fin + 1
+    nombres = CAMPOS_SWF if len(valores) == len(CAMPOS_SWF) else tuple(str(i) for i in range(len(valores)))
+    return separador, nombres, inicio
+
+
+def _bloques(datos, inicio, tamano_bloque):
+    # Cortes alineados a fin de línea: ningún registro queda partido entre bloques
+    total = len(datos)
+    while inicio < total:
+        fin = inicio + tamano_bloque
+        if fin >= total:
+            fin = total
+        else:
+            corte = datos.rfind(b'\n', inicio, fin)
+            # Una línea más larga que el bloque lo extiende hasta su fin
+            fin = corte + 1 if corte >= 0 else (datos.find(b'\n', fin) + 1 or total)
+        yield bytes(datos[inicio:fin])
+        inicio = fin
+
+
+def _parsear(texto, separador, usecols):
+    # loadtxt convierte en C y solo las columnas pedidas; los comentarios de
+    # SWF (';') y de otros registros ('#') se ignoran en cualquier línea
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)  # bloque sin datos
+        return np.loadtxt(
+            io.BytesIO(texto), dtype=np.float64, delimiter=separador,
+            comments=[c.decode() for c in COMENTARIOS], usecols=usecols, ndmin=2
+        )
+
+
+def _indice(nombres, columna):
+    if isinstance(columna, int):
+        return columna
+    if columna in nombres:
+        return nombres.index(columna)
+    raise ValueError(f"La traza no tiene la columna '{columna}' (columnas: {', '.join(nombres)})")
+
+
+def leer_traza(fuente, columnas=None, separador=None, desde=None, hasta=None, estados=None,
+               unidad=1, normalizar=True, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Genera la traza por bloques de TablaProcesos
+
+    fuente es una ruta o un buffer de bytes. columnas asigna a pid,
+    llegada, duracion y prioridad un nombre o índice de columna (por
+    defecto COLUMNAS_SWF; en un CSV con encabezado, las columnas que se
+    llamen igual que el campo). desde/hasta seleccionan la ventana [desde, hasta) de
+    llegadas y estados filtra por la columna 'estado' de SWF (1 =
+    completado). unidad agrupa el tiempo en ticks (60 = minutos). Los
+    trabajos sin duración válida se descartan; con normalizar, la primera
+    llegada conservada (o 'desde') pasa a ser el tiempo 0, por lo que la
+    traza debe venir ordenada por llegada, como exige SWF.
+    """
+    datos, cerrar = _abrir(fuente)
+    try:
+        separador, nombres, inicio = _formato(datos, separador)
+        if nombres == CAMPOS_SWF:
+            por_defecto = COLUMNAS_SWF
+        else:
+            por_defecto = {c: c for c in ('pid', 'llegada', 'duracion', 'prioridad') if c in nombres}
+        columnas = dict(por_defecto, **(columnas or {}))
+        if 'llegada' not in columnas or 'duracion' not in columnas:
+            raise ValueError("Hay que indicar las columnas de llegada y duración de la traza")
+        indices = {campo: _indice(nombres, columna) for campo, columna in columnas.items()}
+        if estados is not None:
+            indices['estado'] = _indice(nombres, 'estado')
+            estados = np.asarray(list(estados), dtype=np.float64)
+        # Solo se convierten las columnas usadas; 'posicion' las ubica en el bloque
+        usecols = sorted(set(indices.values()))
+        posicion = {campo: usecols.index(indice) for campo, indice in indices.items()}
+
+        origen = desde if normalizar and desde is not None else None
+        leidos = 0
+        for texto in _bloques(datos, inicio, tamano_bloque):
+            filas = _parsear(texto, separador, usecols)
+            if not len(filas):
+                continue
+            llegada = filas[:, posicion['llegada']]
+            duracion = filas[:, posicion['duracion']]
+
+            conservar = duracion > 0
+            if desde is not None:
+                conservar &= llegada >= desde
+            if hasta is not None:
+                conservar &= llegada < hasta
+            if estados is not None:
+                conservar &= np.isin(filas[:, posicion['estado']], estados)
+
+            n = len(filas)
+            pid = filas[:, posicion['pid']] if 'pid' in posicion else np.arange(leidos, leidos + n)
+            prioridad = np.maximum(filas[:, posicion['prioridad']], 0) if 'prioridad' in posicion else np.zeros(n)
+            leidos += n
+
+            llegada = llegada[conservar]
+            if not len(llegada):
+                continue
+            if normalizar:
+                if origen is None:
+                    origen = llegada[0]
+                llegada = llegada - origen
+            yield TablaProcesos(
+                pid[conservar].astype(np.int64),
+                np.floor(llegada / unidad).astype(np.int64),
+                np.ceil(duracion[conservar] / unidad).astype(np.int64),
+                prioridad[conservar].astype(np.int64),
+            )
+    finally:
+        cerrar()
+
+
+def cargar_traza(fuente, **opciones):
+    """Carga la traza completa (filtrada) en una sola TablaProcesos; ver leer_traza"""
+    bloques = list(leer_traza(fuente, **opciones))
+    if not bloques:
+        return TablaProcesos([], [], [], [])
+    return TablaProcesos(*(
+        np.concatenate([getattr(b, c) for b in bloques])
+        for c in ('pid', 'llegada', 'duracion', 'prioridad')
+    ))
@@ -1,5 +1,33 @@
+import hashlib
+import io
+import json
+import threading
+from bisect import insort
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
+
+from utils.tabla import TablaProcesos
+
+# Colores del fondo, los bordes y los textos del Gantt por tema; las barras
+# conservan la paleta de procesos en ambos
+TEMAS_GANTT = {
+    'oscuro': {'figura': '#1e1f2f', 'ejes': '#292b3e', 'bordes': '#495057', 'texto': 'white'},
+    'claro': {'figura': '#ffffff', 'ejes': '#f0f2f6', 'bordes': '#adb5bd', 'texto': '#31333f'},
+}
+
+def tema_gantt(contexto):
+    """
+    Tema del Gantt según el de la app ('claro' u 'oscuro')
+
+    Recibe st.context; las versiones de Streamlit sin st.context.theme
+    usan el tema oscuro, que es el de la app por defecto.
+    """
+    tema = getattr(contexto, 'theme', None)
+    return 'claro' if getattr(tema, 'type', None) == 'light' else 'oscuro'
 
 def generar_colores(n):
     """Genera una lista de n colores distintos"""
@@ -8,138 +36,421 @@ def generar_colores(n):
     cmap = plt.get_cmap('tab10')
     return [cmap(i % 10) for i in range(n)]
 
+def obtener_intervalos_espera(procesos, tiempo_maximo):
+    """
+    Calcula los intervalos en que cada proceso estuvo en espera, INCLUYENDO t=0
+
+    Barrido por eventos (llegada, inicio y fin de cada tramo): entre dos
+    eventos el tiempo restante de un proceso en espera no cambia, así que
+    se devuelve comprimido como (desde, hasta, pid, restante) con 'hasta'
+    excluido, en el orden de la lista de procesos.
+    """
+    intervalos = []
+    limite_global = tiempo_maximo + 1
+
+    for proceso in procesos:
+        if 'ejecuciones' in proceso:
+            tramos = sorted(proceso['ejecuciones'])
+        elif 'inicio' in proceso:
+            tramos = [(proceso['inicio'], proceso['final'] - proceso['inicio'])]
+        else:
+            tramos = []
+
+        limite = min(proceso.get('final', limite_global), limite_global)
+        desde = max(proceso['llegada'], 0)
+        restante = proceso['duracion']
+
+        for inicio, duracion in tramos:
+            hasta = min(inicio, limite)
+            if desde < hasta and restante > 0:
+                intervalos.append((desde, hasta, proceso['pid'], restante))
+            restante -= duracion
+            desde = max(desde, inicio + duracion)
+
+        if desde < limite and restante > 0:
+            intervalos.append((desde, limite, proceso['pid'], restante))
+
+    return intervalos
+
 def obtener_procesos_en_espera_por_tiempo(procesos, tiempo_maximo):
     """Calcula qué procesos estaban en espera en cada unidad de tiempo, INCLUYENDO t=0"""
     procesos_en_espera = {t: [] for t in range(tiempo_maximo + 1)}
-    tiempo_ejecutado = {p['pid']: 0 for p in procesos}
 
-    for t in range(tiempo_maximo + 1): 
+    for desde, hasta, pid, restante in obtener_intervalos_espera(procesos, tiempo_maximo):
+        info = {'pid': pid, 'restante': restante}
+        for t in range(desde, hasta):
+            procesos_en_espera[t].append(info)
+
+    return procesos_en_espera
+
+def apilar_intervalos_espera(intervalos):
+    """
+    Posición de cada intervalo de espera en la pila de la cola
+
+    Barrido por eventos: entre dos eventos el conjunto en espera no cambia
+    y cada proceso ocupa la posición de su pid entre los que esperan. Se
+    devuelven las piezas [desde, hasta, pid, posicion, restante] (las
+    contiguas de un mismo intervalo con la misma posición van unidas) y
+    el máximo de procesos en espera a la vez.
+    """
+    eventos = sorted({desde for desde, _, _, _ in intervalos} | {hasta for _, hasta, _, _ in intervalos})
+    por_desde = {}
+    for k, intervalo in enumerate(intervalos):
+        por_desde.setdefault(intervalo[0], []).append(k)
+
+    activos = []
+    piezas = []
+    ultima_pieza = {}
+    max_espera = 0
+    for desde, hasta in zip(eventos, eventos[1:]):
+        activos = [(pid, k) for pid, k in activos if intervalos[k][1] > desde]
+        for k in por_desde.get(desde, ()):
+            insort(activos, (intervalos[k][2], k))
+        max_espera = max(max_espera, len(activos))
+        for posicion, (pid, k) in enumerate(activos):
+            pieza = ultima_pieza.get(k)
+            if pieza is not None and pieza[1] == desde and pieza[3] == posicion:
+                pieza[1] = hasta
+            else:
+                pieza = [desde, hasta, pid, posicion, intervalos[k][3]]
+                ultima_pieza[k] = pieza
+                piezas.append(pieza)
+    piezas.sort()
+    return piezas, max_espera
+
+PIXELES_POR_CARACTER = 8.5
+MAX_MARCAS_POR_TICK = 60
+
+class _CapaBarras:
+    """
+    Barras de un panel del Gantt agrupadas en una PolyCollection por proceso
+
+    Cada barra (x0, x1, y) se dibuja recortada en 'corte'; al mover el
+    corte solo se recalculan las colecciones y etiquetas de las barras que
+    se solapan con el tramo entre el corte anterior y el nuevo. Las
+    etiquetas solo se crean donde caben en pantalla.
+    """
+
+    def __init__(self, ax, x0, x1, y, pids, etiquetas, colores, alpha, alto, pixeles_por_unidad, fontsize=None):
+        orden = np.lexsort((y, x0))
+        self.ax = ax
+        self.x0 = np.asarray(x0, dtype=float)[orden]
+        self.x1 = np.asarray(x1, dtype=float)[orden]
+        self.y = np.asarray(y, dtype=float)[orden]
+        self.pids = np.asarray(pids)[orden]
+        self.etiquetas = [etiquetas[i] for i in orden.tolist()]
+        self.alto = alto
+        self.pixeles_por_unidad = pixeles_por_unidad
+        self.fontsize = fontsize
+        self._finales = np.maximum.accumulate(self.x1) if len(self.x1) else self.x1
+        self._textos = {}
+
+        self._por_pid = {}
+        for pid in np.unique(self.pids).tolist():
+            indices = np.flatnonzero(self.pids == pid)
+            x0_pid, x1_pid, y_pid = self.x0[indices], self.x1[indices], self.y[indices]
+            vertices = np.stack([
+                np.stack([x0_pid, y_pid], axis=1),
+                np.stack([x0_pid, y_pid + alto], axis=1),
+                np.stack([x1_pid, y_pid + alto], axis=1),
+                np.stack([x1_pid, y_pid], axis=1),
+            ], axis=1)
+            coleccion = PolyCollection([], facecolors=colores[pid], alpha=alpha)
+            ax.add_collection(coleccion, autolim=False)
+            self._por_pid[pid] = (x0_pid, x1_pid, np.maximum.accumulate(x1_pid), vertices, coleccion)
+
+        self.corte = -np.inf
+
+    def recortar(self, corte):
+        bajo, alto = min(self.corte, corte), max(self.corte, corte)
+        primero = int(np.searchsorted(self._finales, bajo, side='right'))
+        ultimo = int(np.searchsorted(self.x0, alto, side='left'))
+        self.corte = corte
+        if primero >= ultimo:
+            return
+
+        for pid in np.unique(self.pids[primero:ultimo]).tolist():
+            x0_pid, x1_pid, finales_pid, vertices, coleccion = self._por_pid[pid]
+            k = int(np.searchsorted(x0_pid, corte, side='left'))
+            visibles = vertices[:k]
+            if k and finales_pid[k - 1] > corte:
+                visibles = visibles.copy()
+                visibles[:, 2:, 0] = np.minimum(x1_pid[:k], corte)[:, None]
+            coleccion.set_verts(visibles)
+
+        for i in range(primero, ultimo):
+            etiqueta = self.etiquetas[i]
+            if etiqueta is None:
+                continue
+            ancho = min(self.x1[i], corte) - self.x0[i]
+            texto = self._textos.get(i)
+            cabe = ancho > 0 and ancho * self.pixeles_por_unidad >= len(etiqueta) * PIXELES_POR_CARACTER
+            if not cabe:
+                if texto is not None:
+                    texto.set_visible(False)
+                continue
+            x = self.x0[i] + ancho/2
+            if texto is None:
+                self._textos[i] = self.ax.text(x, self.y[i] + self.alto/2, etiqueta, ha='center', va='center', color='white', fontweight='bold', fontsize=self.fontsize)
+            else:
+                texto.set_x(x)
+                texto.set_visible(True)
+
+def _fusionar_barras(x0, x1, y, pids, etiquetas, hueco):
+    """
+    Une barras consecutivas del mismo proceso y fila separadas por menos de
+    'hueco'. Si la unión cubre un hueco real o etiquetas distintas, la barra
+    resultante queda sin etiqueta.
+    """
+    orden = sorted(range(len(x0)), key=lambda i: (pids[i], y[i], x0[i]))
+    fusion = []
+    for i in orden:
+        if fusion:
+            ultima = fusion[-1]
+            if ultima[3] == pids[i] and ultima[2] == y[i] and x0[i] - ultima[1] < hueco:
+                if x0[i] > ultima[1] or ultima[4] != etiquetas[i]:
+                    ultima[4] = None
+                ultima[1] = max(ultima[1], x1[i])
+                continue
+        fusion.append([x0[i], x1[i], y[i], pids[i], etiquetas[i]])
+    return [list(columna) for columna in zip(*fusion)] if fusion else [[], [], [], [], []]
+
+class GraficoGantt:
+    """
+    Diagrama de Gantt persistente para una simulación
+
+    El fondo estático (ejes, títulos, marcas, cola de espera precalculada)
+    se construye una sola vez. dibujar(tiempo_actual) solo actualiza las
+    barras recortadas, las celdas de la cola y el cursor rojo, y lo hace
+    de forma incremental respecto al último tiempo dibujado.
+
+    Cada panel usa una PolyCollection por proceso en lugar de un artista
+    por barra; si hay más barras que píxeles, las barras contiguas del
+    mismo proceso se fusionan (nivel de detalle).
+
+    Si los procesos traen 'nucleos' (simulación SMP), el panel de ejecución
+    tiene un carril por núcleo; nucleos fija cuántos carriles dibujar
+    aunque alguno no haya ejecutado nada.
+
+    'huella' identifica lo dibujado (plan, título y ejes) y 'candado'
+    serializa el dibujo, que puede ocurrir desde el hilo que adelanta
+    fotogramas (utils.fotogramas). El tema (TEMAS_GANTT) no forma parte de
+    la huella: png() cambia los colores de la figura si se le pide otro.
+    """
+
+    def __init__(self, procesos, algoritmo, tiempo_maximo=None, nucleos=None, tema='oscuro'):
+        if tiempo_maximo is None:
+            tiempo_maximo = max([p.get('final', 0) for p in procesos]) if procesos else 0
+        self.tiempo_maximo = tiempo_maximo
+        self.huella = _huella_gantt(procesos, algoritmo, tiempo_maximo, nucleos)
+        self.candado = threading.Lock()
+        multinucleo = any('nucleos' in p for p in procesos)
+        if multinucleo and nucleos is None:
+            nucleos = max((n for p in procesos for n in p['nucleos']), default=0) + 1
+        carriles = nucleos if multinucleo else 1
+
+        self.fig = Figure(figsize=(12, 8))
+        self.ax1, self.ax2 = self.fig.subplots(2, 1)
+
+        for ax in [self.ax1, self.ax2]:
+            ax.grid(True, alpha=0.3)
+            ax.set_xlim(-0.5, tiempo_maximo + 1)
+            ax.set_yticks([])
+            if tiempo_maximo + 2 <= MAX_MARCAS_POR_TICK:
+                ax.set_xticks(range(0, tiempo_maximo + 2, 1))
+            else:
+                ax.xaxis.set_major_locator(MaxNLocator(nbins=15, integer=True))
+            ax.set_xlabel("Tiempo")
+            ax.set_ylabel("")
+
+        self.ax1.set_title(f"Ejecución - Algoritmo {algoritmo}", pad=20)
+        if multinucleo:
+            # CPU 0 en el carril de arriba
+            self.ax1.set_ylim(-0.5, carriles + 0.3)
+            self.ax1.set_yticks([carriles - 1 - c + 0.4 for c in range(carriles)])
+            self.ax1.set_yticklabels([f"CPU {c}" for c in range(carriles)])
+        else:
+            self.ax1.set_ylim(-0.5, 1.3)
+        self.ax2.set_title("Cola de Procesos en Espera", pad=20)
+        self.tema = None
+        self.aplicar_tema(tema)
+
+        self.fig.tight_layout()
+        self.fig.subplots_adjust(hspace=0.3)
+
+        ancho_pixeles = self.ax1.get_position().width * self.fig.get_figwidth() * self.fig.dpi
+        pixeles_por_unidad = ancho_pixeles / (tiempo_maximo + 1.5)
+
+        colores = generar_colores(len(procesos))
+        color_por_pid = {p['pid']: colores[i] for i, p in enumerate(procesos)}
+
+        # Panel de ejecución: un tramo por barra
+        x0, x1, y, pids, etiquetas = [], [], [], [], []
         for proceso in procesos:
-            pid = proceso['pid']
-            tiempo_llegada = proceso['llegada']
-            
-            esta_ejecutando = False
             if 'ejecuciones' in proceso:
-                for inicio, duracion in proceso['ejecuciones']:
-                    if inicio <= t < inicio + duracion:
-                        esta_ejecutando = True
-                        break
+                tramos = proceso['ejecuciones']
             elif 'inicio' in proceso:
-                 if proceso['inicio'] <= t < proceso['final']:
-                     esta_ejecutando = True
-
-            ha_llegado = t >= tiempo_llegada
-            no_ha_terminado = t < proceso.get('final', tiempo_maximo + 1) 
-
-            if ha_llegado and no_ha_terminado and not esta_ejecutando:
-                 ejecutado_hasta_ahora = 0
-                 if 'ejecuciones' in proceso:
-                     for inicio, duracion in proceso['ejecuciones']:
-                         if inicio < t: 
-                            ejecutado_hasta_ahora += min(duracion, t - inicio)
-                 elif 'inicio' in proceso:
-                     if proceso['inicio'] < t:
-                        ejecutado_hasta_ahora += min(proceso['duracion'], t - proceso['inicio'])
-
-                 tiempo_restante = proceso['duracion'] - ejecutado_hasta_ahora
-                 if tiempo_restante > 0: 
-                    procesos_en_espera[t].append({'pid': pid, 'restante': tiempo_restante})
+                tramos = [(proceso['inicio'], proceso['duracion'])]
+            else:
+                tramos = []
+            nucleos_tramo = proceso['nucleos'] if multinucleo else [0] * len(tramos)
+            for (inicio, duracion), nucleo in zip(tramos, nucleos_tramo):
+                x0.append(inicio)
+                x1.append(inicio + duracion)
+                y.append(carriles - 1 - nucleo)
+                pids.append(proceso['pid'])
+                etiquetas.append(chr(65 + proceso['pid']))
+        if len(x0) > ancho_pixeles:
+            x0, x1, y, pids, etiquetas = _fusionar_barras(x0, x1, y, pids, etiquetas, 1 / pixeles_por_unidad)
+        self._ejecucion = _CapaBarras(self.ax1, x0, x1, y, pids, etiquetas, color_por_pid, 0.8, 0.8, pixeles_por_unidad)
 
-    return procesos_en_espera
+        # Cola de espera: se apila desde arriba (y negativa) para que crecer
+        # el máximo visible solo mueva el límite inferior del eje. Una barra
+        # por tramo de espera con la misma posición en la pila, no por tick
+        piezas, _ = apilar_intervalos_espera(obtener_intervalos_espera(procesos, tiempo_maximo))
+        x0 = [desde for desde, _, _, _, _ in piezas]
+        x1 = [hasta for _, hasta, _, _, _ in piezas]
+        y = [-1 - posicion for _, _, _, posicion, _ in piezas]
+        pids = [pid for _, _, pid, _, _ in piezas]
+        etiquetas = [f"{chr(65 + pid)}{restante}" for _, _, pid, _, restante in piezas]
+        # Máximo de procesos en espera visto hasta cada tick
+        max_espera = np.zeros(tiempo_maximo + 1, dtype=np.int64)
+        if piezas:
+            np.maximum.at(max_espera, x0, [posicion + 1 for _, _, _, posicion, _ in piezas])
+        if len(x0) > ancho_pixeles:
+            x0, x1, y, pids, etiquetas = _fusionar_barras(x0, x1, y, pids, etiquetas, 1 / pixeles_por_unidad)
+        self._cola = _CapaBarras(self.ax2, x0, x1, y, pids, etiquetas, color_por_pid, 0.6, 0.8, pixeles_por_unidad, fontsize=10)
+        self._max_espera = np.maximum.accumulate(max_espera).tolist()
+
+        self._cursores = []
+        for ax in [self.ax1, self.ax2]:
+            linea = ax.axvline(x=0, color='red', linestyle='--', alpha=0.7, linewidth=2)
+            texto = ax.text(0, 0, '', color='red', ha='left', va='top', fontweight='bold')
+            self._cursores.append((ax, linea, texto))
+
+        self.dibujar(0)
+
+    def dibujar(self, tiempo_actual):
+        """Lleva el diagrama a tiempo_actual y devuelve la figura"""
+        self._ejecucion.recortar(tiempo_actual)
+        # Las celdas de la cola ocupan el tick completo [t, t+1)
+        self._cola.recortar(min(tiempo_actual, self.tiempo_maximo) + 1)
+
+        max_procesos_espera = max(1, self._max_espera[min(tiempo_actual, self.tiempo_maximo)])
+        self.ax2.set_ylim(-0.5 - max_procesos_espera, 0.3)
+
+        for ax, linea, texto in self._cursores:
+            linea.set_xdata([tiempo_actual, tiempo_actual])
+            texto.set_position((tiempo_actual, ax.get_ylim()[1]))
+            texto.set_text(f' T={tiempo_actual}')
+        return self.fig
+
+    def aplicar_tema(self, tema):
+        """Pinta el fondo, los bordes y los textos con los colores del tema"""
+        colores = TEMAS_GANTT[tema]
+        self.fig.patch.set_facecolor(colores['figura'])
+        for ax in [self.ax1, self.ax2]:
+            ax.set_facecolor(colores['ejes'])
+            for spine in ax.spines.values():
+                spine.set_edgecolor(colores['bordes'])
+            ax.tick_params(colors=colores['texto'])
+            ax.xaxis.label.set_color(colores['texto'])
+            ax.title.set_color(colores['texto'])
+        self.tema = tema
+
+    def png(self, tiempo_actual, dpi=200, tema=None):
+        """
+        Fotograma en tiempo_actual como PNG, con el recorte y la resolución de st.pyplot
+
+        Con tema, el fotograma se dibuja con esos colores (y la figura los
+        conserva para los siguientes).
+        """
+        buffer = io.BytesIO()
+        with self.candado:
+            if tema is not None and tema != self.tema:
+                self.aplicar_tema(tema)
+            self.dibujar(tiempo_actual)
+            self.fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+        return buffer.getvalue()
+
+def _huella_gantt(procesos, algoritmo, tiempo_maximo, nucleos):
+    plan = [
+        (p['pid'], p['llegada'], p['duracion'], p.get('inicio'), p.get('final'), p.get('ejecuciones'), p.get('nucleos'))
+        for p in procesos
+    ]
+    contenido = json.dumps([algoritmo, tiempo_maximo, nucleos, plan], default=str)
+    return hashlib.sha256(contenido.encode()).hexdigest()
 
 def crear_grafico_gantt(procesos, tiempo_actual, algoritmo):
     """Crea un diagrama de Gantt para visualizar la ejecución y cola de espera (MODIFICADO)"""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-    fig.patch.set_facecolor('#1e1f2f') 
-    
-    for ax in [ax1, ax2]:
-        ax.set_facecolor('#292b3e')
-        for spine in ax.spines.values():
-            spine.set_edgecolor('#495057')
-        ax.tick_params(colors='white')
-        ax.grid(True, alpha=0.3) 
-        
-    ax1.set_title(f"Ejecución - Algoritmo {algoritmo}", color='white', pad=20)
-    ax1.set_xlabel("Tiempo", color='white')
-    ax1.set_ylabel("") 
-    
-    ax2.set_title("Cola de Procesos en Espera", color='white', pad=20)
-    ax2.set_xlabel("Tiempo", color='white')
-    ax2.set_ylabel("") 
-
     tiempo_maximo = max([p.get('final', 0) for p in procesos] + [tiempo_actual]) if procesos else tiempo_actual
-    
-    colores = generar_colores(len(procesos))
-    
-    for i, proceso in enumerate(procesos):
-        color = colores[i]; letra = chr(65 + proceso['pid'])
-        if 'ejecuciones' in proceso:
-            for inicio, duracion in proceso['ejecuciones']:
-                if inicio <= tiempo_actual:
-                    duracion_dibujo = min(duracion, tiempo_actual - inicio)
-                    if duracion_dibujo > 0: 
-                        ax1.broken_barh([(inicio, duracion_dibujo)], (0, 0.8), facecolors=color, alpha=0.8)
-                        ax1.text(inicio + duracion_dibujo/2, 0.4, letra, ha='center', va='center', color='white', fontweight='bold')
-        elif 'inicio' in proceso and proceso['inicio'] <= tiempo_actual:
-            duracion_dibujo = min(proceso['duracion'], tiempo_actual - proceso['inicio'])
-            if duracion_dibujo > 0:
-                ax1.broken_barh([(proceso['inicio'], duracion_dibujo)], (0, 0.8), facecolors=color, alpha=0.8)
-                ax1.text(proceso['inicio'] + duracion_dibujo/2, 0.4, letra, ha='center', va='center', color='white', fontweight='bold')
-                
-    ax1.set_xlim(-0.5, tiempo_maximo + 1) 
-    ax1.set_ylim(-0.5, 1.3)
-    ax1.set_yticks([])
-    ax1.set_yticklabels([])
-    ax1.set_xticks(range(0, tiempo_maximo + 2, 1))
-    
-    procesos_en_espera = obtener_procesos_en_espera_por_tiempo(procesos, tiempo_maximo)
-    
-    max_procesos_espera = 0
-    for t in range(tiempo_actual + 1):
-        max_procesos_espera = max(max_procesos_espera, len(procesos_en_espera.get(t, [])))
-    max_procesos_espera = max(1, max_procesos_espera)
-
-    for t in range(tiempo_maximo + 1):
-        if t <= tiempo_actual: 
-            procesos_esperando_info = procesos_en_espera.get(t, [])
-            
-            procesos_esperando_info.sort(key=lambda item: item['pid'])
-            
-            for posicion, info_proceso in enumerate(procesos_esperando_info):
-                pid = info_proceso['pid']
-                restante = info_proceso['restante']
-                
-                proceso_idx = next(i for i, p in enumerate(procesos) if p['pid'] == pid)
-                color = colores[proceso_idx]
-                letra = chr(65 + pid)
-                
-                y_pos = max_procesos_espera - 1 - posicion 
-                
-                ax2.broken_barh([(t, 1)], (y_pos, 0.8), facecolors=color, alpha=0.6)
-                
-                texto_barra = f"{letra}{restante}"
-                ax2.text(t + 0.5, y_pos + 0.4, texto_barra, ha='center', va='center', color='white', fontweight='bold', fontsize=10)
-                
-    ax2.set_xlim(-0.5, tiempo_maximo + 1)
-    ax2.set_ylim(-0.5, max_procesos_espera - 0.5 + 0.8) 
-    
-    ax2.set_yticks([])
-    ax2.set_xticks(range(0, tiempo_maximo + 2, 1))
-    
-    for ax in [ax1, ax2]:
-        ax.axvline(x=tiempo_actual, color='red', linestyle='--', alpha=0.7, linewidth=2)
-        ax.text(tiempo_actual, ax.get_ylim()[1], f' T={tiempo_actual}', 
-               color='red', ha='left', va='top', fontweight='bold') 
-        
-    plt.tight_layout()
-    plt.subplots_adjust(hspace=0.3) 
+    return GraficoGantt(procesos, algoritmo, tiempo_maximo).dibujar(tiempo_actual)
+
+def crear_grafico_barrido(resultados):
+    """Curvas de retorno, espera y overhead por quantum, una por cambio de contexto"""
+    fig = Figure(figsize=(12, 4))
+    ejes = fig.subplots(1, 3)
+    series = (
+        ('retorno_promedio', 'Retorno promedio'),
+        ('espera_promedio', 'Espera promedio'),
+        ('overhead_porcentaje', 'Overhead de cambios (%)'),
+    )
+    cambios = sorted({r['cambio_contexto'] for r in resultados})
+    colores = generar_colores(len(cambios))
+
+    for ax, (campo, titulo) in zip(ejes, series):
+        for color, cambio in zip(colores, cambios):
+            puntos = sorted((r['quantum'], r[campo]) for r in resultados if r['cambio_contexto'] == cambio)
+            ax.plot(*zip(*puntos), marker='o', color=color, label=f'CC={cambio}')
+        ax.set_title(titulo, fontsize=11, fontweight='bold')
+        ax.set_xlabel('Quantum')
+        ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.grid(True, alpha=0.3)
+    ejes[0].legend(fontsize=8)
+
+    fig.tight_layout()
+    return fig
+
+def crear_grafico_montecarlo(resumen, nombres):
+    """Barras de retorno, espera y respuesta promedio por algoritmo con su intervalo de confianza"""
+    fig = Figure(figsize=(12, 4))
+    ejes = fig.subplots(1, 3)
+    series = (
+        ('retorno_promedio', 'Retorno promedio'),
+        ('espera_promedio', 'Espera promedio'),
+        ('respuesta_promedio', 'Respuesta promedio'),
+    )
+    etiquetas = [nombres[fila['algoritmo']] for fila in resumen]
+    colores = generar_colores(len(resumen))
+
+    for ax, (campo, titulo) in zip(ejes, series):
+        posiciones = np.arange(len(resumen))
+        ax.bar(
+            posiciones,
+            [fila[campo] for fila in resumen],
+            yerr=[fila[f'{campo}_ic'] for fila in resumen],
+            color=colores, capsize=4, alpha=0.85
+        )
+        ax.set_title(titulo, fontsize=11, fontweight='bold')
+        ax.set_xticks(posiciones)
+        ax.set_xticklabels(etiquetas, rotation=45, ha='right', fontsize=8)
+        ax.grid(True, axis='y', alpha=0.3)
+
+    fig.tight_layout()
     return fig
 
 def mostrar_metricas(procesos):
     """Muestra las métricas de desempeño"""
-    if not procesos:
+    if not len(procesos):
         return {}
     
+    if isinstance(procesos, TablaProcesos):
+        return {
+            'retorno_promedio': float(procesos.retorno.mean()),
+            'espera_promedio': float(procesos.espera.mean()),
+            'procesos_completados': len(procesos)
+        }
+    
     retorno_prom = sum(p['retorno'] for p in procesos) / len(procesos)
     espera_prom = sum(p['espera'] for p in procesos) / len(procesos)
     